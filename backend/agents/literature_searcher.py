@@ -7,6 +7,8 @@ Searches across:
 """
 
 import asyncio
+import time
+from collections import OrderedDict
 from typing import Optional
 
 import structlog
@@ -18,6 +20,11 @@ from backend.tools.google_scholar import GoogleScholarTool, GoogleScholarPaper
 
 logger = structlog.get_logger(__name__)
 
+# Recent search results, reused when the same search is repeated shortly after
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 600.0  # seconds
+_search_cache: "OrderedDict[tuple, tuple[float, LiteratureSearchResult]]" = OrderedDict()
+
 
 class UnifiedPaper(BaseModel):
     """Unified paper representation across all sources."""
@@ -198,6 +205,21 @@ class LiteratureSearcherAgent:
         if keywords:
             search_query = f"{query} {' '.join(keywords)}"
 
+        cache_key = (
+            " ".join(search_query.lower().split()),
+            tuple(self.sources),
+            year_start,
+            year_end,
+            limit_per_source,
+            min_citations,
+            tuple(categories or ()),
+        )
+        cached = _search_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(cache_key)
+            logger.info("Reusing cached literature search", query=search_query)
+            return cached[1].model_copy(deep=True)
+
         logger.info(
             "Starting literature search",
             query=search_query,
@@ -207,6 +229,7 @@ class LiteratureSearcherAgent:
 
         all_papers = []
         sources_searched = []
+        sources_with_papers = 0
         total_found = 0
 
         # Run searches in parallel
@@ -250,6 +273,8 @@ class LiteratureSearcherAgent:
                 continue
 
             sources_searched.append(source_name)
+            if result.papers:
+                sources_with_papers += 1
 
             if source_name == "semantic_scholar":
                 total_found += result.total
@@ -282,13 +307,24 @@ class LiteratureSearcherAgent:
             sources=sources_searched,
         )
 
-        return LiteratureSearchResult(
+        search_result = LiteratureSearchResult(
             papers=unique_papers,
             total_found=total_found,
             sources_searched=sources_searched,
             query=search_query,
         )
 
+        # Only cache when every source returned papers. The source tools report
+        # HTTP errors and rate limiting as empty results, so an empty source
+        # may have failed and is retried next time
+        if sources_with_papers == len(tasks):
+            _search_cache[cache_key] = (time.monotonic(), search_result.model_copy(deep=True))
+            _search_cache.move_to_end(cache_key)
+            if len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+
+        return search_result
+
     async def get_paper_details(
         self,
         paper_id: str,
@@ -15,6 +15,8 @@ Architecture follows ResearchDiscussionAgent pattern:
 """
 
 import structlog
+from collections import deque
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
@@ -25,6 +27,19 @@ from backend.utils.prompt_loader import load_pw_system_prompt, load_pw_initial_a
 
 logger = structlog.get_logger(__name__)
 
+# Dialogue messages kept for the prompt (5 user/assistant exchanges)
+HISTORY_MAXLEN = 10
+
+_ROLE_CLS = {"user": HumanMessage, "assistant": AIMessage}
+
+
+@dataclass(slots=True, frozen=True)
+class Turn:
+    """One conversation history entry."""
+
+    role: str
+    content: str
+
 
 # =============================================================================
 # Constants - prompts are now loaded from data/prompts/PW/
@@ -75,7 +90,7 @@ class PaperWritingAgent:
         """
         self.model = model
         self.llm: Optional[GeminiLLM] = None
-        self.conversation_history: list[dict] = []
+        self.conversation_history: deque[Turn] = deque(maxlen=HISTORY_MAXLEN)
 
         # Load initial artifact from file
         initial_artifact = load_pw_initial_artifact()
@@ -113,12 +128,11 @@ class PaperWritingAgent:
 
         messages = [SystemMessage(content=system_prompt)]
 
-        # Add conversation history (last 10 exchanges)
-        for msg in self.conversation_history[-10:]:
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            else:
-                messages.append(AIMessage(content=msg["content"]))
+        # Add conversation history (bounded by the deque's maxlen)
+        messages.extend(
+            _ROLE_CLS[turn.role](content=turn.content)
+            for turn in self.conversation_history
+        )
 
         # Add current message
         messages.append(HumanMessage(content=user_message))
@@ -189,8 +203,10 @@ class PaperWritingAgent:
         self.artifact = new_artifact
 
         # Update history (without artifact block for cleaner display)
-        self.conversation_history.append({"role": "user", "content": user_message})
-        self.conversation_history.append({"role": "assistant", "content": clean_response})
+        self.conversation_history.extend((
+            Turn("user", user_message),
+            Turn("assistant", clean_response),
+        ))
 
         logger.info("Paper writing chat completed",
                    history_length=len(self.conversation_history),
@@ -199,8 +215,8 @@ class PaperWritingAgent:
         return clean_response
 
     def get_conversation_history(self) -> list[dict]:
-        """Get the full conversation history."""
-        return self.conversation_history.copy()
+        """Get the retained conversation history as role/content dicts."""
+        return [asdict(turn) for turn in self.conversation_history]
 
     def reset(self, reset_messages: bool = True, reset_artifact: bool = True) -> None:
         """Reset the agent.
@@ -210,7 +226,7 @@ class PaperWritingAgent:
             reset_artifact: Whether to reset the artifact.
         """
         if reset_messages:
-            self.conversation_history = []
+            self.conversation_history.clear()
         if reset_artifact:
             self.artifact = INITIAL_ARTIFACT
         logger.info("Paper writing agent reset",
@@ -15,6 +15,21 @@ logger = structlog.get_logger(__name__)
 # Fast model for quick summarization (Gemini 2.0 Flash)
 FAST_SUMMARY_MODEL = "gemini-2.0-flash"
 
+# Static layout for PDFSummaryAgent.format_as_markdown; dynamic blocks are
+# pre-joined and slotted in with a single format_map call.
+_SUMMARY_MD_TEMPLATE = (
+    "# {title}\n\n"
+    "## Metadata\n{metadata_block}\n"
+    "## Summary\n{abstract_summary}\n\n"
+    "## Problem Statement\n{problem_statement}\n\n"
+    "## Key Contributions\n{contrib_block}"
+    "## Methodology\n**Approach**: {approach}\n{methodology_block}\n"
+    "## Main Results\n{result_block}\n"
+    "## Limitations\n{limitation_block}\n"
+    "## Relevance to Our Research\n{relevance}\n\n"
+    "## Quality Assessment\n{quality}\n{citation_block}"
+)
+
 
 class KeyContribution(BaseModel):
     """A key contribution from the paper."""
@@ -191,80 +206,52 @@ Consider:
         Returns:
             Formatted markdown string.
         """
-        lines = []
-
-        # Header
-        lines.append(f"# {output.title}")
-        lines.append("")
-
-        # Metadata
-        lines.append("## Metadata")
+        metadata_lines = []
         if output.authors:
-            lines.append(f"- **Authors**: {', '.join(output.authors)}")
+            metadata_lines.append(f"- **Authors**: {', '.join(output.authors)}\n")
         if output.year:
-            lines.append(f"- **Year**: {output.year}")
+            metadata_lines.append(f"- **Year**: {output.year}\n")
         if output.venue:
-            lines.append(f"- **Venue**: {output.venue}")
-        lines.append("")
-
-        # Abstract
-        lines.append("## Summary")
-        lines.append(output.abstract_summary)
-        lines.append("")
-
-        # Problem
-        lines.append("## Problem Statement")
-        lines.append(output.problem_statement)
-        lines.append("")
-
-        # Contributions
-        lines.append("## Key Contributions")
-        for contrib in output.key_contributions:
-            lines.append(f"### {contrib.type.title()}")
-            lines.append(f"**Contribution**: {contrib.contribution}")
-            lines.append(f"**Significance**: {contrib.significance}")
-            lines.append("")
-
-        # Methodology
-        lines.append("## Methodology")
-        lines.append(f"**Approach**: {output.methodology.approach}")
-        if output.methodology.techniques:
-            lines.append(f"**Techniques**: {', '.join(output.methodology.techniques)}")
-        if output.methodology.datasets:
-            lines.append(f"**Datasets**: {', '.join(output.methodology.datasets)}")
-        if output.methodology.evaluation_metrics:
-            lines.append(f"**Metrics**: {', '.join(output.methodology.evaluation_metrics)}")
-        lines.append("")
-
-        # Results
-        lines.append("## Main Results")
-        for result in output.main_results:
-            lines.append(f"- {result}")
-        lines.append("")
-
-        # Limitations
-        lines.append("## Limitations")
-        for limitation in output.limitations:
-            lines.append(f"- {limitation}")
-        lines.append("")
-
-        # Relevance
-        lines.append("## Relevance to Our Research")
-        lines.append(output.relevance_to_research)
-        lines.append("")
-
-        # Quality
-        lines.append("## Quality Assessment")
-        lines.append(output.quality_assessment)
-        lines.append("")
-
-        # Key citations
+            metadata_lines.append(f"- **Venue**: {output.venue}\n")
+
+        methodology = output.methodology
+        methodology_lines = []
+        if methodology.techniques:
+            methodology_lines.append(f"**Techniques**: {', '.join(methodology.techniques)}\n")
+        if methodology.datasets:
+            methodology_lines.append(f"**Datasets**: {', '.join(methodology.datasets)}\n")
+        if methodology.evaluation_metrics:
+            methodology_lines.append(
+                f"**Metrics**: {', '.join(methodology.evaluation_metrics)}\n"
+            )
+
+        citation_block = ""
         if output.key_citations:
-            lines.append("## Key Citations to Follow Up")
-            for citation in output.key_citations:
-                lines.append(f"- {citation}")
+            citation_block = "\n## Key Citations to Follow Up\n" + "\n".join(
+                f"- {citation}" for citation in output.key_citations
+            )
 
-        return "\n".join(lines)
+        return _SUMMARY_MD_TEMPLATE.format_map({
+            "title": output.title,
+            "metadata_block": "".join(metadata_lines),
+            "abstract_summary": output.abstract_summary,
+            "problem_statement": output.problem_statement,
+            "contrib_block": "".join([
+                f"### {contrib.type.title()}\n"
+                f"**Contribution**: {contrib.contribution}\n"
+                f"**Significance**: {contrib.significance}\n\n"
+                for contrib in output.key_contributions
+            ]),
+            "approach": methodology.approach,
+            "methodology_block": "".join(methodology_lines),
+            "result_block": "".join([f"- {result}\n" for result in output.main_results]),
+            "limitation_block": "".join([
+                f"- {limitation}\n" for limitation in output.limitations
+            ]),
+            "relevance": output.relevance_to_research,
+            "quality": output.quality_assessment,
+            "citation_block": citation_block,
+        })
 
 
 class PDFSummaryProcessor:
@@ -333,15 +320,15 @@ Please analyze this paper and provide a detailed JSON response with the followin
         """
         logger.info("Processing PDF", path=str(pdf_path))
 
-        # Parse PDF
-        parsed = self.pdf_processor.parse_pdf(pdf_path)
+        # Parse PDF (CPU-bound PyMuPDF work, run in a worker process)
+        parsed = await self.pdf_processor.parse_pdf_async(pdf_path)
 
-        if "Error" in parsed.full_text:
+        if parsed.error is not None:
             logger.error("Failed to parse PDF", path=str(pdf_path))
             return PDFSummaryOutput(
                 title=pdf_path.name,
                 authors=[],
-                abstract_summary=f"Failed to parse PDF: {parsed.full_text}",
+                abstract_summary=f"Failed to parse PDF: {parsed.error}",
                 problem_statement="N/A",
                 key_contributions=[],
                 methodology=MethodologySummary(
@@ -439,13 +426,17 @@ Please analyze this paper and provide a detailed JSON response with the followin
         Returns:
             Structured summary.
         """
-        # Prepare content
-        content = f"Title: {parsed.title}\n\n"
-        content += f"Authors: {', '.join(parsed.authors)}\n\n"
-        content += f"Abstract: {parsed.abstract}\n\n"
-
-        for section in parsed.sections[:6]:
-            content += f"\n## {section.title}\n{section.content[:2500]}\n"
+        # Prepare content (sections joined in one pass instead of repeated +=)
+        sections_md = "".join([
+            f"\n## {section.title}\n{section.content[:2500]}\n"
+            for section in parsed.sections[:6]
+        ])
+        content = "".join([
+            f"Title: {parsed.title}\n\n",
+            f"Authors: {', '.join(parsed.authors)}\n\n",
+            f"Abstract: {parsed.abstract}\n\n",
+            sections_md,
+        ])
 
         if len(content) > 20000:
             content = content[:20000] + "\n\n[Content truncated...]"
@@ -562,7 +553,7 @@ class FastPDFSummarizer:
 
     This class provides a simpler, faster approach to PDF summarization:
     1. Extract full text from PDF using PyMuPDF
-    2. Clean and normalize the text
+    2. Clean and normalize the text page by page during extraction
     3. Send to Gemini 2.0 Flash for quick summarization
 
     The output is a structured markdown summary without complex JSON parsing.
@@ -642,31 +633,15 @@ DOI가 있다면 추출합니다. 없으면 "N/A"로 표기합니다. (예: 10.1
         self.pdf_processor = PDFProcessor()
         logger.info("FastPDFSummarizer initialized", model=FAST_SUMMARY_MODEL)
 
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize extracted PDF text.
+    def _truncate_text(self, text: str) -> str:
+        """Trim pre-cleaned PDF text to a reasonable length for the LLM.
 
         Args:
-            text: Raw text from PDF.
+            text: Text already normalized by `PDFProcessor.parse_pdf(clean=True)`.
 
         Returns:
-            Cleaned text.
+            Trimmed text.
         """
-        import re
-
-        # Remove excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' {2,}', ' ', text)
-
-        # Remove page numbers and headers/footers (common patterns)
-        text = re.sub(r'\n\d+\n', '\n', text)  # Standalone page numbers
-        text = re.sub(r'Page \d+ of \d+', '', text)
-
-        # Remove URLs that got broken across lines
-        text = re.sub(r'hps?://', 'https://', text)  # Fix broken https
-
-        # Clean up common PDF artifacts
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)  # Control characters
-
         # Trim to reasonable length for LLM (about 30k chars max)
         if len(text) > 30000:
             # Try to keep abstract and key sections
@@ -719,6 +694,7 @@ DOI가 있다면 추출합니다. 없으면 "N/A"로 표기합니다. (예: 10.1
         pdf_path: Path,
         research_topic: str = "",
         research_definition: str = "",
+        filename: Optional[str] = None,
     ) -> tuple[str, dict]:
         """Summarize a PDF file quickly.
 
@@ -726,25 +702,29 @@ DOI가 있다면 추출합니다. 없으면 "N/A"로 표기합니다. (예: 10.1
             pdf_path: Path to PDF file.
             research_topic: Research topic for context.
             research_definition: Full Research Definition content for relevance analysis.
+            filename: Original file name, used for fallback titles when the
+                file is stored under another name (e.g. an upload saved by
+                paper ID). Defaults to the name of `pdf_path`.
 
         Returns:
             Tuple of (markdown_summary, metadata_dict).
         """
-        logger.info("Fast summarizing PDF", path=str(pdf_path))
+        filename = filename or pdf_path.name
+        logger.info("Fast summarizing PDF", filename=filename)
 
-        # Parse PDF to extract text
-        parsed = self.pdf_processor.parse_pdf(pdf_path)
+        # Parse PDF to extract text (cleaned page by page during extraction),
+        # in a worker process so other requests and downloads keep running
+        parsed = await self.pdf_processor.parse_pdf_async(pdf_path, clean=True)
 
-        if "Error" in parsed.full_text:
-            error_msg = f"# PDF 처리 실패\n\n오류: {parsed.full_text}"
-            return error_msg, {"title": pdf_path.name, "authors": [], "summary": "PDF 파싱 실패"}
+        if parsed.error is not None:
+            error_msg = f"# PDF 처리 실패\n\n오류: {parsed.error}"
+            return error_msg, {"title": filename, "authors": [], "summary": "PDF 파싱 실패"}
 
-        # Clean the extracted text
-        clean_text = self._clean_text(parsed.full_text)
+        clean_text = self._truncate_text(parsed.full_text)
 
         if not clean_text or len(clean_text) < 100:
             error_msg = "# PDF 처리 실패\n\n텍스트를 추출할 수 없습니다."
-            return error_msg, {"title": pdf_path.name, "authors": [], "summary": "텍스트 추출 실패"}
+            return error_msg, {"title": filename, "authors": [], "summary": "텍스트 추출 실패"}
 
         # Use RD content if available for better relevance analysis
         if research_definition and len(research_definition.strip()) > 100:
@@ -767,7 +747,7 @@ DOI가 있다면 추출합니다. 없으면 "N/A"로 표기합니다. (예: 10.1
 
             # Use parsed PDF metadata as fallback
             if not metadata["title"]:
-                metadata["title"] = parsed.title or pdf_path.stem
+                metadata["title"] = parsed.title or Path(filename).stem
             if not metadata["authors"] and parsed.authors:
                 metadata["authors"] = parsed.authors
 
@@ -797,7 +777,7 @@ DOI가 있다면 추출합니다. 없으면 "N/A"로 표기합니다. (예: 10.1
         except Exception as e:
             logger.error("Fast summarization failed", error=str(e))
             error_md = f"# 요약 생성 실패\n\n오류: {str(e)}\n\n## 추출된 텍스트 (처음 2000자)\n\n{clean_text[:2000]}..."
-            return error_md, {"title": pdf_path.name, "authors": parsed.authors, "summary": f"오류: {str(e)}"}
+            return error_md, {"title": filename, "authors": parsed.authors, "summary": f"오류: {str(e)}"}
 
     async def summarize_text(
         self,
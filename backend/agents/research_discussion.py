@@ -12,12 +12,38 @@ Prompts are loaded from external markdown files in data/prompts/RD/
 for easy modification without code changes.
 """
 
-from typing import Any, Optional
-
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+import asyncio
+import logging
+import re
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from hashlib import blake2b
+from itertools import chain, islice
+from string import Template
+from typing import AsyncIterator, Optional
+
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+from langchain_core.runnables import Runnable
+import orjson
 from pydantic import BaseModel, Field
 import structlog
 
+from backend.agents._rd_prompts import (
+    critical_evaluation_prompt,
+    default_experiment_artifact,
+    default_experiment_design_system_prompt,
+    default_initial_artifact,
+    default_summary_prompt,
+    history_summary_prompt,
+    default_system_prompt,
+)
 from backend.llm.gemini import GeminiLLM
 from backend.utils.prompt_loader import (
     load_rd_system_prompt,
@@ -30,721 +56,313 @@ from backend.utils.prompt_loader import (
 )
 
 logger = structlog.get_logger(__name__)
+# structlog routes through this stdlib logger; used to skip building
+# debug event dicts when DEBUG is off
+_stdlib_logger = logging.getLogger(__name__)
+
+# Prompt template placeholders
+_DYNAMIC_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{(?:topic|artifact)\}(?!\})")
+# The one placeholder that changes from turn to turn
+_ARTIFACT_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{artifact\}(?!\})")
+
+_ARTIFACT_OPEN = "<artifact>"
+_ARTIFACT_RE = re.compile(r"<artifact>(.*?)</artifact>", re.DOTALL)
+_LOGIC_SCORE_RE = re.compile(r"Logic Score[:\s]*(\d+)[/\s]*10", re.IGNORECASE)
+_NOVELTY_SCORE_RE = re.compile(r"Novelty Score[:\s]*(\d+)[/\s]*10", re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+# "## 3. Research Questions [🟡]" -> number "3", title "Research Questions"
+_SECTION_HEADING_RE = re.compile(r"^##\s+(?:(\d+)\.\s*)?(.*?)\s*(?:\[[^\]]*\])?\s*$")
+_MATURITY_MARK_RE = re.compile(r"\[(?:🔴|🟡|🟢)\]")
+
+# Special discussion commands, in priority order (checked on the lowered message)
+_COMMANDS = (
+    ("critical", ("결실", "비판적 평가", "critical review", "critical evaluation", "fruition")),
+    ("transition", ("다음 단계로", "proceed", "진행해줘", "phase 2", "next phase")),
+    ("summary", ("요약해줘", "summarize", "summary", "정리해줘")),
+)
+_COMMAND_RE = re.compile("|".join(
+    f"(?P<{kind}>{'|'.join(map(re.escape, tokens))})" for kind, tokens in _COMMANDS
+))
 
+# Prompt for extracting the structured research definition
+_EXTRACTION_PROMPT = """Based on our entire discussion, extract the research definition in the following JSON format:
 
-class NoveltyAssessment(BaseModel):
-    """Assessment of research novelty."""
+{
+    "refined_topic": "...",
+    "research_questions": ["RQ1: ...", "RQ2: ..."],
+    "novelty_assessment": {
+        "score": 0.0-1.0,
+        "justification": "...",
+        "existing_approaches": ["..."],
+        "differentiators": ["..."]
+    },
+    "research_scope": {
+        "includes": ["..."],
+        "excludes": ["..."]
+    },
+    "potential_contributions": ["..."],
+    "suggested_keywords": ["..."]
+}
 
-    score: float = Field(ge=0.0, le=1.0, description="Novelty score from 0 to 1")
-    justification: str = Field(description="Explanation of the novelty assessment")
-    existing_approaches: list[str] = Field(
-        default_factory=list,
-        description="Known existing approaches in this area",
-    )
-    differentiators: list[str] = Field(
-        default_factory=list,
-        description="What makes this research different",
-    )
+Provide ONLY the JSON, no additional text."""
 
+# Readiness assessment used when readiness_prompt.md is missing
+_FALLBACK_READINESS_PROMPT = """## Phase Transition Evaluation
 
-class ResearchDefinition(BaseModel):
-    """Final output when research definition is complete."""
+Based on the current state of the research definition, conduct a rigorous readiness assessment.
 
-    refined_topic: str = Field(description="Refined and clarified research topic")
-    research_questions: list[str] = Field(
-        description="List of specific research questions (RQs)"
-    )
-    novelty_assessment: NoveltyAssessment = Field(
-        description="Assessment of research novelty"
-    )
-    research_scope: dict = Field(
-        description="Defined scope including inclusions and exclusions"
-    )
-    potential_contributions: list[str] = Field(
-        description="Expected contributions of the research"
-    )
-    suggested_keywords: list[str] = Field(
-        description="Keywords for literature search"
-    )
+### Readiness Checklist (Mark each as ✅ Ready / ⚠️ Needs Work / ❌ Missing):
+
+1. **Research Gap**: Is there a clearly articulated gap with evidence?
+2. **Main Research Question**: Is it SMART (Specific, Measurable, Achievable, Relevant, Time-bound)?
+3. **Theoretical Framework**: Is there an identified guiding theory or framework?
+4. **Expected Contributions**: Are contributions clearly distinguishable (theoretical/methodological/empirical/practical)?
+5. **Research Scope**: Are boundaries clearly defined (what's in/out)?
+6. **Key Assumptions**: Are assumptions explicitly stated?
+7. **Feasibility**: Has feasibility been assessed (data, methods, resources)?
 
+### Decision Matrix:
+- **🟢 READY**: All items are ✅ or at most 1-2 are ⚠️
+- **🟡 ALMOST READY**: 1-2 items are ❌ but can proceed with caveats
+- **🔴 NOT READY**: 3+ items are ❌ or critical items (Gap, RQ, Framework) are ❌
 
-class ResearchDiscussionAgent:
-    """Conversational agent for research topic discussion and refinement.
+### Your Assessment:
 
-    Unlike other agents, this operates in a free-form conversational mode,
-    maintaining dialogue history and providing critical feedback on research ideas.
+1. Provide the completed checklist
+2. State the overall readiness level (🟢/🟡/🔴)
+3. If 🟢 or 🟡: Confirm readiness and summarize key points for Literature Review
+4. If 🔴: Specify what must be resolved and suggest next discussion topics
 
-    Supports two phases:
-    - research_definition: Refine research topic, gap, RQs
-    - experiment_design: Design experiments, hypotheses, methodology
+Be honest in your assessment. It's better to refine now than struggle later."""
+
+# Cheap model used to fold turns that slide out of the history window
+HISTORY_SUMMARY_MODEL = "gemini-2.0-flash"
+# Size cap of the plain-text summary kept when the summary model fails
+HISTORY_SUMMARY_MAX_CHARS = 4000
+
+
+def split_system_prompt(template: str) -> tuple[str, str]:
+    """Split a system prompt template into a session prefix and a context tail.
+
+    Blank-line separated blocks that reference {artifact} (together with a
+    heading line that directly introduces them) are moved, in order, to the
+    context tail. Everything else, including {topic}, stays in the prefix,
+    which is byte-identical across the turns of a session so Gemini can
+    reuse its cached prefill.
+
+    Args:
+        template: System prompt template with {topic}/{artifact} placeholders.
+
+    Returns:
+        Tuple of (prefix template, context template); both keep placeholders.
     """
+    static_blocks: list[str] = []
+    context_blocks: list[str] = []
+
+    for block in template.split("\n\n"):
+        if _ARTIFACT_PLACEHOLDER_RE.search(block):
+            previous = static_blocks[-1].strip() if static_blocks else ""
+            if previous.startswith("#") and "\n" not in previous:
+                context_blocks.append(static_blocks.pop())
+            context_blocks.append(block)
+        else:
+            static_blocks.append(block)
 
-    # Current phase tracking
-    PHASE_RESEARCH_DEFINITION = "research_definition"
-    PHASE_EXPERIMENT_DESIGN = "experiment_design"
+    return "\n\n".join(static_blocks).strip(), "\n\n".join(context_blocks).strip()
 
-    SYSTEM_PROMPT = """You are a distinguished research advisor with 30+ years of experience in guiding doctoral students, reviewing grant proposals, and publishing in top-tier journals.
-
-## Your Expertise Profile
-- Published 200+ peer-reviewed papers
-- Supervised 50+ doctoral dissertations to completion
-- Served on editorial boards of leading journals
-- Expertise in research methodology across paradigms (qualitative, quantitative, mixed-methods)
-- Grant review experience for major funding agencies
-
-## Before Every Response: Critical Thinking Protocol
-
-Before responding, mentally analyze:
-1. **What is the user actually asking?** (Surface vs. underlying need)
-2. **What assumptions underlie their statement?** (Often unstated)
-3. **What critical information is missing?** (Gaps to probe)
-4. **What is the maturity level of this idea?** (Nascent → Developed → Refined)
-
-## Your Core Principles
-
-### 1. Gap-Driven Research Definition
-- **Research Gap ≠ New Topic**: A gap is a specific void in existing knowledge
-- Distinguish gap types:
-  - **Theoretical Gap**: Missing explanation or framework
-  - **Methodological Gap**: Inadequate methods for the phenomenon
-  - **Empirical Gap**: Lack of evidence in specific contexts
-  - **Practical Gap**: Theory-practice disconnect
-- Always ask: "What specific gap does this fill?"
-
-### 2. Research Question Excellence
-- Good RQs are SMART: Specific, Measurable, Achievable, Relevant, Time-bound
-- Distinguish question types:
-  - **Descriptive**: "What is...?" (lower contribution)
-  - **Relational**: "How does X relate to Y?"
-  - **Causal/Explanatory**: "Why does...?" / "What causes...?" (higher contribution)
-- Require hierarchy: Main RQ → Sub-RQs (2-4)
-- Example of weak RQ: "How can AI improve healthcare?"
-- Example of strong RQ: "How does machine learning-based diagnostic assistance affect diagnostic accuracy and physician decision confidence in radiology departments of tertiary hospitals?"
-
-### 3. Theoretical Foundation (CRITICAL - Often Missing)
-- Every rigorous research needs theoretical grounding
-- Ask: "What theory or framework guides this research?"
-- If none exists, help identify potential frameworks
-- Theory determines: variables, relationships, boundaries, interpretations
-
-### 4. Contribution Clarity
-Distinguish contribution types:
-- **Theoretical**: New theory, framework extension, conceptual model
-- **Methodological**: New method, improved measurement, novel design
-- **Empirical**: New findings, replication in new context, longitudinal evidence
-- **Practical/Policy**: Actionable insights, implementation guidelines
-Always ask: "So what? Why should the academic community care?"
-
-### 5. Assumption Identification
-- Every research has assumptions - make them explicit
-- Types: Ontological (nature of reality), Epistemological (nature of knowledge), Methodological, Contextual
-- Challenge hidden assumptions
-
-### 6. Feasibility Assessment
-- Data availability and access
-- Methodological competence required
-- Time and resource constraints
-- Ethical considerations
-- Publication viability
-
-## Questioning Techniques
-
-Use **Socratic questioning**:
-- "What do you mean by...?" (Clarification)
-- "How do you know that...?" (Evidence)
-- "What if...?" (Alternative perspectives)
-- "What are the implications of...?" (Consequences)
-- "Why is this important?" (Significance)
-
-## Self-Critique Before Finalizing
-
-Before each response, ask yourself:
-- "Did I address the actual research quality, not just surface issues?"
-- "Am I being constructively critical or just critical?"
-- "Have I missed any obvious gaps or assumptions?"
-- "Is my feedback actionable?"
-
-## Important Commands
-
-When the user says:
-- "결실" / "비판적 평가" / "critical review" → Conduct comprehensive critical evaluation (결실 단계)
-  - Provides: Summary, Strengths, Weaknesses, Detailed Comments, Questions, Overall Assessment
-  - Logic Score and Novelty Score out of 10
-  - Repeat until Logic ≥8 AND Novelty ≥7
-- "다음 단계로" / "proceed" / "진행해줘" → Evaluate readiness using the Readiness Checklist
-- "요약해줘" / "summarize" → Provide structured summary with maturity assessment
-
-## Response Style
-
-- Rigorous but supportive
-- Academic but accessible
-- Respond in user's language (Korean/English)
-- Concise but thorough
-- Always constructive
-
-Current context:
-- Research Topic: {topic}
-- Phase: Research Definition
-
-## CRITICAL: Research Artifact Update
-
-After EVERY response, update the Research Artifact with the format below.
-Each section includes a maturity indicator: 🔴 (needs work) → 🟡 (developing) → 🟢 (solid)
-
-Current Artifact:
-```markdown
-{artifact}
-```
-
-You MUST include an updated artifact at the END of EVERY response:
-
-<artifact>
-# Research Definition
-
-## 1. Research Topic [🔴/🟡/🟢]
-[Clear, focused topic statement with problem context]
-
-## 2. Research Gap [🔴/🟡/🟢]
-- **Gap Type**: [Theoretical/Methodological/Empirical/Practical]
-- **Gap Statement**: [Specific void in existing knowledge]
-- **Evidence of Gap**: [How do we know this gap exists?]
-
-## 3. Research Questions [🔴/🟡/🟢]
-- **Main RQ**: [Primary research question - specific and answerable]
-- **Sub-RQ1**: [Supporting question]
-- **Sub-RQ2**: [Supporting question]
-- **Question Type**: [Descriptive/Relational/Causal]
-
-## 4. Theoretical Framework [🔴/🟡/🟢]
-- **Guiding Theory/Framework**: [Name and brief description]
-- **How it Guides**: [How theory shapes variables, relationships, interpretation]
-
-## 5. Core Argument & Logic [🔴/🟡/🟢]
-[Logical flow: Problem → Gap → Questions → Expected Contribution]
-
-## 6. Expected Contributions [🔴/🟡/🟢]
-- **Theoretical**: [Theory contribution if any]
-- **Methodological**: [Method contribution if any]
-- **Empirical**: [Empirical contribution]
-- **Practical**: [Real-world implications]
-
-## 7. Novelty Assessment [🔴/🟡/🟢]
-- **Score**: [0-10]/10
-- **Justification**: [Why this score - specific reasoning]
-- **Existing Approaches**: [What exists and how is this different]
-- **Unique Differentiators**: [Specific novel elements]
-
-## 8. Research Scope [🔴/🟡/🟢]
-- **Boundaries**: [Geographic, temporal, population, conceptual]
-- **Includes**: [In scope]
-- **Excludes**: [Out of scope and why]
-
-## 9. Key Assumptions [🔴/🟡/🟢]
-- [Explicit assumptions underlying this research]
-
-## 10. Feasibility & Challenges [🔴/🟡/🟢]
-- **Data**: [Availability and access]
-- **Methods**: [Required expertise]
-- **Resources**: [Time, funding, tools]
-- **Challenges**: [Key obstacles]
-
-## 11. Keywords & Literature Domains [🔴/🟡/🟢]
-- **Primary Keywords**: [Core search terms]
-- **Secondary Keywords**: [Related terms]
-- **Key Literature Domains**: [Fields to review]
-
-## 12. Readiness Assessment
-**Overall Maturity**: [🔴 Early Stage / 🟡 Developing / 🟢 Ready for Literature Review]
-**Blockers**: [What must be resolved before proceeding]
-**Next Discussion Focus**: [Priority topic for next round]
-</artifact>
-
-IMPORTANT: Always include the <artifact>...</artifact> block. The artifact should reflect the CURRENT state based on ALL discussions.
-"""
 
-    INITIAL_ARTIFACT = """# Research Definition
-
-## 1. Research Topic [🔴]
-[To be defined through discussion]
-
-## 2. Research Gap [🔴]
-- **Gap Type**: To be identified
-- **Gap Statement**: To be articulated
-- **Evidence of Gap**: To be established
-
-## 3. Research Questions [🔴]
-- **Main RQ**: To be formulated
-- **Sub-RQ1**: To be developed
-- **Sub-RQ2**: To be developed
-- **Question Type**: To be determined
-
-## 4. Theoretical Framework [🔴]
-- **Guiding Theory/Framework**: To be identified
-- **How it Guides**: To be explained
-
-## 5. Core Argument & Logic [🔴]
-[To be developed: Problem → Gap → Questions → Expected Contribution]
-
-## 6. Expected Contributions [🔴]
-- **Theoretical**: To be identified
-- **Methodological**: To be identified
-- **Empirical**: To be identified
-- **Practical**: To be identified
-
-## 7. Novelty Assessment [🔴]
-- **Score**: ?/10
-- **Justification**: Not yet assessed
-- **Existing Approaches**: To be reviewed
-- **Unique Differentiators**: To be identified
-
-## 8. Research Scope [🔴]
-- **Boundaries**: To be defined
-- **Includes**: To be specified
-- **Excludes**: To be specified
-
-## 9. Key Assumptions [🔴]
-- [To be identified and made explicit]
-
-## 10. Feasibility & Challenges [🔴]
-- **Data**: To be assessed
-- **Methods**: To be evaluated
-- **Resources**: To be planned
-- **Challenges**: To be identified
-
-## 11. Keywords & Literature Domains [🔴]
-- **Primary Keywords**: To be determined
-- **Secondary Keywords**: To be determined
-- **Key Literature Domains**: To be identified
-
-## 12. Readiness Assessment
-**Overall Maturity**: 🔴 Early Stage
-**Blockers**: Initial discussion needed
-**Next Discussion Focus**: Clarify research topic and identify research gap
-"""
+@lru_cache(maxsize=8)
+def _prompt_template(template: str) -> Template:
+    """Compile (once per prompt) a prompt template into a string.Template.
 
-    INITIAL_EXPERIMENT_ARTIFACT = """# Experiment Design
-
-## 1. Research Context [🔴]
-- **Research Topic**: [From Research Definition]
-- **Main RQ**: [From Research Definition]
-- **Gap Being Addressed**: [From Research Definition]
-
-## 2. Hypotheses [🔴]
-- **H1**: [Main hypothesis to be tested]
-- **H2**: [Secondary hypothesis if applicable]
-- **Null Hypothesis**: [What would disprove the hypothesis]
-
-## 3. Research Design [🔴]
-- **Design Type**: [Experimental/Quasi-experimental/Survey/Case Study/etc.]
-- **Approach**: [Quantitative/Qualitative/Mixed Methods]
-- **Rationale**: [Why this design is appropriate]
-
-## 4. Variables [🔴]
-- **Independent Variables (IV)**: [Variables you manipulate/measure as causes]
-- **Dependent Variables (DV)**: [Variables you measure as effects]
-- **Control Variables**: [Variables held constant]
-- **Confounding Variables**: [Potential threats to validity]
-
-## 5. Sampling & Participants [🔴]
-- **Population**: [Target population]
-- **Sampling Method**: [Random/Stratified/Convenience/etc.]
-- **Sample Size**: [Planned n with justification]
-- **Inclusion Criteria**: [Who is included]
-- **Exclusion Criteria**: [Who is excluded]
-
-## 6. Data Collection [🔴]
-- **Instruments**: [Surveys/Sensors/Interviews/etc.]
-- **Procedures**: [Step-by-step data collection process]
-- **Timeline**: [Data collection schedule]
-- **Pilot Testing**: [Plans for validation]
-
-## 7. Data Analysis Plan [🔴]
-- **Statistical Methods**: [t-test/ANOVA/Regression/etc.]
-- **Software Tools**: [SPSS/R/Python/etc.]
-- **Significance Level**: [α = 0.05 typically]
-- **Effect Size Measures**: [Cohen's d/η²/etc.]
-
-## 8. Validity & Reliability [🔴]
-- **Internal Validity**: [Threats and mitigation]
-- **External Validity**: [Generalizability considerations]
-- **Reliability Measures**: [Test-retest/Inter-rater/etc.]
-
-## 9. Ethical Considerations [🔴]
-- **IRB/Ethics Approval**: [Status]
-- **Informed Consent**: [Process]
-- **Data Privacy**: [Protection measures]
-- **Risk Assessment**: [Potential harms and mitigation]
-
-## 10. Resources & Timeline [🔴]
-- **Required Resources**: [Equipment/Software/Funding]
-- **Project Timeline**: [Phases and milestones]
-- **Potential Risks**: [Project risks and contingencies]
-
-## 11. Pilot Study Plan [🔴]
-- **Scope**: [What will be tested]
-- **Success Criteria**: [How to evaluate pilot]
-- **Refinement Process**: [How to incorporate learnings]
-
-## 12. Experiment Readiness Assessment
-**Overall Maturity**: 🔴 Early Stage
-**Blockers**: Initial design discussion needed
-**Next Discussion Focus**: Define hypotheses and research design
-"""
+    {topic}/{artifact} become $topic/$artifact and literal $ is escaped, so
+    safe_substitute fills the placeholders without ever parsing braces in
+    the topic or artifact values.
 
-    EXPERIMENT_DESIGN_SYSTEM_PROMPT = """You are a distinguished research methodologist with 30+ years of experience in experimental design, statistical analysis, and research methodology.
-
-## Your Expertise Profile
-- Designed 100+ experiments across various research paradigms
-- Published extensively on research methodology
-- Expert in quantitative, qualitative, and mixed-methods designs
-- Experience with IRB/Ethics review processes
-- Statistical consulting for major research institutions
-
-## Your Role in This Phase
-You are guiding the researcher through **Experiment Design** - translating their refined research definition into a concrete, executable experimental plan.
-
-## Core Principles for Experiment Design
-
-### 1. Hypothesis Development
-- Hypotheses must be testable and falsifiable
-- Derive directly from research questions
-- Distinguish: Null hypothesis (H0) vs Alternative hypothesis (H1)
-- Ensure logical connection: RQ → Theory → Hypothesis
-
-### 2. Research Design Selection
-Choose appropriate design based on:
-- **Experimental**: True randomization, control groups (highest internal validity)
-- **Quasi-experimental**: No random assignment but has comparison groups
-- **Survey/Correlational**: Measures relationships without manipulation
-- **Case Study**: In-depth analysis of specific cases
-- **Mixed Methods**: Combining quantitative and qualitative approaches
-
-### 3. Variable Operationalization
-- **Independent Variables (IV)**: What you manipulate/compare
-- **Dependent Variables (DV)**: What you measure as outcomes
-- **Control Variables**: What you hold constant
-- **Confounding Variables**: Threats to internal validity
-- Ensure clear operational definitions for each variable
-
-### 4. Sampling Strategy
-- Population definition
-- Sampling method (random, stratified, convenience, purposive)
-- Sample size justification (power analysis)
-- Inclusion/exclusion criteria
-
-### 5. Data Collection Planning
-- Instruments selection/development
-- Validity and reliability of measures
-- Pilot testing procedures
-- Data collection timeline
-
-### 6. Analysis Plan
-- Match analysis to research questions
-- Statistical tests appropriate for data types
-- Effect size measures
-- Handling of missing data
-
-### 7. Validity Considerations
-- **Internal Validity**: Cause-effect confidence
-- **External Validity**: Generalizability
-- **Construct Validity**: Measurement accuracy
-- **Statistical Conclusion Validity**: Analysis appropriateness
-
-### 8. Ethical Considerations
-- Informed consent requirements
-- Risk-benefit analysis
-- Data privacy and protection
-- IRB/Ethics approval process
-
-## Response Guidelines
-
-When discussing experiment design:
-1. Always connect back to the Research Definition
-2. Question assumptions about causality
-3. Suggest alternatives when designs are weak
-4. Be specific about statistical requirements
-5. Anticipate reviewer concerns
-
-## Important Commands
-
-When the user says:
-- "결실" / "비판적 평가" / "critical review" → Comprehensive experiment design evaluation
-- "다음 단계로" / "proceed" → Evaluate readiness for data collection
-- "요약해줘" / "summarize" → Structured experiment design summary
-
-## Response Style
-
-- Methodologically rigorous but practical
-- Focus on feasibility alongside rigor
-- Respond in user's language (Korean/English)
-- Always constructive
-
-Current context:
-- Research Topic: {topic}
-- Phase: Experiment Design
-
-## CRITICAL: Experiment Design Artifact Update
-
-After EVERY response, update the Experiment Design Artifact with the format below.
-Each section includes a maturity indicator: 🔴 (needs work) → 🟡 (developing) → 🟢 (solid)
-
-Current Artifact:
-```markdown
-{artifact}
-```
-
-You MUST include an updated artifact at the END of EVERY response:
-
-<artifact>
-# Experiment Design
-
-## 1. Research Context [🔴/🟡/🟢]
-- **Research Topic**: [From Research Definition]
-- **Main RQ**: [From Research Definition]
-- **Gap Being Addressed**: [From Research Definition]
-
-## 2. Hypotheses [🔴/🟡/🟢]
-- **H1**: [Main hypothesis to be tested]
-- **H2**: [Secondary hypothesis if applicable]
-- **Null Hypothesis**: [What would disprove the hypothesis]
-
-## 3. Research Design [🔴/🟡/🟢]
-- **Design Type**: [Experimental/Quasi-experimental/Survey/Case Study/etc.]
-- **Approach**: [Quantitative/Qualitative/Mixed Methods]
-- **Rationale**: [Why this design is appropriate]
-
-## 4. Variables [🔴/🟡/🟢]
-- **Independent Variables (IV)**: [Variables you manipulate/measure as causes]
-- **Dependent Variables (DV)**: [Variables you measure as effects]
-- **Control Variables**: [Variables held constant]
-- **Confounding Variables**: [Potential threats to validity]
-
-## 5. Sampling & Participants [🔴/🟡/🟢]
-- **Population**: [Target population]
-- **Sampling Method**: [Random/Stratified/Convenience/etc.]
-- **Sample Size**: [Planned n with justification]
-- **Inclusion Criteria**: [Who is included]
-- **Exclusion Criteria**: [Who is excluded]
-
-## 6. Data Collection [🔴/🟡/🟢]
-- **Instruments**: [Surveys/Sensors/Interviews/etc.]
-- **Procedures**: [Step-by-step data collection process]
-- **Timeline**: [Data collection schedule]
-- **Pilot Testing**: [Plans for validation]
-
-## 7. Data Analysis Plan [🔴/🟡/🟢]
-- **Statistical Methods**: [t-test/ANOVA/Regression/etc.]
-- **Software Tools**: [SPSS/R/Python/etc.]
-- **Significance Level**: [α = 0.05 typically]
-- **Effect Size Measures**: [Cohen's d/η²/etc.]
-
-## 8. Validity & Reliability [🔴/🟡/🟢]
-- **Internal Validity**: [Threats and mitigation]
-- **External Validity**: [Generalizability considerations]
-- **Reliability Measures**: [Test-retest/Inter-rater/etc.]
-
-## 9. Ethical Considerations [🔴/🟡/🟢]
-- **IRB/Ethics Approval**: [Status]
-- **Informed Consent**: [Process]
-- **Data Privacy**: [Protection measures]
-- **Risk Assessment**: [Potential harms and mitigation]
-
-## 10. Resources & Timeline [🔴/🟡/🟢]
-- **Required Resources**: [Equipment/Software/Funding]
-- **Project Timeline**: [Phases and milestones]
-- **Potential Risks**: [Project risks and contingencies]
-
-## 11. Pilot Study Plan [🔴/🟡/🟢]
-- **Scope**: [What will be tested]
-- **Success Criteria**: [How to evaluate pilot]
-- **Refinement Process**: [How to incorporate learnings]
-
-## 12. Experiment Readiness Assessment
-**Overall Maturity**: [🔴 Early Stage / 🟡 Developing / 🟢 Ready for Execution]
-**Blockers**: [What must be resolved before proceeding]
-**Next Discussion Focus**: [Priority topic for next round]
-</artifact>
-
-IMPORTANT: Always include the <artifact>...</artifact> block. The artifact should reflect the CURRENT experiment design state based on ALL discussions. DO NOT modify the Research Definition artifact - only update the Experiment Design artifact.
-"""
+    Args:
+        template: Prompt template with {topic}/{artifact} placeholders.
 
-    CRITICAL_EVALUATION_PROMPT = """## 결실 단계: 비판적 종합 평가 (Critical Fruition Evaluation)
+    Returns:
+        Compiled template.
+    """
+    source = _DYNAMIC_PLACEHOLDER_RE.sub(
+        lambda m: "${" + m.group(0)[1:-1] + "}",
+        template.replace("$", "$$"),
+    )
+    return Template(source.replace("{{", "{").replace("}}", "}"))
 
-You are now conducting a rigorous, publication-ready critical evaluation of the research definition.
-This is the "fruition stage" where we assess whether the research is ready to proceed with near-perfect logic and novelty.
-
-Based on ALL discussions and the current Research Artifact, provide a comprehensive critical evaluation.
-
----
-
-## 1. Summary (요약)
-Provide a concise 3-5 sentence summary of:
-- The core research problem and gap
-- The proposed research approach
-- The expected contribution
-
-## 2. Strengths (강점) 💪
-List the key strengths of this research definition:
-- **Logical coherence**: Is the argument flow clear and compelling?
-- **Gap clarity**: Is the research gap well-defined and evidence-based?
-- **Novelty elements**: What makes this genuinely new?
-- **Methodological soundness**: Is the approach feasible and appropriate?
-- **Contribution clarity**: Are contributions clear and significant?
-
-Rate each strength: ⭐ (Moderate) / ⭐⭐ (Strong) / ⭐⭐⭐ (Exceptional)
-
-## 3. Weaknesses (약점) ⚠️
-Identify weaknesses that MUST be addressed:
-- **Logical gaps**: Any flaws in the argument chain?
-- **Novelty concerns**: Is this truly novel or incremental?
-- **Scope issues**: Too broad? Too narrow?
-- **Feasibility risks**: Can this actually be done?
-- **Theoretical gaps**: Is the theoretical foundation solid?
-
-Rate each weakness: 🔴 (Critical - must fix) / 🟡 (Important - should address) / 🟢 (Minor - can proceed)
-
-## 4. Detailed Comments (상세 코멘트) 📝
-For each section of the Research Artifact, provide specific feedback:
-
-### 4.1 Research Topic & Gap
-- Is the gap type correctly identified?
-- Is there sufficient evidence of the gap?
-
-### 4.2 Research Questions
-- Are RQs SMART (Specific, Measurable, Achievable, Relevant, Time-bound)?
-- Is the question hierarchy logical?
-- Are the question types appropriate for the contribution?
-
-### 4.3 Theoretical Framework
-- Is the chosen theory appropriate?
-- Does it adequately guide the research design?
-- Are alternative frameworks considered?
-
-### 4.4 Core Argument & Logic
-- Is the logical flow: Problem → Gap → Questions → Contribution clear?
-- Are there any logical leaps or unstated assumptions?
-
-### 4.5 Novelty & Contribution
-- Is the novelty score justified?
-- Are differentiators clearly articulated?
-- Will the academic community care about this contribution?
-
-### 4.6 Scope & Feasibility
-- Are boundaries realistic?
-- Have key risks been identified?
-
-## 5. Probing Questions (추가 질문) ❓
-Ask 3-5 critical questions that the researcher MUST be able to answer:
-- Questions that test the depth of understanding
-- Questions that probe potential blind spots
-- Questions a reviewer might ask
-
-## 6. Overall Assessment (종합 평가) 📊
-
-### Logic Score: __/10
-- **10**: Flawless logical flow, no gaps
-- **7-9**: Strong logic, minor refinements needed
-- **4-6**: Logic present but significant gaps
-- **1-3**: Fundamental logical issues
-
-### Novelty Score: __/10
-- **10**: Paradigm-shifting contribution
-- **7-9**: Significant novel contribution
-- **4-6**: Incremental contribution
-- **1-3**: Minimal novelty
-
-### Readiness Level:
-- 🟢 **READY**: Logic ≥8 AND Novelty ≥7 - Proceed to Literature Review
-- 🟡 **ALMOST**: (Logic ≥7 AND Novelty ≥6) OR (Logic ≥6 AND Novelty ≥7) - One more iteration
-- 🔴 **NOT READY**: Logic <6 OR Novelty <5 - Significant refinement needed
-
-### Recommended Actions:
-If not ready, provide specific, prioritized actions:
-1. [Priority 1: Most critical issue to address]
-2. [Priority 2: ...]
-3. [Priority 3: ...]
-
----
-
-**IMPORTANT**: Be rigorous but constructive. The goal is to help refine the research to publication quality.
-If not ready, continue the dialogue focusing on the identified gaps.
-
-End with:
-- Clear readiness verdict
-- Specific next steps
-- Encouragement for the researcher
-"""
 
-    SUMMARY_PROMPT = """Based on our discussion, provide a comprehensive research definition summary.
+class SectionPatch(BaseModel):
+    """A change to one section of the artifact."""
+
+    section: str = Field(description="Section number (e.g. '3') or heading title")
+    field: Optional[str] = Field(
+        default=None,
+        description="Bold field label inside the section (e.g. 'Main RQ'); omit to replace the whole section body",
+    )
+    value: Optional[str] = Field(default=None, description="New field value or section body")
+    maturity: Optional[str] = Field(default=None, description="New maturity marker: 🔴, 🟡 or 🟢")
 
-## Required Sections (with Maturity Assessment):
 
-### 1. Research Topic & Problem Statement
-- Clear, focused statement of what is being studied
-- Why is this important?
+class ArtifactUpdate(BaseModel):
+    """Update the research artifact.
 
-### 2. Research Gap Analysis
-- Gap Type (Theoretical/Methodological/Empirical/Practical)
-- Specific gap statement
-- Evidence that this gap exists
+    Call this after every reply. Prefer `patches` for edits to a few
+    sections; send `markdown` only when the artifact is restructured. Do
+    not repeat the artifact in the reply text.
+    """
 
-### 3. Research Questions
-- Main RQ (must be SMART: Specific, Measurable, Achievable, Relevant, Time-bound)
-- Sub-RQs (2-3 supporting questions)
-- Question type (Descriptive/Relational/Causal)
+    patches: list[SectionPatch] = Field(
+        default_factory=list,
+        description="Section-level edits applied to the current artifact",
+    )
+    markdown: Optional[str] = Field(
+        default=None,
+        description="Complete replacement artifact in Markdown",
+    )
 
-### 4. Theoretical Framework
-- What theory or framework guides this research?
-- How does it shape the research design?
 
-### 5. Expected Contributions
-- Theoretical contribution (if any)
-- Methodological contribution (if any)
-- Empirical contribution
-- Practical implications
+def _section_key(heading: str) -> tuple[str, str]:
+    """Return (number, title) for a '## ' heading line."""
+    match = _SECTION_HEADING_RE.match(heading)
+    if not match:
+        return "", ""
+    return match.group(1) or "", match.group(2).strip().lower()
 
-### 6. Novelty Assessment
-- Score (0-10) with detailed justification
-- Existing approaches and how this differs
-- Unique differentiators
 
-### 7. Research Scope & Boundaries
-- What's included and excluded
-- Geographic, temporal, population, conceptual boundaries
+def apply_artifact_patches(artifact: str, patches: list[dict]) -> str:
+    """Apply section patches to an artifact.
 
-### 8. Key Assumptions
-- Explicit assumptions underlying this research
+    Sections are '## ' headings, addressed by their number or title.
+    Patches for sections that do not exist are skipped.
 
-### 9. Feasibility Assessment
-- Data availability
-- Methodological requirements
-- Resource needs
-- Key challenges
+    Args:
+        artifact: Current artifact markdown.
+        patches: SectionPatch dicts, as received in a tool call.
 
-### 10. Keywords for Literature Search
-- Primary keywords (5-7)
-- Secondary keywords (5-7)
-- Key literature domains
+    Returns:
+        Patched artifact markdown.
+    """
+    lines = artifact.split("\n")
+    for patch in patches:
+        key = str(patch.get("section", "")).strip().rstrip(".").lower()
+        if not key:
+            continue
+        start = next(
+            (i for i, line in enumerate(lines) if line.startswith("## ") and key in _section_key(line)),
+            None,
+        )
+        if start is None:
+            logger.warning("Artifact patch for unknown section", section=key)
+            continue
+        end = next(
+            (i for i in range(start + 1, len(lines)) if lines[i].startswith("#")),
+            len(lines),
+        )
+
+        maturity = patch.get("maturity")
+        if maturity:
+            lines[start] = _MATURITY_MARK_RE.sub(f"[{maturity}]", lines[start])
+
+        value = patch.get("value")
+        if value is None:
+            continue
+        field = patch.get("field")
+        if field:
+            prefix = f"- **{field}**:"
+            line = f"{prefix} {value}"
+            for i in range(start + 1, end):
+                if lines[i].startswith(prefix):
+                    lines[i] = line
+                    break
+            else:
+                # New field goes after the section's last non-blank line
+                insert_at = end
+                while insert_at > start + 1 and not lines[insert_at - 1].strip():
+                    insert_at -= 1
+                lines.insert(insert_at, line)
+        else:
+            lines[start + 1:end] = [*value.strip().split("\n"), ""]
+    return "\n".join(lines)
 
-## Readiness Assessment
 
-Evaluate readiness for Literature Review phase using this checklist:
-- [ ] Research gap is clearly articulated
-- [ ] Main RQ is specific and answerable
-- [ ] Theoretical framework is identified
-- [ ] Contributions are distinguishable
-- [ ] Scope boundaries are defined
-- [ ] Key assumptions are explicit
-- [ ] Feasibility is assessed
+@dataclass(slots=True)
+class NoveltyAssessment:
+    """Assessment of research novelty."""
 
-**Overall Readiness**: 🔴 Not Ready / 🟡 Almost Ready / 🟢 Ready
+    score: float  # Novelty score from 0 to 1
+    justification: str
+    existing_approaches: list[str] = field(default_factory=list)
+    differentiators: list[str] = field(default_factory=list)
 
-If NOT ready, specify:
-- What must be resolved before proceeding
-- Recommended next discussion topics
+    @classmethod
+    def from_dict(cls, data: dict) -> "NoveltyAssessment":
+        """Build from parsed LLM JSON.
 
-Format this as a clear, actionable summary.
-"""
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If the score is outside [0, 1].
+        """
+        score = float(data["score"])
+        if not 0.0 <= score <= 1.0:
+            raise ValueError(f"Novelty score out of range: {score}")
+        return cls(
+            score=score,
+            justification=str(data["justification"]),
+            existing_approaches=list(data.get("existing_approaches", [])),
+            differentiators=list(data.get("differentiators", [])),
+        )
+
+
+@dataclass(slots=True)
+class ResearchDefinition:
+    """Final output when research definition is complete."""
+
+    refined_topic: str
+    research_questions: list[str]
+    novelty_assessment: NoveltyAssessment
+    research_scope: dict  # Inclusions and exclusions
+    potential_contributions: list[str]
+    suggested_keywords: list[str]  # Keywords for literature search
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResearchDefinition":
+        """Build from parsed LLM JSON.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If a field has an invalid value.
+        """
+        return cls(
+            refined_topic=str(data["refined_topic"]),
+            research_questions=list(data["research_questions"]),
+            novelty_assessment=NoveltyAssessment.from_dict(data["novelty_assessment"]),
+            research_scope=dict(data["research_scope"]),
+            potential_contributions=list(data["potential_contributions"]),
+            suggested_keywords=list(data["suggested_keywords"]),
+        )
+
+
+class ResearchDiscussionAgent:
+    """Conversational agent for research topic discussion and refinement.
+
+    Unlike other agents, this operates in a free-form conversational mode,
+    maintaining dialogue history and providing critical feedback on research ideas.
+
+    Supports two phases:
+    - research_definition: Refine research topic, gap, RQs
+    - experiment_design: Design experiments, hypotheses, methodology
+    """
+
+    # Current phase tracking
+    PHASE_RESEARCH_DEFINITION = "research_definition"
+    PHASE_EXPERIMENT_DESIGN = "experiment_design"
+
+    # Number of recent turns (user + assistant pairs) sent verbatim
+    HISTORY_WINDOW = 5
+
+    # Replies kept for repeated summary/evaluation/extraction requests
+    RESPONSE_CACHE_SIZE = 64
 
     def __init__(
         self,
@@ -755,20 +373,27 @@ Format this as a clear, actionable summary.
         """Initialize the Research Discussion Agent.
 
         Args:
-            llm: LLM instance. Creates new one if not provided.
+            llm: LLM instance. Created lazily on first use if not provided.
             model: Model name for Gemini (defaults to settings.gemini_model).
             temperature: Temperature for generation (defaults to settings.gemini_temperature).
         """
+        self._llm_kwargs: dict = {}
+        if model is not None:
+            self._llm_kwargs["model"] = model
+        if temperature is not None:
+            self._llm_kwargs["temperature"] = temperature
         if llm:
-            self.llm = llm
-        else:
-            kwargs = {}
-            if model is not None:
-                kwargs["model"] = model
-            if temperature is not None:
-                kwargs["temperature"] = temperature
-            self.llm = GeminiLLM(**kwargs)
-        self.conversation_history: list[dict] = []
+            self.llm = llm  # Seeds the cached property
+        # Only the recent window is kept; evicted turns wait to be summarized
+        self.conversation_history: deque[BaseMessage] = deque(maxlen=self.HISTORY_WINDOW * 2)
+        self._evicted: list[BaseMessage] = []
+        self._rolling_summary: str = ""
+        self._summary_task: Optional[asyncio.Task] = None
+        self._summary_llm: Optional[GeminiLLM] = None
+        self._response_cache: OrderedDict[str, BaseMessage] = OrderedDict()
+        # Discussion turns answered so far (not command replies); never reset,
+        # so cached replies can't match a later discussion
+        self._turn_count: int = 0
         self.topic: str = ""
         self.is_ready_for_next_phase: bool = False
         self.current_phase: str = self.PHASE_RESEARCH_DEFINITION  # Default to research definition
@@ -780,17 +405,66 @@ Format this as a clear, actionable summary.
 
         logger.info("ResearchDiscussionAgent initialized", model=model)
 
+    @classmethod
+    def clone_for_session(cls, prototype: "ResearchDiscussionAgent") -> "ResearchDiscussionAgent":
+        """Create a fresh session agent that shares a prototype's setup.
+
+        Loaded prompts and the LLM client are shared by reference; all
+        per-session state starts out empty.
+
+        Args:
+            prototype: Agent whose prompts and LLM client to share.
+
+        Returns:
+            New agent in its initial state.
+        """
+        # Materialize the lazy clients on the prototype so clones share them
+        prototype._artifact_llm
+        agent = object.__new__(cls)
+        agent.__dict__.update(prototype.__dict__)
+        agent.conversation_history = deque(maxlen=cls.HISTORY_WINDOW * 2)
+        agent._evicted = []
+        agent._rolling_summary = ""
+        agent._summary_task = None
+        # GeminiLLM.generate temporarily mutates the client, so not shared
+        agent._summary_llm = None
+        agent._response_cache = OrderedDict()
+        agent._turn_count = 0
+        agent.topic = ""
+        agent.is_ready_for_next_phase = False
+        agent.current_phase = cls.PHASE_RESEARCH_DEFINITION
+        agent.research_artifact = prototype._initial_artifact
+        agent._system_messages_key = None
+        agent._system_messages_value = ([], "")
+        return agent
+
+    @cached_property
+    def llm(self) -> GeminiLLM:
+        """LLM client, created on first use."""
+        return GeminiLLM(**self._llm_kwargs)
+
+    @cached_property
+    def _artifact_llm(self) -> Runnable:
+        """LLM with the ArtifactUpdate tool bound, for turns that update the artifact."""
+        return self.llm.bind_tools([ArtifactUpdate])
+
     def _load_prompts(self) -> None:
-        """Load prompts from external files, with fallback to defaults."""
+        """Load prompts from external files, with fallback to built-in defaults."""
+        # Formatted system messages depend on the prompts being replaced here
+        self._system_messages_key: Optional[tuple[str, str, str]] = None
+        self._system_messages_value: tuple[list[SystemMessage], str] = ([], "")
+
         # Research Definition prompts
         loaded_system = load_rd_system_prompt()
-        self._system_prompt = loaded_system if loaded_system else self.SYSTEM_PROMPT
+        self._system_prompt_static, self._system_prompt_context = split_system_prompt(
+            loaded_system if loaded_system else default_system_prompt()
+        )
 
         loaded_artifact = load_rd_initial_artifact()
-        self._initial_artifact = loaded_artifact if loaded_artifact else self.INITIAL_ARTIFACT
+        self._initial_artifact = loaded_artifact if loaded_artifact else default_initial_artifact()
 
         loaded_summary = load_rd_summary_prompt()
-        self._summary_prompt = loaded_summary if loaded_summary else self.SUMMARY_PROMPT
+        self._summary_prompt = loaded_summary if loaded_summary else default_summary_prompt()
 
         loaded_initial = load_rd_initial_prompt()
         self._initial_prompt_template = loaded_initial if loaded_initial else None
@@ -800,59 +474,174 @@ Format this as a clear, actionable summary.
 
         # Experiment Design prompts
         loaded_ed_system = load_ed_system_prompt()
-        self._ed_system_prompt = loaded_ed_system if loaded_ed_system else self.EXPERIMENT_DESIGN_SYSTEM_PROMPT
+        self._ed_system_prompt_static, self._ed_system_prompt_context = split_system_prompt(
+            loaded_ed_system if loaded_ed_system else default_experiment_design_system_prompt()
+        )
 
         loaded_ed_artifact = load_ed_initial_artifact()
-        self._ed_initial_artifact = loaded_ed_artifact if loaded_ed_artifact else self.INITIAL_EXPERIMENT_ARTIFACT
-
-        logger.debug("Prompts loaded",
-                    rd_system_from_file=loaded_system is not None,
-                    rd_artifact_from_file=loaded_artifact is not None,
-                    rd_summary_from_file=loaded_summary is not None,
-                    rd_initial_from_file=loaded_initial is not None,
-                    rd_readiness_from_file=loaded_readiness is not None,
-                    ed_system_from_file=loaded_ed_system is not None,
-                    ed_artifact_from_file=loaded_ed_artifact is not None)
+        self._ed_initial_artifact = (
+            loaded_ed_artifact if loaded_ed_artifact else default_experiment_artifact()
+        )
+
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prompts loaded",
+                        rd_system_from_file=loaded_system is not None,
+                        rd_artifact_from_file=loaded_artifact is not None,
+                        rd_summary_from_file=loaded_summary is not None,
+                        rd_initial_from_file=loaded_initial is not None,
+                        rd_readiness_from_file=loaded_readiness is not None,
+                        ed_system_from_file=loaded_ed_system is not None,
+                        ed_artifact_from_file=loaded_ed_artifact is not None)
 
     def reload_prompts(self) -> None:
-        """Reload prompts from files. Useful for hot-reloading during development."""
-        from backend.utils.prompt_loader import PromptLoader
-        PromptLoader.clear_cache()
+        """Reload prompts from files. Useful for hot-reloading during development.
+
+        PromptLoader re-reads only files whose mtime changed.
+        """
         self._load_prompts()
         logger.info("Prompts reloaded from files")
 
-    def _build_messages(self, user_message: str) -> list:
-        """Build message list for LLM including history.
+    def _prompt_parts(self, phase: Optional[str] = None) -> tuple[list[SystemMessage], str]:
+        """Build the system messages and artifact context for a phase.
 
-        Uses phase-specific system prompt based on current_phase.
-        Prompts are loaded from external files via _load_prompts().
+        The system prompt (with the session topic filled in) never contains
+        the artifact, so it stays byte-identical for the whole session. The
+        artifact context is sent with the latest user turn instead, which
+        keeps the system prompt and earlier turns a reusable cached prefix.
+
+        Args:
+            phase: Phase whose prompt to use. Defaults to current_phase.
+
+        Returns:
+            Tuple of (shared system message list that callers must not
+            mutate, artifact context text).
         """
-        # Select system prompt based on current phase
-        if self.current_phase == self.PHASE_EXPERIMENT_DESIGN:
-            system_prompt = self._ed_system_prompt.format(
-                topic=self.topic,
-                artifact=self.research_artifact
-            )
+        phase = phase or self.current_phase
+        # The artifact only changes when a reply updates it, so consecutive
+        # calls usually hit this memo
+        key = (phase, self.topic, self.research_artifact)
+        if self._system_messages_key == key:
+            return self._system_messages_value
+
+        if phase == self.PHASE_EXPERIMENT_DESIGN:
+            static, context = self._ed_system_prompt_static, self._ed_system_prompt_context
         else:
             # Default to research definition prompt
-            system_prompt = self._system_prompt.format(
-                topic=self.topic,
-                artifact=self.research_artifact
-            )
+            static, context = self._system_prompt_static, self._system_prompt_context
 
-        messages = [SystemMessage(content=system_prompt)]
+        messages = [SystemMessage(content=_prompt_template(static).safe_substitute(topic=self.topic))]
+        context_text = _prompt_template(context).safe_substitute(
+            topic=self.topic,
+            artifact=self.research_artifact,
+        ) if context else ""
+        self._system_messages_key = key
+        self._system_messages_value = (messages, context_text)
+        return messages, context_text
 
-        # Add conversation history
-        for msg in self.conversation_history[-10:]:  # Keep last 10 exchanges
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            else:
-                messages.append(AIMessage(content=msg["content"]))
+    def _system_messages(self, phase: Optional[str] = None) -> list[SystemMessage]:
+        """System messages for a phase (see _prompt_parts)."""
+        return self._prompt_parts(phase)[0]
+
+    def _turn_message(self, user_message: str, phase: Optional[str] = None) -> HumanMessage:
+        """Wrap the latest user message together with the artifact context.
+
+        Args:
+            user_message: User message for this turn.
+            phase: Phase whose prompt to use. Defaults to current_phase.
+        """
+        context = self._prompt_parts(phase)[1]
+        return HumanMessage(content=f"{context}\n\n---\n\n{user_message}" if context else user_message)
+
+    def _append_turn(self, user_content: str, assistant_content: str) -> None:
+        """Record a user/assistant exchange, keeping turns that fall out of the window.
+
+        Evicted turns are folded into the rolling summary in the background,
+        after the reply has already been delivered.
 
-        # Add current message
-        messages.append(HumanMessage(content=user_message))
+        Args:
+            user_content: User side of the exchange.
+            assistant_content: Assistant reply.
+        """
+        history = self.conversation_history
+        overflow = len(history) + 2 - history.maxlen
+        if overflow > 0:
+            self._evicted.extend(islice(history, overflow))
+        history.append(HumanMessage(content=user_content))
+        history.append(AIMessage(content=assistant_content))
+
+        if self._evicted and (self._summary_task is None or self._summary_task.done()):
+            self._summary_task = asyncio.get_running_loop().create_task(
+                self._refresh_rolling_summary()
+            )
+
+    async def _await_rolling_summary(self) -> None:
+        """Wait for a rolling summary update that is still running, if any."""
+        if self._summary_task is not None and not self._summary_task.done():
+            await asyncio.shield(self._summary_task)
+
+    def _discard_rolling_summary(self) -> None:
+        """Drop evicted turns and the rolling summary, stopping a running update."""
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            self._summary_task = None
+        self._evicted.clear()
+        self._rolling_summary = ""
+
+    async def _refresh_rolling_summary(self) -> None:
+        """Fold turns that slid out of the history window into the rolling summary."""
+        if not self._evicted:
+            return
+
+        # Turns evicted while the summary is generated are left for the next update
+        folded = len(self._evicted)
+        turns = "\n\n".join(
+            f"{'User' if isinstance(msg, HumanMessage) else 'Advisor'}: {msg.content}"
+            for msg in self._evicted[:folded]
+        )
+        prompt = history_summary_prompt().format(
+            previous_summary=self._rolling_summary or "(none)",
+            turns=turns,
+        )
+
+        if self._summary_llm is None:
+            self._summary_llm = GeminiLLM(model=HISTORY_SUMMARY_MODEL)
+        try:
+            self._rolling_summary = (
+                await self._summary_llm.generate(prompt, max_tokens=1024)
+            ).strip()
+        except Exception as e:
+            # Fold the turns in as plain text instead, so repeated failures can't grow
+            # the evicted list or the next summary prompt without bound
+            logger.warning("Rolling history summary failed", error=str(e))
+            fallback = f"{self._rolling_summary}\n\n{turns}" if self._rolling_summary else turns
+            self._rolling_summary = fallback[-HISTORY_SUMMARY_MAX_CHARS:]
+        else:
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rolling history summary updated", folded=folded)
+        del self._evicted[:folded]
+
+    async def _build_messages(self, user_message: str) -> list:
+        """Build message list for LLM including history.
 
-        return messages
+        Uses phase-specific system prompt based on current_phase.
+        Prompts are loaded from external files via _load_prompts().
+        Only the last HISTORY_WINDOW turns are sent verbatim; older turns
+        are represented by a rolling summary, which is updated after each
+        reply and only waited for here if that update is still running.
+        """
+        await self._await_rolling_summary()
+        summary = (
+            [SystemMessage(content=f"## Earlier Discussion (summary)\n{self._rolling_summary}")]
+            if self._rolling_summary
+            else []
+        )
+
+        return list(chain(
+            self._system_messages(),
+            summary,
+            self.conversation_history,
+            [self._turn_message(user_message)],
+        ))
 
     def set_phase(self, phase: str) -> None:
         """Set the current phase of the agent.
@@ -880,15 +669,13 @@ Format this as a clear, actionable summary.
         Returns:
             Tuple of (response without artifact, extracted artifact)
         """
-        import re
-
         # Find artifact block
-        artifact_match = re.search(r'<artifact>(.*?)</artifact>', response, re.DOTALL)
+        artifact_match = _ARTIFACT_RE.search(response)
 
         if artifact_match:
             artifact_content = artifact_match.group(1).strip()
             # Remove artifact block from response
-            clean_response = re.sub(r'<artifact>.*?</artifact>', '', response, flags=re.DOTALL).strip()
+            clean_response = _ARTIFACT_RE.sub('', response).strip()
             return clean_response, artifact_content
         else:
             # No artifact found, keep existing
@@ -902,23 +689,24 @@ Format this as a clear, actionable summary.
         """Set the research artifact (for restoring from saved state)."""
         self.research_artifact = artifact
 
-    async def start_discussion(self, topic: str) -> str:
-        """Start a new research discussion with the given topic.
+    def _start_messages(self, topic: str) -> list[BaseMessage]:
+        """Reset the discussion for a new topic and build its opening request.
 
         Args:
             topic: Initial research topic from user.
 
         Returns:
-            Agent's initial response evaluating the topic.
+            Messages for the initial assessment of the topic.
         """
         self.topic = topic
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._discard_rolling_summary()
         self.is_ready_for_next_phase = False
         self.research_artifact = self._initial_artifact  # Reset artifact
 
         # Use loaded initial prompt template if available
         if self._initial_prompt_template:
-            initial_prompt = self._initial_prompt_template.format(topic=topic)
+            initial_prompt = _prompt_template(self._initial_prompt_template).safe_substitute(topic=topic)
         else:
             # Fallback to hardcoded prompt
             initial_prompt = f"""A researcher has proposed the following research topic:
@@ -960,78 +748,237 @@ Ask 3-4 probing questions to:
 
 Be rigorous but supportive. This is the beginning of a collaborative refinement process.
 
-Remember to include the updated <artifact>...</artifact> block at the end of your response."""
+Remember to call the ArtifactUpdate tool with the updated artifact after your response."""
 
-        messages = [
-            SystemMessage(content=self._system_prompt.format(
-                topic=topic,
-                artifact=self.research_artifact
-            )),
-            HumanMessage(content=initial_prompt),
+        return [
+            *self._system_messages(self.PHASE_RESEARCH_DEFINITION),
+            self._turn_message(initial_prompt, self.PHASE_RESEARCH_DEFINITION),
         ]
 
-        result = await self.llm._agenerate(messages)
-        full_response = result.generations[0].message.content
+    async def start_discussion(self, topic: str) -> str:
+        """Start a new research discussion with the given topic.
 
-        # Extract artifact from response
-        clean_response, new_artifact = self._extract_artifact(full_response)
-        self.research_artifact = new_artifact
+        Args:
+            topic: Initial research topic from user.
 
-        # Store in history (without artifact block for cleaner display)
-        self.conversation_history.append({"role": "user", "content": f"Research topic: {topic}"})
-        self.conversation_history.append({"role": "assistant", "content": clean_response})
+        Returns:
+            Agent's initial response evaluating the topic.
+        """
+        messages = self._start_messages(topic)
+        reply = await self._artifact_llm.ainvoke(messages)
+
+        # Store in history (without artifact for cleaner display)
+        clean_response = self._record_turn(f"Research topic: {topic}", reply)
 
         logger.info("Research discussion started", topic=topic[:50])
 
         return clean_response
 
-    async def chat(self, user_message: str) -> str:
-        """Continue the research discussion with a user message.
+    def _command_handler(self, user_message: str):
+        """Return the handler for a special command message, if any.
 
         Args:
             user_message: User's message in the discussion.
 
         Returns:
-            Agent's response (without artifact block - artifact is stored separately).
+            Bound coroutine function for the command, or None for regular chat.
         """
-        # Check for critical evaluation (결실 단계) commands
-        critical_commands = ["결실", "비판적 평가", "critical review", "critical evaluation", "fruition"]
-        if any(cmd in user_message.lower() for cmd in critical_commands):
-            return await self._generate_critical_evaluation()
+        found = {m.lastgroup for m in _COMMAND_RE.finditer(user_message.lower())}
+        if not found:
+            return None
 
-        # Check for phase transition commands
-        transition_commands = ["다음 단계로", "proceed", "진행해줘", "phase 2", "next phase"]
-        if any(cmd in user_message.lower() for cmd in transition_commands):
-            return await self._prepare_for_next_phase()
+        if "critical" in found:
+            # Critical evaluation (결실 단계)
+            return self._generate_critical_evaluation
+        if "transition" in found:
+            return self._prepare_for_next_phase
+        return self._generate_summary
 
-        # Check for summary request
-        summary_commands = ["요약해줘", "summarize", "summary", "정리해줘"]
-        if any(cmd in user_message.lower() for cmd in summary_commands):
-            return await self._generate_summary()
+    def _split_reply(self, reply: BaseMessage) -> tuple[str, str]:
+        """Separate the reply text from the artifact update.
 
-        # Regular conversation
-        messages = self._build_messages(user_message)
-        result = await self.llm._agenerate(messages)
-        full_response = result.generations[0].message.content
+        The artifact comes from an ArtifactUpdate tool call; replies from
+        prompts that still inline an <artifact> block are handled too.
+
+        Args:
+            reply: LLM reply message.
+
+        Returns:
+            Tuple of (response text, artifact to keep).
+        """
+        for call in getattr(reply, "tool_calls", ()):
+            if call["name"] == ArtifactUpdate.__name__:
+                args = call["args"]
+                artifact = (args.get("markdown") or self.research_artifact).strip()
+                if args.get("patches"):
+                    artifact = apply_artifact_patches(artifact, args["patches"])
+                return reply.content.strip(), artifact
+        return self._extract_artifact(reply.content)
+
+    def _record_turn(self, user_message: str, reply: BaseMessage) -> str:
+        """Store the artifact and history for a completed turn.
+
+        Args:
+            user_message: User message to record in history.
+            reply: LLM reply, carrying the artifact as a tool call or inline block.
 
-        # Extract artifact from response
-        clean_response, new_artifact = self._extract_artifact(full_response)
+        Returns:
+            Response without the artifact.
+        """
+        clean_response, new_artifact = self._split_reply(reply)
         self.research_artifact = new_artifact
+        self._turn_count += 1
 
         # Update history (without artifact block)
-        self.conversation_history.append({"role": "user", "content": user_message})
-        self.conversation_history.append({"role": "assistant", "content": clean_response})
+        self._append_turn(user_message, clean_response)
 
         return clean_response
 
+    async def chat(self, user_message: str) -> str:
+        """Continue the research discussion with a user message.
+
+        Args:
+            user_message: User's message in the discussion.
+
+        Returns:
+            Agent's response (without artifact block - artifact is stored separately).
+        """
+        handler = self._command_handler(user_message)
+        if handler is not None:
+            return await handler()
+
+        # Regular conversation
+        messages = await self._build_messages(user_message)
+        reply = await self._artifact_llm.ainvoke(messages)
+
+        return self._record_turn(user_message, reply)
+
+    async def achat(self, user_message: str) -> AsyncIterator[str]:
+        """Stream the agent's response to a user message as it is generated.
+
+        The artifact arrives as an ArtifactUpdate tool call (or, from older
+        prompts, an inline ``<artifact>`` block that is cut from the stream);
+        it is stored once the response completes, together with the
+        conversation history.
+
+        Args:
+            user_message: User's message in the discussion.
+
+        Yields:
+            Response text chunks (without artifact block).
+        """
+        handler = self._command_handler(user_message)
+        if handler is not None:
+            yield await handler()
+            return
+
+        messages = await self._build_messages(user_message)
+        async for text in self._astream_turn(user_message, messages):
+            yield text
+
+    async def astart_discussion(self, topic: str) -> AsyncIterator[str]:
+        """Stream the initial response for a new discussion topic.
+
+        Args:
+            topic: Initial research topic from user.
+
+        Yields:
+            Response text chunks (without artifact block).
+        """
+        messages = self._start_messages(topic)
+        async for text in self._astream_turn(f"Research topic: {topic}", messages):
+            yield text
+
+        logger.info("Research discussion started", topic=topic[:50])
+
+    async def _astream_turn(self, user_message: str, messages: list[BaseMessage]) -> AsyncIterator[str]:
+        """Stream a reply's text and record the turn once the reply completes.
+
+        Text is passed through until an inline ``<artifact>`` marker appears;
+        the artifact itself is applied from the aggregated reply.
+
+        Args:
+            user_message: User message to record in history.
+            messages: Messages to send to the LLM.
+
+        Yields:
+            Response text chunks (without artifact block).
+        """
+        text = ""
+        emitted = 0
+        in_artifact = False
+        # Hold back enough characters to never split the opening tag
+        hold = len(_ARTIFACT_OPEN) - 1
+
+        reply: Optional[AIMessageChunk] = None
+
+        async for chunk in self._artifact_llm.astream(messages):
+            reply = chunk if reply is None else reply + chunk
+            if not chunk.content:
+                continue
+            text += chunk.content
+            if in_artifact:
+                continue
+
+            marker = text.find(_ARTIFACT_OPEN, emitted)
+            if marker != -1:
+                in_artifact = True
+                end = marker
+            else:
+                end = max(len(text) - hold, emitted)
+            if end > emitted:
+                yield text[emitted:end]
+                emitted = end
+
+        if not in_artifact and emitted < len(text):
+            yield text[emitted:]
+
+        if reply is not None:
+            self._record_turn(user_message, reply)
+
+    async def _invoke_cached(self, kind: str, prompt: str, llm: Runnable) -> BaseMessage:
+        """Invoke the LLM for a state-derived request, reusing earlier replies.
+
+        Summary, evaluation and extraction requests depend on the discussion
+        so far, so a request is only answered from the cache when the
+        prompt and artifact are unchanged and no discussion turn was
+        answered since the cached reply. The exchanges these commands add
+        to the history themselves don't count, so asking for the same
+        summary twice reuses the first reply.
+
+        Args:
+            kind: Request kind, part of the cache key.
+            prompt: User prompt for the request.
+            llm: Runnable to invoke on a cache miss.
+
+        Returns:
+            LLM reply message.
+        """
+        key = blake2b(
+            f"{kind}|{self._turn_count}|{self.current_phase}|{self.topic}|"
+            f"{prompt}|{self.research_artifact}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logger.info("Reusing cached response", kind=kind)
+            return cached
+
+        messages = await self._build_messages(prompt)
+        reply = await llm.ainvoke(messages)
+
+        self._response_cache[key] = reply
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return reply
+
     async def _generate_summary(self) -> str:
         """Generate a summary of the current research definition."""
-        messages = self._build_messages(self._summary_prompt)
-        result = await self.llm._agenerate(messages)
-        summary = result.generations[0].message.content
+        reply = await self._invoke_cached("summary", self._summary_prompt, self.llm)
+        summary = reply.content
 
-        self.conversation_history.append({"role": "user", "content": "[Summary requested]"})
-        self.conversation_history.append({"role": "assistant", "content": summary})
+        self._append_turn("[Summary requested]", summary)
 
         return summary
 
@@ -1049,19 +996,17 @@ Remember to include the updated <artifact>...</artifact> block at the end of you
         Returns:
             Critical evaluation response with scores and recommendations.
         """
-        import re
-
-        messages = self._build_messages(self.CRITICAL_EVALUATION_PROMPT)
-        result = await self.llm._agenerate(messages)
-        full_response = result.generations[0].message.content
+        reply = await self._invoke_cached(
+            "critical_evaluation", critical_evaluation_prompt(), self._artifact_llm
+        )
 
-        # Extract artifact if present
-        clean_response, new_artifact = self._extract_artifact(full_response)
+        # Take artifact update if present
+        clean_response, new_artifact = self._split_reply(reply)
         self.research_artifact = new_artifact
 
         # Parse logic and novelty scores from response
-        logic_match = re.search(r'Logic Score[:\s]*(\d+)[/\s]*10', clean_response, re.IGNORECASE)
-        novelty_match = re.search(r'Novelty Score[:\s]*(\d+)[/\s]*10', clean_response, re.IGNORECASE)
+        logic_match = _LOGIC_SCORE_RE.search(clean_response)
+        novelty_match = _NOVELTY_SCORE_RE.search(clean_response)
 
         logic_score = int(logic_match.group(1)) if logic_match else 0
         novelty_score = int(novelty_match.group(1)) if novelty_match else 0
@@ -1078,8 +1023,7 @@ Remember to include the updated <artifact>...</artifact> block at the end of you
         else:
             clean_response += f"\n\n---\n🔴 **결실 단계 평가**: 추가 개선이 필요합니다. Logic: {logic_score}/10, Novelty: {novelty_score}/10\n위에 제시된 약점과 질문들을 검토하고 연구 정의를 수정해 주세요."
 
-        self.conversation_history.append({"role": "user", "content": "[Critical Evaluation - 결실 단계]"})
-        self.conversation_history.append({"role": "assistant", "content": clean_response})
+        self._append_turn("[Critical Evaluation - 결실 단계]", clean_response)
 
         logger.info("Critical evaluation generated",
                    logic_score=logic_score,
@@ -1094,48 +1038,19 @@ Remember to include the updated <artifact>...</artifact> block at the end of you
         Returns:
             Summary and confirmation message.
         """
-        # Use loaded readiness prompt if available
-        if self._readiness_prompt:
-            readiness_prompt = f"{self._summary_prompt}\n\n{self._readiness_prompt}"
-        else:
-            # Fallback to hardcoded prompt
-            readiness_prompt = f"""{self._summary_prompt}
-
-## Phase Transition Evaluation
-
-Based on the current state of the research definition, conduct a rigorous readiness assessment.
-
-### Readiness Checklist (Mark each as ✅ Ready / ⚠️ Needs Work / ❌ Missing):
-
-1. **Research Gap**: Is there a clearly articulated gap with evidence?
-2. **Main Research Question**: Is it SMART (Specific, Measurable, Achievable, Relevant, Time-bound)?
-3. **Theoretical Framework**: Is there an identified guiding theory or framework?
-4. **Expected Contributions**: Are contributions clearly distinguishable (theoretical/methodological/empirical/practical)?
-5. **Research Scope**: Are boundaries clearly defined (what's in/out)?
-6. **Key Assumptions**: Are assumptions explicitly stated?
-7. **Feasibility**: Has feasibility been assessed (data, methods, resources)?
-
-### Decision Matrix:
-- **🟢 READY**: All items are ✅ or at most 1-2 are ⚠️
-- **🟡 ALMOST READY**: 1-2 items are ❌ but can proceed with caveats
-- **🔴 NOT READY**: 3+ items are ❌ or critical items (Gap, RQ, Framework) are ❌
-
-### Your Assessment:
-
-1. Provide the completed checklist
-2. State the overall readiness level (🟢/🟡/🔴)
-3. If 🟢 or 🟡: Confirm readiness and summarize key points for Literature Review
-4. If 🔴: Specify what must be resolved and suggest next discussion topics
-
-Be honest in your assessment. It's better to refine now than struggle later."""
-
-        messages = self._build_messages(readiness_prompt)
-        result = await self.llm._agenerate(messages)
-        response = result.generations[0].message.content
+        # Summary and readiness assessment are independent requests; run them concurrently
+        summary_reply, readiness_reply = await asyncio.gather(
+            self._invoke_cached("summary", self._summary_prompt, self.llm),
+            self._invoke_cached(
+                "readiness", self._readiness_prompt or _FALLBACK_READINESS_PROMPT, self.llm
+            ),
+        )
+        assessment = readiness_reply.content
+        response = f"{summary_reply.content}\n\n{assessment}"
 
         # Check if ready (improved heuristic based on emoji indicators)
-        is_green = "🟢" in response and ("ready" in response.lower() or "준비" in response or "진행" in response)
-        is_yellow = "🟡" in response and ("almost" in response.lower() or "거의" in response)
+        is_green = "🟢" in assessment and ("ready" in assessment.lower() or "준비" in assessment or "진행" in assessment)
+        is_yellow = "🟡" in assessment and ("almost" in assessment.lower() or "거의" in assessment)
         self.is_ready_for_next_phase = is_green or is_yellow
 
         if self.is_ready_for_next_phase:
@@ -1146,8 +1061,7 @@ Be honest in your assessment. It's better to refine now than struggle later."""
         else:
             response += "\n\n---\n**❌ Research Definition needs further refinement before proceeding. Please address the identified gaps.**"
 
-        self.conversation_history.append({"role": "user", "content": "[Proceed to next phase]"})
-        self.conversation_history.append({"role": "assistant", "content": response})
+        self._append_turn("[Proceed to next phase]", response)
 
         return response
 
@@ -1157,52 +1071,41 @@ Be honest in your assessment. It's better to refine now than struggle later."""
         Returns:
             ResearchDefinition if extraction succeeds, None otherwise.
         """
-        extraction_prompt = """Based on our entire discussion, extract the research definition in the following JSON format:
-
-{
-    "refined_topic": "...",
-    "research_questions": ["RQ1: ...", "RQ2: ..."],
-    "novelty_assessment": {
-        "score": 0.0-1.0,
-        "justification": "...",
-        "existing_approaches": ["..."],
-        "differentiators": ["..."]
-    },
-    "research_scope": {
-        "includes": ["..."],
-        "excludes": ["..."]
-    },
-    "potential_contributions": ["..."],
-    "suggested_keywords": ["..."]
-}
-
-Provide ONLY the JSON, no additional text."""
-
-        messages = self._build_messages(extraction_prompt)
-        result = await self.llm._agenerate(messages)
-        text = result.generations[0].message.content
+        reply = await self._invoke_cached("research_definition", _EXTRACTION_PROMPT, self.llm)
+        text = reply.content
 
         try:
-            import json
-            import re
-
             # Extract JSON from response
-            json_match = re.search(r"\{[\s\S]*\}", text)
+            json_match = _JSON_OBJECT_RE.search(text)
             if json_match:
-                data = json.loads(json_match.group())
-                return ResearchDefinition(**data)
+                data = orjson.loads(json_match.group())
+                return ResearchDefinition.from_dict(data)
         except Exception as e:
             logger.error("Failed to extract research definition", error=str(e))
 
         return None
 
+    @property
+    def history_dicts(self) -> list[dict]:
+        """Conversation history as role/content dicts, materialized on request."""
+        return [
+            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
+            for msg in self.conversation_history
+        ]
+
     def get_conversation_history(self) -> list[dict]:
-        """Get the full conversation history."""
-        return self.conversation_history.copy()
+        """Get the recent conversation history (the last HISTORY_WINDOW turns).
+
+        Older turns are only kept as the rolling summary; the full transcript
+        lives in the project's stored messages.
+        """
+        return self.history_dicts
 
     def reset(self) -> None:
         """Reset the agent for a new discussion."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._discard_rolling_summary()
+        self._response_cache.clear()
         self.topic = ""
         self.is_ready_for_next_phase = False
         self.research_artifact = self._initial_artifact
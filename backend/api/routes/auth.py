@@ -1,12 +1,12 @@
 """Authentication API routes."""
 
-import json
-import tempfile
-from pathlib import Path
+import asyncio
+import time
+from functools import cache
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import HTMLResponse, RedirectResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from backend.auth.oauth import GeminiOAuth
 from backend.auth.token_manager import TokenManager
@@ -14,53 +14,107 @@ from backend.config import get_settings
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
-# Singleton instances
-_oauth: GeminiOAuth | None = None
-_token_manager: TokenManager | None = None
+# In-process pending auth storage, keyed by the OAuth state parameter.
+# Entries only need to survive the browser redirect to the callback.
+_PENDING_AUTH_TTL = 600.0
+_pending_auth: dict[str, tuple[dict, float]] = {}
+_pending_auth_lock = asyncio.Lock()
 
-# File-based pending auth storage (persists across server restarts)
-_PENDING_AUTH_FILE = Path(tempfile.gettempdir()) / "deep_researcher_pending_auth.json"
 
+def _purge_expired_auth(now: float) -> None:
+    """Drop pending auth entries whose TTL has passed."""
+    expired = [key for key, (_, expires_at) in _pending_auth.items() if expires_at <= now]
+    for key in expired:
+        del _pending_auth[key]
 
-def _save_pending_auth(data: dict) -> None:
-    """Save pending auth state to file."""
-    _PENDING_AUTH_FILE.write_text(json.dumps(data))
 
+async def _save_pending_auth(state: str, data: dict) -> None:
+    """Save pending auth state for a login request."""
+    async with _pending_auth_lock:
+        now = time.monotonic()
+        _purge_expired_auth(now)
+        _pending_auth[state] = (data, now + _PENDING_AUTH_TTL)
 
-def _load_pending_auth() -> dict:
-    """Load pending auth state from file."""
-    try:
-        if _PENDING_AUTH_FILE.exists():
-            return json.loads(_PENDING_AUTH_FILE.read_text())
-    except (json.JSONDecodeError, IOError):
-        pass
-    return {}
 
+async def _load_pending_auth(state: str | None) -> dict | None:
+    """Load pending auth state for a callback.
+
+    Returns:
+        Saved data for the state, or None if missing or expired.
+    """
+    async with _pending_auth_lock:
+        _purge_expired_auth(time.monotonic())
+        entry = _pending_auth.get(state) if state else None
+        return entry[0] if entry else None
+
+
+async def _clear_pending_auth(state: str) -> None:
+    """Clear pending auth state once the callback has consumed it."""
+    async with _pending_auth_lock:
+        _pending_auth.pop(state, None)
 
-def _clear_pending_auth() -> None:
-    """Clear pending auth state file."""
-    try:
-        if _PENDING_AUTH_FILE.exists():
-            _PENDING_AUTH_FILE.unlink()
-    except IOError:
-        pass
 
+# Callback pages, built once at import time
+_ERROR_TEMPLATE = """
+            <html>
+            <head><title>__TITLE__</title></head>
+            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
+                <h1 style="color: red;">__TITLE__</h1>
+                <p>__MESSAGE__</p>
+                <p><a href="http://localhost:3000/">Return to Home</a></p>
+            </body>
+            </html>
+            """
 
+
+def _error_page(title: str, message: str) -> str:
+    """Fill the callback error page template."""
+    return _ERROR_TEMPLATE.replace("__TITLE__", title).replace("__MESSAGE__", message)
+
+
+_NO_PENDING_HTML = _error_page(
+    "Authentication Error",
+    "No pending authentication request. Please try logging in again.",
+).encode()
+_INVALID_STATE_HTML = _error_page(
+    "Authentication Error",
+    "Invalid state parameter. This might be a security issue.",
+).encode()
+_NO_CODE_HTML = _error_page("Authentication Error", "No authorization code received.").encode()
+
+_SUCCESS_TEMPLATE = """
+            <html>
+            <head>
+                <title>Authentication Successful</title>
+                <script>
+                    // Redirect to frontend after short delay
+                    setTimeout(function() {
+                        window.location.href = 'http://localhost:3000__REDIRECT__';
+                    }, 1000);
+                </script>
+            </head>
+            <body style="font-family: system-ui, sans-serif; text-align: center; padding: 50px; background: #0f172a; color: white;">
+                <div style="max-width: 400px; margin: 0 auto;">
+                    <div style="font-size: 48px; margin-bottom: 20px;">✓</div>
+                    <h1 style="color: #22c55e; margin-bottom: 10px;">로그인 성공!</h1>
+                    <p style="color: #94a3b8; margin-bottom: 20px;">환영합니다, __EMAIL__!</p>
+                    <p style="color: #64748b; font-size: 14px;">애플리케이션으로 이동 중...</p>
+                </div>
+            </body>
+            </html>
+            """
+
+
+@cache
 def get_oauth() -> GeminiOAuth:
     """Get or create OAuth instance."""
-    global _oauth, _token_manager
-    if _oauth is None:
-        _token_manager = TokenManager()
-        _oauth = GeminiOAuth(token_manager=_token_manager)
-    return _oauth
+    return GeminiOAuth(token_manager=get_token_manager())
 
 
+@cache
 def get_token_manager() -> TokenManager:
     """Get or create token manager instance."""
-    global _token_manager
-    if _token_manager is None:
-        _token_manager = TokenManager()
-    return _token_manager
+    return TokenManager()
 
 
 class AuthStatus(BaseModel):
@@ -70,12 +124,7 @@ class AuthStatus(BaseModel):
     email: str | None = None
     project_id: str | None = None
     expires_at: float | None = None
-    model: str = ""  # Will be set from settings
-
-    def __init__(self, **data):
-        if "model" not in data or not data["model"]:
-            data["model"] = get_settings().gemini_model
-        super().__init__(**data)
+    model: str = Field(default_factory=lambda: get_settings().gemini_model)
 
 
 class AuthUrlResponse(BaseModel):
@@ -126,8 +175,8 @@ async def get_login_url(redirect: str = Query("/", description="URL to redirect
     oauth = get_oauth()
     auth_url = oauth.get_authorization_url()
 
-    # Store the pending auth state to file (persists across server restarts)
-    _save_pending_auth({
+    # Store the pending auth state under its state token
+    await _save_pending_auth(oauth._state, {
         "code_verifier": oauth._code_verifier,
         "state": oauth._state,
         "redirect_url": redirect,  # Store redirect URL for after login
@@ -147,81 +196,35 @@ async def handle_callback_get(
     error_description: str = Query(None),
 ) -> HTMLResponse:
     """Handle OAuth callback from browser redirect (GET request)."""
-    # Load pending auth from file
-    pending_auth = _load_pending_auth()
+    # Load pending auth for this state
+    pending_auth = await _load_pending_auth(state)
 
     # Check for error from OAuth provider
     if error:
         error_msg = error_description or error
         return HTMLResponse(
-            content=f"""
-            <html>
-            <head><title>Authentication Failed</title></head>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Failed</h1>
-                <p>{error_msg}</p>
-                <p><a href="http://localhost:3000/">Return to Home</a></p>
-            </body>
-            </html>
-            """,
+            content=_error_page("Authentication Failed", error_msg),
             status_code=400,
         )
 
     # Verify we have pending auth state
-    if not pending_auth:
-        return HTMLResponse(
-            content="""
-            <html>
-            <head><title>Authentication Error</title></head>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Error</h1>
-                <p>No pending authentication request. Please try logging in again.</p>
-                <p><a href="http://localhost:3000/">Return to Home</a></p>
-            </body>
-            </html>
-            """,
-            status_code=400,
-        )
+    if pending_auth is None and not _pending_auth:
+        return HTMLResponse(content=_NO_PENDING_HTML, status_code=400)
 
-    # Verify state parameter (CSRF protection)
-    expected_state = pending_auth.get("state")
-    if state != expected_state:
-        return HTMLResponse(
-            content="""
-            <html>
-            <head><title>Authentication Error</title></head>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Error</h1>
-                <p>Invalid state parameter. This might be a security issue.</p>
-                <p><a href="http://localhost:3000/">Return to Home</a></p>
-            </body>
-            </html>
-            """,
-            status_code=400,
-        )
+    # Verify state parameter (CSRF protection): no login is pending under it
+    if pending_auth is None:
+        return HTMLResponse(content=_INVALID_STATE_HTML, status_code=400)
 
     if not code:
-        return HTMLResponse(
-            content="""
-            <html>
-            <head><title>Authentication Error</title></head>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Error</h1>
-                <p>No authorization code received.</p>
-                <p><a href="http://localhost:3000/">Return to Home</a></p>
-            </body>
-            </html>
-            """,
-            status_code=400,
-        )
+        return HTMLResponse(content=_NO_CODE_HTML, status_code=400)
 
     # Restore code_verifier to OAuth instance
     oauth = get_oauth()
     oauth._code_verifier = pending_auth.get("code_verifier")
     oauth._state = pending_auth.get("state")
 
-    # Clear pending auth file
-    _clear_pending_auth()
+    # Clear pending auth entry
+    await _clear_pending_auth(state)
 
     try:
         token_data = await oauth.exchange_code_for_tokens(code)
@@ -231,41 +234,13 @@ async def handle_callback_get(
 
         # Redirect to frontend after successful auth
         return HTMLResponse(
-            content=f"""
-            <html>
-            <head>
-                <title>Authentication Successful</title>
-                <script>
-                    // Redirect to frontend after short delay
-                    setTimeout(function() {{
-                        window.location.href = 'http://localhost:3000{redirect_url}';
-                    }}, 1000);
-                </script>
-            </head>
-            <body style="font-family: system-ui, sans-serif; text-align: center; padding: 50px; background: #0f172a; color: white;">
-                <div style="max-width: 400px; margin: 0 auto;">
-                    <div style="font-size: 48px; margin-bottom: 20px;">✓</div>
-                    <h1 style="color: #22c55e; margin-bottom: 10px;">로그인 성공!</h1>
-                    <p style="color: #94a3b8; margin-bottom: 20px;">환영합니다, {token_data.email}!</p>
-                    <p style="color: #64748b; font-size: 14px;">애플리케이션으로 이동 중...</p>
-                </div>
-            </body>
-            </html>
-            """,
+            content=_SUCCESS_TEMPLATE.replace("__REDIRECT__", redirect_url)
+            .replace("__EMAIL__", str(token_data.email)),
             status_code=200,
         )
     except Exception as e:
         return HTMLResponse(
-            content=f"""
-            <html>
-            <head><title>Authentication Error</title></head>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Error</h1>
-                <p>{str(e)}</p>
-                <p><a href="http://localhost:3000/">Return to Home</a></p>
-            </body>
-            </html>
-            """,
+            content=_error_page("Authentication Error", str(e)),
             status_code=400,
         )
 
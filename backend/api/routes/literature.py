@@ -8,16 +8,18 @@ v3.1: Non-conversational document management for PDF → MD conversion.
 Note: Literature Search (web search) is in a separate module.
 """
 import asyncio
-import tempfile
+import re
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
+import aiofiles
 import structlog
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import Response
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from backend.orchestrator.state import (
     ProcessStatus,
@@ -28,46 +30,55 @@ from backend.orchestrator.state import (
 )
 from backend.storage.project_store import (
     save_project,
+    schedule_project_save,
     project_to_dict,
     dict_to_project,
 )
-from backend.tools.pdf_processor import PDFProcessor
+from backend.tools.pdf_processor import PDFProcessor, PDF_STREAM_CHUNK_SIZE
 from backend.agents.pdf_summary import PDFSummaryProcessor, FastPDFSummarizer
-from backend.storage.paper_files import save_literature_paper, delete_literature_paper
+from backend.storage.paper_files import (
+    save_literature_paper,
+    delete_literature_paper,
+    get_literature_paper_path,
+    ensure_paper_folder,
+    save_paper_full_text,
+    read_paper_full_text,
+)
 
 logger = structlog.get_logger(__name__)
 
-# Global PDF processors (lazy initialized)
-_pdf_processor: Optional[PDFProcessor] = None
-_pdf_summary_processor: Optional[PDFSummaryProcessor] = None
-_fast_pdf_summarizer: Optional[FastPDFSummarizer] = None
-
-
+# Global PDF processors (created on first use)
+@cache
 def get_pdf_processor() -> PDFProcessor:
     """Get or create PDF processor instance."""
-    global _pdf_processor
-    if _pdf_processor is None:
-        _pdf_processor = PDFProcessor()
-    return _pdf_processor
+    return PDFProcessor()
 
 
+@cache
 def get_pdf_summary_processor() -> PDFSummaryProcessor:
     """Get or create PDF summary processor instance."""
-    global _pdf_summary_processor
-    if _pdf_summary_processor is None:
-        _pdf_summary_processor = PDFSummaryProcessor()
-    return _pdf_summary_processor
+    return PDFSummaryProcessor()
 
 
+@cache
 def get_fast_pdf_summarizer() -> FastPDFSummarizer:
     """Get or create fast PDF summarizer instance (uses Gemini 2.0 Flash)."""
-    global _fast_pdf_summarizer
-    if _fast_pdf_summarizer is None:
-        _fast_pdf_summarizer = FastPDFSummarizer()
-    return _fast_pdf_summarizer
+    return FastPDFSummarizer()
 
 router = APIRouter(prefix="/api/research/v3", tags=["literature-organization"])
 
+# Characters replaced in download filenames (\w keeps Unicode letters such as Hangul)
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w \-]")
+
+# AddPaperRequest.source values -> PaperSource (anything else is an upload)
+_PAPER_SOURCES = {
+    "arXiv": PaperSource.ARXIV,
+    "S2": PaperSource.SEMANTIC_SCHOLAR,
+    "semantic_scholar": PaperSource.SEMANTIC_SCHOLAR,
+    "GS": PaperSource.GOOGLE_SCHOLAR,
+    "google_scholar": PaperSource.GOOGLE_SCHOLAR,
+}
+
 # Reference to _projects from main research router (will be set on app startup)
 _projects: dict = {}
 
@@ -98,6 +109,16 @@ def save_project_v3(project) -> None:
     save_project(project_dict)
 
 
+def save_project_v3_soon(project) -> None:
+    """Save v3 project, deferring the file write.
+
+    Used by background tasks so that bursts of saves are written once.
+    """
+    project_dict = project_to_dict(project)
+    _projects[project.id] = project_dict
+    schedule_project_save(project_dict)
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -105,10 +126,12 @@ def save_project_v3(project) -> None:
 class LiteratureOrganizationStateResponse(BaseModel):
     """Response for Literature Organization process state."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str
     is_locked: bool  # Always False for Literature Organization
     papers_folder: str
-    papers: list[dict]
+    papers: list[PaperEntry]
     master_md: str
 
 
@@ -125,33 +148,80 @@ class AddPaperRequest(BaseModel):
     full_text: Optional[str] = Field(default=None, description="Full text of the paper for better summarization")
 
 
-class PaperResponse(BaseModel):
-    """Response with paper details."""
+class PaperSummary(BaseModel):
+    """Paper metadata returned by the paper listing."""
+
+    model_config = ConfigDict(frozen=True)
 
     id: str
     type: str
     title: str
     authors: list[str]
     year: Optional[int]
+    status: str
+
+
+class PaperListResponse(BaseModel):
+    """Response for the paper listing."""
+
+    model_config = ConfigDict(frozen=True)
+
+    total: int
+    papers: list[PaperSummary]
+
+
+class PaperResponse(PaperSummary):
+    """Response with paper details."""
+
     source: str
     pdf_url: Optional[str]
     doi: Optional[str]
     abstract: str
     md_file: str
     md_content: str = ""
-    status: str
     added_at: str
 
 
 class ProcessPaperResponse(BaseModel):
     """Response from processing a paper."""
 
+    model_config = ConfigDict(frozen=True)
+
     paper_id: str
     status: str
     md_file: str
     message: str
 
 
+# Dumps a whole paper list in one pydantic-core call
+_PAPER_LIST_ADAPTER = TypeAdapter(list[PaperEntry])
+# Per-paper fields kept in the listing (summaries and full text stay out)
+_PAPER_SUMMARY_INCLUDE = {"__all__": set(PaperSummary.model_fields)}
+
+
+def _paper_response(paper: PaperEntry) -> PaperResponse:
+    """Build a PaperResponse from a stored paper entry.
+
+    The entry was validated as a PaperEntry already, so the response is
+    constructed without re-running field validation.
+    """
+    return PaperResponse.model_construct(
+        id=paper.id,
+        type=paper.type.value,
+        title=paper.title,
+        authors=paper.authors,
+        year=paper.year,
+        source=paper.source.value,
+        pdf_url=paper.pdf_url,
+        doi=paper.doi,
+        abstract=paper.abstract,
+        md_file=paper.md_file,
+        md_content=paper.md_content,
+        status=paper.status.value,
+        added_at=paper.added_at,
+    )
+
+
 # =============================================================================
 # Literature Organization Process Routes (Always Unlocked)
 # =============================================================================
@@ -168,18 +238,23 @@ async def get_literature_organization_process(project_id: str) -> LiteratureOrga
 
     process = project.processes.literature_organization
 
-    return LiteratureOrganizationStateResponse(
+    # Built from the validated project state; skip re-validation
+    return LiteratureOrganizationStateResponse.model_construct(
         status=process.status.value if hasattr(process.status, 'value') else process.status,
         is_locked=False,  # Always unlocked
         papers_folder=process.papers_folder,
-        papers=[p.model_dump() for p in process.state.papers],
+        papers=process.state.papers,
         master_md=process.state.master_md,
     )
 
 
-@router.get("/{project_id}/process/literature-organization/papers")
+@router.get("/{project_id}/process/literature-organization/papers", response_model=PaperListResponse)
 async def list_papers(project_id: str) -> dict:
-    """Get all papers in Literature Organization."""
+    """Get all papers in Literature Organization.
+
+    Each paper carries the PaperSummary fields only; the generated summary
+    is available from the single-paper endpoint.
+    """
     project = get_project_v3(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -188,7 +263,7 @@ async def list_papers(project_id: str) -> dict:
 
     return {
         "total": len(papers),
-        "papers": [p.model_dump() for p in papers],
+        "papers": _PAPER_LIST_ADAPTER.dump_python(papers, include=_PAPER_SUMMARY_INCLUDE),
     }
 
 
@@ -200,30 +275,12 @@ async def get_paper(project_id: str, paper_id: str) -> PaperResponse:
         raise HTTPException(status_code=404, detail="Project not found")
 
     # Find paper
-    paper = None
-    for p in project.processes.literature_organization.state.papers:
-        if p.id == paper_id:
-            paper = p
-            break
+    paper = project.processes.literature_organization.state.find_paper(paper_id)
 
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    return PaperResponse(
-        id=paper.id,
-        type=paper.type.value,
-        title=paper.title,
-        authors=paper.authors,
-        year=paper.year,
-        source=paper.source.value,
-        pdf_url=paper.pdf_url,
-        doi=paper.doi,
-        abstract=paper.abstract,
-        md_file=paper.md_file,
-        md_content=paper.md_content,
-        status=paper.status.value,
-        added_at=paper.added_at,
-    )
+    return _paper_response(paper)
 
 
 @router.get("/{project_id}/process/literature-organization/papers/{paper_id}/download")
@@ -237,11 +294,7 @@ async def download_paper_md(project_id: str, paper_id: str) -> Response:
         raise HTTPException(status_code=404, detail="Project not found")
 
     # Find paper
-    paper = None
-    for p in project.processes.literature_organization.state.papers:
-        if p.id == paper_id:
-            paper = p
-            break
+    paper = project.processes.literature_organization.state.find_paper(paper_id)
 
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
@@ -250,10 +303,24 @@ async def download_paper_md(project_id: str, paper_id: str) -> Response:
         raise HTTPException(status_code=404, detail="Paper summary not yet generated")
 
     # Create safe filename from title
-    safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in paper.title[:50])
+    safe_title = _UNSAFE_FILENAME_CHARS_RE.sub("_", paper.title[:50])
     safe_title = safe_title.strip().replace(' ', '_')
     filename = f"{safe_title}_{paper_id}.md"
 
+    # Serve the file written by save_literature_paper directly when present.
+    # Failure paths only update md_content, so the file may hold an older summary
+    md_path = (
+        get_literature_paper_path(project_id, paper_id, paper.title)
+        if paper.status == PaperStatus.COMPLETED
+        else None
+    )
+    if md_path:
+        return FileResponse(
+            md_path,
+            filename=filename,
+            media_type="text/markdown; charset=utf-8",
+        )
+
     return Response(
         content=paper.md_content.encode('utf-8'),
         media_type="text/markdown; charset=utf-8",
@@ -280,16 +347,17 @@ async def add_paper(
     # No lock check - Literature Organization is always unlocked
 
     # Generate unique paper ID
-    paper_id = f"paper_{len(project.processes.literature_organization.state.papers) + 1:03d}"
+    paper_id = project.processes.literature_organization.state.new_paper_id("paper")
 
     # Determine source
-    source = PaperSource.UPLOAD
-    if request.source == "arXiv":
-        source = PaperSource.ARXIV
-    elif request.source in ["S2", "semantic_scholar"]:
-        source = PaperSource.SEMANTIC_SCHOLAR
-    elif request.source in ["GS", "google_scholar"]:
-        source = PaperSource.GOOGLE_SCHOLAR
+    source = _PAPER_SOURCES.get(request.source, PaperSource.UPLOAD)
+
+    # Full text is kept in the paper folder rather than in the project file
+    full_text_length = 0
+    if request.full_text and await asyncio.to_thread(
+        save_paper_full_text, project_id, paper_id, request.full_text
+    ):
+        full_text_length = len(request.full_text)
 
     # Create paper entry
     paper_entry = PaperEntry(
@@ -302,7 +370,7 @@ async def add_paper(
         pdf_url=request.pdf_url,
         doi=request.doi,
         abstract=request.abstract,
-        full_text=request.full_text,
+        full_text_length=full_text_length,
         md_file=f"{paper_id}.md",
         status=PaperStatus.PENDING,
     )
@@ -313,21 +381,7 @@ async def add_paper(
 
     logger.info("Paper added manually", project_id=project_id, paper_id=paper_id)
 
-    return PaperResponse(
-        id=paper_entry.id,
-        type=paper_entry.type.value,
-        title=paper_entry.title,
-        authors=paper_entry.authors,
-        year=paper_entry.year,
-        source=paper_entry.source.value,
-        pdf_url=paper_entry.pdf_url,
-        doi=paper_entry.doi,
-        abstract=paper_entry.abstract,
-        md_file=paper_entry.md_file,
-        md_content=paper_entry.md_content,
-        status=paper_entry.status.value,
-        added_at=paper_entry.added_at,
-    )
+    return _paper_response(paper_entry)
 
 
 @router.delete("/{project_id}/process/literature-organization/papers/{paper_id}")
@@ -343,17 +397,12 @@ async def delete_paper(project_id: str, paper_id: str) -> dict:
     # No lock check - Literature Organization is always unlocked
 
     # Find and remove paper
-    papers = project.processes.literature_organization.state.papers
-    paper_index = None
-    for i, p in enumerate(papers):
-        if p.id == paper_id:
-            paper_index = i
-            break
-
-    if paper_index is None:
+    state = project.processes.literature_organization.state
+    removed_paper = state.find_paper(paper_id)
+    if removed_paper is None:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    removed_paper = papers.pop(paper_index)
+    state.papers.remove(removed_paper)
 
     # Save project
     save_project_v3(project)
@@ -408,12 +457,14 @@ async def reset_literature_organization(
         papers = project.processes.literature_organization.state.papers
         deleted_count = len(papers)
 
-        # Delete all paper files
-        for paper in papers:
-            try:
-                delete_literature_paper(project_id, paper.id)
-            except Exception as e:
-                logger.warning("Failed to delete paper file", paper_id=paper.id, error=str(e))
+        # Delete all paper files (independent filesystem work, run in worker threads)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(delete_literature_paper, project_id, paper.id) for paper in papers),
+            return_exceptions=True,
+        )
+        for paper, result in zip(papers, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to delete paper file", paper_id=paper.id, error=str(result))
 
         # Clear papers list
         project.processes.literature_organization.state.papers = []
@@ -452,11 +503,7 @@ async def process_paper(project_id: str, paper_id: str, background_tasks: Backgr
     # No lock check - Literature Organization is always unlocked
 
     # Find paper
-    paper = None
-    for p in project.processes.literature_organization.state.papers:
-        if p.id == paper_id:
-            paper = p
-            break
+    paper = project.processes.literature_organization.state.find_paper(paper_id)
 
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
@@ -482,8 +529,24 @@ async def process_paper(project_id: str, paper_id: str, background_tasks: Backgr
     )
 
 
+# Papers summarized at once; more queued papers wait for a slot (Gemini rate limits)
+MAX_CONCURRENT_PAPER_TASKS = 5
+_paper_task_slots = asyncio.Semaphore(MAX_CONCURRENT_PAPER_TASKS)
+
+
 async def process_paper_with_llm_background(project_id: str, paper_id: str):
-    """Background task to process a paper with FastPDFSummarizer (Gemini 2.0 Flash).
+    """Background task to process a paper, limited to MAX_CONCURRENT_PAPER_TASKS at once.
+
+    Args:
+        project_id: Project ID.
+        paper_id: Paper ID.
+    """
+    async with _paper_task_slots:
+        await _process_paper_with_llm(project_id, paper_id)
+
+
+async def _process_paper_with_llm(project_id: str, paper_id: str):
+    """Process a paper with FastPDFSummarizer (Gemini 2.0 Flash).
 
     This uses the fast summarization pipeline:
     1. Use full_text if available (direct text input)
@@ -503,11 +566,7 @@ async def process_paper_with_llm_background(project_id: str, paper_id: str):
         if not project:
             return
 
-        paper = None
-        for p in project.processes.literature_organization.state.papers:
-            if p.id == paper_id:
-                paper = p
-                break
+        paper = project.processes.literature_organization.state.find_paper(paper_id)
 
         if not paper:
             return
@@ -517,9 +576,11 @@ async def process_paper_with_llm_background(project_id: str, paper_id: str):
         research_definition = project.processes.research_experiment.research_definition_artifact or ""
 
         # Priority 1: Use full_text if available
-        if paper.full_text and len(paper.full_text.strip()) > 100:
-            logger.info("Using full_text for summarization", paper_id=paper_id, text_length=len(paper.full_text))
-            await _generate_summary_from_metadata(project_id, paper_id, research_topic, research_definition)
+        if paper.full_text_length > 100:
+            logger.info("Using full_text for summarization", paper_id=paper_id, text_length=paper.full_text_length)
+            await _generate_summary_from_metadata(
+                project_id, paper_id, research_topic, research_definition, project=project
+            )
             return
 
         pdf_processor = get_pdf_processor()
@@ -536,11 +597,7 @@ async def process_paper_with_llm_background(project_id: str, paper_id: str):
 
                     # Update paper with extracted data
                     project = get_project_v3(project_id)
-                    paper = None
-                    for p in project.processes.literature_organization.state.papers:
-                        if p.id == paper_id:
-                            paper = p
-                            break
+                    paper = project.processes.literature_organization.state.find_paper(paper_id)
 
                     if paper:
                         # Update title if LLM extracted a better one
@@ -557,23 +614,22 @@ async def process_paper_with_llm_background(project_id: str, paper_id: str):
 
                         # Add DOI/PDF links to md_content if available
                         if paper.doi or paper.pdf_url:
-                            links_section = "\n## 링크 (Links)\n"
+                            links = ["\n## 링크 (Links)\n"]
                             if paper.doi:
-                                links_section += f"- **DOI**: [{paper.doi}](https://doi.org/{paper.doi})\n"
+                                links.append(f"- **DOI**: [{paper.doi}](https://doi.org/{paper.doi})\n")
                             if paper.pdf_url:
-                                links_section += f"- **PDF**: [PDF 다운로드]({paper.pdf_url})\n"
-                            # Insert links section after the first heading
+                                links.append(f"- **PDF**: [PDF 다운로드]({paper.pdf_url})\n")
+                            links_section = "".join(links)
+                            # Insert links section after the title heading (before the first section)
                             if "\n## " in md_content:
-                                # Insert after the title heading
-                                first_section_idx = md_content.find("\n## ")
-                                md_content = md_content[:first_section_idx] + links_section + md_content[first_section_idx:]
+                                md_content = md_content.replace("\n## ", f"{links_section}\n## ", 1)
                             else:
-                                md_content = md_content + "\n" + links_section
+                                md_content = f"{md_content}\n{links_section}"
 
                         # Set markdown content
                         paper.md_content = md_content
                         paper.status = PaperStatus.COMPLETED
-                        save_project_v3(project)
+                        save_project_v3_soon(project)
                         # Save to file
                         save_literature_paper(project_id, paper_id, paper.title, md_content)
 
@@ -599,17 +655,64 @@ async def process_paper_with_llm_background(project_id: str, paper_id: str):
         try:
             project = get_project_v3(project_id)
             if project:
-                for p in project.processes.literature_organization.state.papers:
-                    if p.id == paper_id:
-                        p.status = PaperStatus.FAILED
-                        p.md_content = f"# Processing Failed\n\nError: {str(e)}"
-                        break
-                save_project_v3(project)
+                paper = project.processes.literature_organization.state.find_paper(paper_id)
+                if paper:
+                    paper.status = PaperStatus.FAILED
+                    paper.md_content = f"# Processing Failed\n\nError: {str(e)}"
+                save_project_v3_soon(project)
         except:
             pass
 
 
-async def _generate_summary_from_metadata(project_id: str, paper_id: str, research_topic: str, research_definition: str = ""):
+_METADATA_ONLY_NOTE = (
+    "## Note\n"
+    "LLM summarization was not available. This is a basic summary based on paper metadata."
+)
+
+
+def _paper_markdown(paper: PaperEntry, section: str) -> str:
+    """Render a paper's metadata and abstract followed by a closing section.
+
+    Args:
+        paper: Paper to describe.
+        section: Markdown section placed after the abstract.
+
+    Returns:
+        Paper markdown document.
+    """
+    authors_str = ", ".join(paper.authors[:5]) if paper.authors else "Unknown"
+    if paper.authors and len(paper.authors) > 5:
+        authors_str += " et al."
+
+    doi_str = f"[{paper.doi}](https://doi.org/{paper.doi})" if paper.doi else "N/A"
+    pdf_str = f"[PDF 다운로드]({paper.pdf_url})" if paper.pdf_url else "N/A"
+
+    return f"""# {paper.title}
+
+## Metadata
+- **Authors**: {authors_str}
+- **Year**: {paper.year or 'Unknown'}
+- **Source**: {paper.source.value if hasattr(paper.source, 'value') else paper.source}
+- **DOI**: {doi_str}
+- **PDF**: {pdf_str}
+
+## Abstract
+{paper.abstract or 'No abstract available.'}
+
+{section}
+
+---
+*Processed by DeepResearcher on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC*
+"""
+
+
+async def _generate_summary_from_metadata(
+    project_id: str,
+    paper_id: str,
+    research_topic: str,
+    research_definition: str = "",
+    project=None,
+):
     """Generate a summary from paper metadata or full text using Gemini 2.0 Flash.
 
     If full_text is available, uses that for more accurate summarization.
@@ -620,16 +723,14 @@ async def _generate_summary_from_metadata(project_id: str, paper_id: str, resear
         paper_id: Paper ID.
         research_topic: Research topic for context.
         research_definition: Full Research Definition content for relevance analysis.
+        project: Project the caller has just loaded, to avoid loading it again.
     """
-    project = get_project_v3(project_id)
+    if project is None:
+        project = get_project_v3(project_id)
     if not project:
         return
 
-    paper = None
-    for p in project.processes.literature_organization.state.papers:
-        if p.id == paper_id:
-            paper = p
-            break
+    paper = project.processes.literature_organization.state.find_paper(paper_id)
 
     if not paper:
         return
@@ -639,9 +740,12 @@ async def _generate_summary_from_metadata(project_id: str, paper_id: str, resear
         fast_summarizer = get_fast_pdf_summarizer()
 
         # Use full_text if available, otherwise build text from metadata
-        if paper.full_text and len(paper.full_text.strip()) > 100:
+        full_text = None
+        if paper.full_text_length:
+            full_text = await asyncio.to_thread(read_paper_full_text, project_id, paper_id)
+        if full_text and len(full_text.strip()) > 100:
             # Use full text for better summarization
-            text = paper.full_text
+            text = full_text
             logger.info("Using full text for summarization", paper_id=paper_id, text_length=len(text))
         else:
             # Fall back to metadata
@@ -653,44 +757,11 @@ Abstract: {paper.abstract or 'No abstract available.'}"""
 
         response = await fast_summarizer.summarize_text(text, paper.title, research_topic, research_definition)
 
-        # Build markdown content
-        authors_str = ", ".join(paper.authors[:5]) if paper.authors else "Unknown"
-        if paper.authors and len(paper.authors) > 5:
-            authors_str += " et al."
-
-        # Build DOI link
-        doi_str = "N/A"
-        if paper.doi:
-            doi_str = f"[{paper.doi}](https://doi.org/{paper.doi})"
-
-        # Build PDF link
-        pdf_str = "N/A"
-        if paper.pdf_url:
-            pdf_str = f"[PDF 다운로드]({paper.pdf_url})"
-
-        md_content = f"""# {paper.title}
-
-## Metadata
-- **Authors**: {authors_str}
-- **Year**: {paper.year or 'Unknown'}
-- **Source**: {paper.source.value if hasattr(paper.source, 'value') else paper.source}
-- **DOI**: {doi_str}
-- **PDF**: {pdf_str}
-
-## Abstract
-{paper.abstract or 'No abstract available.'}
-
-## AI Analysis
-
-{response}
-
----
-*Processed by DeepResearcher on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC*
-"""
+        md_content = _paper_markdown(paper, f"## AI Analysis\n\n{response}")
 
         paper.md_content = md_content
         paper.status = PaperStatus.COMPLETED
-        save_project_v3(project)
+        save_project_v3_soon(project)
         # Save to file
         save_literature_paper(project_id, paper_id, paper.title, md_content)
 
@@ -700,67 +771,45 @@ Abstract: {paper.abstract or 'No abstract available.'}"""
         logger.error("Metadata summary generation failed", error=str(e))
 
         # Fallback to basic markdown
-        authors_str = ", ".join(paper.authors[:5]) if paper.authors else "Unknown"
-        if paper.authors and len(paper.authors) > 5:
-            authors_str += " et al."
-
-        # Build DOI link
-        doi_str = "N/A"
-        if paper.doi:
-            doi_str = f"[{paper.doi}](https://doi.org/{paper.doi})"
-
-        # Build PDF link
-        pdf_str = "N/A"
-        if paper.pdf_url:
-            pdf_str = f"[PDF 다운로드]({paper.pdf_url})"
-
-        fallback_md = f"""# {paper.title}
-
-## Metadata
-- **Authors**: {authors_str}
-- **Year**: {paper.year or 'Unknown'}
-- **Source**: {paper.source.value if hasattr(paper.source, 'value') else paper.source}
-- **DOI**: {doi_str}
-- **PDF**: {pdf_str}
-
-## Abstract
-{paper.abstract or 'No abstract available.'}
-
-## Note
-LLM summarization was not available. This is a basic summary based on paper metadata.
-
----
-*Processed by DeepResearcher on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC*
-"""
+        fallback_md = _paper_markdown(paper, _METADATA_ONLY_NOTE)
         paper.md_content = fallback_md
         paper.status = PaperStatus.COMPLETED
-        save_project_v3(project)
+        save_project_v3_soon(project)
         # Save to file
         save_literature_paper(project_id, paper_id, paper.title, fallback_md)
 
 
-@router.get("/{project_id}/process/literature-organization/master")
-async def get_master_md(project_id: str) -> dict:
-    """Get the master MD file content (reference list).
+def _authors_cell(authors: list[str]) -> str:
+    """Format the first three authors for a reference table row."""
+    authors_str = ", ".join(authors[:3])
+    if len(authors) > 3:
+        authors_str += "..."
+    return authors_str
 
-    Returns auto-generated master reference document.
-    """
-    project = get_project_v3(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
 
+def _build_master_md(project) -> tuple[str, str, dict]:
+    """Build the master reference list response for a project.
+
+    Returns:
+        Document text before and after the generation timestamp, and the
+        other response fields.
+    """
     papers = project.processes.literature_organization.state.papers
-    topic = project.topic
 
-    # Generate master MD content
-    search_papers = [p for p in papers if p.type == PaperType.SEARCH]
-    upload_papers = [p for p in papers if p.type == PaperType.UPLOAD]
+    # Split papers by origin in one pass
+    search_papers = []
+    upload_papers = []
+    for paper in papers:
+        if paper.type == PaperType.SEARCH:
+            search_papers.append(paper)
+        elif paper.type == PaperType.UPLOAD:
+            upload_papers.append(paper)
 
-    md_content = f"""# Literature Reference List
+    parts = [f"""# Literature Reference List
 
 ## Project Information
-- **Research Topic**: {topic}
-- **Generated At**: {datetime.utcnow().isoformat()}
+- **Research Topic**: {project.topic}
+- **Generated At**: """, f"""
 - **Total Papers**: {len(papers)}
 
 ---
@@ -769,47 +818,72 @@ async def get_master_md(project_id: str) -> dict:
 
 | # | Title | Authors | Year | Source | Status |
 |---|-------|---------|------|--------|--------|
-"""
-
-    for i, paper in enumerate(search_papers, 1):
-        authors_str = ", ".join(paper.authors[:3])
-        if len(paper.authors) > 3:
-            authors_str += "..."
-        md_content += f"| {i} | {paper.title[:50]}... | {authors_str} | {paper.year or 'N/A'} | {paper.source.value} | {paper.status.value} |\n"
+"""]
+    parts.extend(
+        f"| {i} | {paper.title[:50]}... | {_authors_cell(paper.authors)} | {paper.year or 'N/A'} | {paper.source.value} | {paper.status.value} |\n"
+        for i, paper in enumerate(search_papers, 1)
+    )
 
-    md_content += f"""
+    parts.append(f"""
 ---
 
 ## Uploaded Papers ({len(upload_papers)} papers)
 
 | # | Title | Authors | Year | Status |
 |---|-------|---------|------|--------|
-"""
-
-    for i, paper in enumerate(upload_papers, 1):
-        authors_str = ", ".join(paper.authors[:3])
-        if len(paper.authors) > 3:
-            authors_str += "..."
-        md_content += f"| {i} | {paper.title[:50]}... | {authors_str} | {paper.year or 'N/A'} | {paper.status.value} |\n"
+""")
+    parts.extend(
+        f"| {i} | {paper.title[:50]}... | {_authors_cell(paper.authors)} | {paper.year or 'N/A'} | {paper.status.value} |\n"
+        for i, paper in enumerate(upload_papers, 1)
+    )
 
-    md_content += """
+    parts.append("""
 ---
 *Generated by DeepResearcher*
-"""
+""")
 
-    return {
+    return parts[0], "".join(parts[1:]), {
         "filename": project.processes.literature_organization.state.master_md,
-        "content": md_content,
         "total_papers": len(papers),
         "search_papers": len(search_papers),
         "upload_papers": len(upload_papers),
     }
 
 
+# project_id -> (stored project record, master MD parts built from it)
+_master_md_cache: dict[str, tuple[object, str, str, dict]] = {}
+
+
+def forget_master_md(project_id: str) -> None:
+    """Drop the cached master MD of a deleted project."""
+    _master_md_cache.pop(project_id, None)
+
+
+@router.get("/{project_id}/process/literature-organization/master")
+async def get_master_md(project_id: str) -> dict:
+    """Get the master MD file content (reference list).
+
+    Returns auto-generated master reference document. Saving a project
+    replaces its stored record, so the cached document is rebuilt after
+    any change. The generation timestamp is filled in on every request.
+    """
+    record = _projects.get(project_id)
+    cached = _master_md_cache.get(project_id)
+    if cached is None or record is None or cached[0] is not record:
+        project = get_project_v3(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        cached = (record, *_build_master_md(project))
+        _master_md_cache[project_id] = cached
+
+    _, head, body, fields = cached
+    return {**fields, "content": f"{head}{datetime.utcnow().isoformat()}{body}"}
+
+
 async def process_uploaded_pdf_background(
     project_id: str,
     paper_id: str,
-    pdf_content: bytes,
+    pdf_path: Path,
     original_filename: str,
 ):
     """Background task to process uploaded PDF with FastPDFSummarizer (Gemini 2.0 Flash).
@@ -822,8 +896,8 @@ async def process_uploaded_pdf_background(
     Args:
         project_id: Project ID.
         paper_id: Paper ID.
-        pdf_content: PDF file content bytes.
-        original_filename: Original filename for temp file.
+        pdf_path: Path to the uploaded PDF in the paper's folder.
+        original_filename: Original filename of the upload.
     """
     logger.info("Starting background PDF processing (FastPDFSummarizer)", project_id=project_id, paper_id=paper_id)
 
@@ -834,11 +908,7 @@ async def process_uploaded_pdf_background(
             logger.error("Project not found in background task", project_id=project_id)
             return
 
-        paper = None
-        for p in project.processes.literature_organization.state.papers:
-            if p.id == paper_id:
-                paper = p
-                break
+        paper = project.processes.literature_organization.state.find_paper(paper_id)
 
         if not paper:
             logger.error("Paper not found in background task", paper_id=paper_id)
@@ -846,59 +916,44 @@ async def process_uploaded_pdf_background(
 
         # Update status to processing
         paper.status = PaperStatus.PROCESSING
-        save_project_v3(project)
-
-        # Save PDF to temp file
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-            tmp_file.write(pdf_content)
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            # Get research topic for context
-            research_topic = project.topic
+        save_project_v3_soon(project)
 
-            # Use FastPDFSummarizer (Gemini 2.0 Flash) for quick summarization
-            fast_summarizer = get_fast_pdf_summarizer()
-            md_content, metadata = await fast_summarizer.summarize_pdf(tmp_path, research_topic)
+        # Get research topic for context
+        research_topic = project.topic
 
-            # Re-fetch project to avoid stale state
-            project = get_project_v3(project_id)
-            paper = None
-            for p in project.processes.literature_organization.state.papers:
-                if p.id == paper_id:
-                    paper = p
-                    break
+        # Use FastPDFSummarizer (Gemini 2.0 Flash) for quick summarization
+        fast_summarizer = get_fast_pdf_summarizer()
+        md_content, metadata = await fast_summarizer.summarize_pdf(
+            pdf_path, research_topic, filename=original_filename
+        )
 
-            if not paper:
-                return
+        # Re-fetch project to avoid stale state
+        project = get_project_v3(project_id)
+        paper = project.processes.literature_organization.state.find_paper(paper_id)
 
-            # Update paper with extracted metadata
-            if metadata.get("title") and metadata["title"] != original_filename.replace(".pdf", ""):
-                paper.title = metadata["title"]
+        if not paper:
+            return
 
-            if metadata.get("authors"):
-                paper.authors = metadata["authors"]
+        # Update paper with extracted metadata
+        if metadata.get("title") and metadata["title"] != original_filename.replace(".pdf", ""):
+            paper.title = metadata["title"]
 
-            if metadata.get("summary"):
-                paper.abstract = metadata["summary"]
+        if metadata.get("authors"):
+            paper.authors = metadata["authors"]
 
-            # Set markdown content
-            paper.md_content = md_content
-            paper.status = PaperStatus.COMPLETED
+        if metadata.get("summary"):
+            paper.abstract = metadata["summary"]
 
-            logger.info("PDF processed successfully with FastPDFSummarizer",
-                       project_id=project_id,
-                       paper_id=paper_id,
-                       title=paper.title[:50] if paper.title else "Unknown")
+        # Set markdown content
+        paper.md_content = md_content
+        paper.status = PaperStatus.COMPLETED
 
-        finally:
-            # Clean up temp file
-            try:
-                tmp_path.unlink()
-            except:
-                pass
+        logger.info("PDF processed successfully with FastPDFSummarizer",
+                   project_id=project_id,
+                   paper_id=paper_id,
+                   title=paper.title[:50] if paper.title else "Unknown")
 
-        save_project_v3(project)
+        save_project_v3_soon(project)
         # Save to file
         if paper.md_content:
             save_literature_paper(project_id, paper_id, paper.title, paper.md_content)
@@ -910,12 +965,11 @@ async def process_uploaded_pdf_background(
         try:
             project = get_project_v3(project_id)
             if project:
-                for p in project.processes.literature_organization.state.papers:
-                    if p.id == paper_id:
-                        p.status = PaperStatus.FAILED
-                        p.md_content = f"# Processing Failed\n\nError: {str(e)}"
-                        break
-                save_project_v3(project)
+                paper = project.processes.literature_organization.state.find_paper(paper_id)
+                if paper:
+                    paper.status = PaperStatus.FAILED
+                    paper.md_content = f"# Processing Failed\n\nError: {str(e)}"
+                save_project_v3_soon(project)
         except:
             pass
 
@@ -1037,11 +1091,14 @@ async def upload_paper_pdf(
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    # Read PDF content
-    pdf_content = await file.read()
-
     # Generate unique paper ID
-    paper_id = f"upload_{len(project.processes.literature_organization.state.papers) + 1:03d}"
+    paper_id = project.processes.literature_organization.state.new_paper_id("upload")
+
+    # Stream the upload into the paper folder instead of reading it into memory
+    pdf_path = ensure_paper_folder(project_id, paper_id) / f"{paper_id}.pdf"
+    async with aiofiles.open(pdf_path, "wb") as f:
+        while chunk := await file.read(PDF_STREAM_CHUNK_SIZE):
+            await f.write(chunk)
 
     # Parse authors
     authors_list = [a.strip() for a in authors.split(",")] if authors else []
@@ -1070,24 +1127,10 @@ async def upload_paper_pdf(
         process_uploaded_pdf_background,
         project_id,
         paper_id,
-        pdf_content,
+        pdf_path,
         file.filename,
     )
 
     logger.info("Paper uploaded, processing started", project_id=project_id, paper_id=paper_id, filename=file.filename)
 
-    return PaperResponse(
-        id=paper_entry.id,
-        type=paper_entry.type.value,
-        title=paper_entry.title,
-        authors=paper_entry.authors,
-        year=paper_entry.year,
-        source=paper_entry.source.value,
-        pdf_url=paper_entry.pdf_url,
-        doi=paper_entry.doi,
-        abstract=paper_entry.abstract,
-        md_file=paper_entry.md_file,
-        md_content=paper_entry.md_content,
-        status=paper_entry.status.value,
-        added_at=paper_entry.added_at,
-    )
+    return _paper_response(paper_entry)
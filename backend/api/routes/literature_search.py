@@ -6,7 +6,11 @@ v3.1: Web search for academic papers.
 
 Note: PDF upload/processing is in literature.py (Literature Organization).
 """
+import asyncio
+import re
+from collections import OrderedDict
 from datetime import datetime
+from hashlib import blake2b
 from typing import Optional
 
 import structlog
@@ -22,15 +26,44 @@ from backend.orchestrator.state import (
 )
 from backend.storage.project_store import (
     save_project,
+    schedule_project_save,
     project_to_dict,
     dict_to_project,
 )
-from backend.agents.literature_searcher import LiteratureSearcherAgent
+from backend.agents.literature_searcher import LiteratureSearcherAgent, UnifiedPaper
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/api/research/v3", tags=["literature-search"])
 
+# Auto-search queries run at the same time (each query already fans out to every source)
+MAX_CONCURRENT_SEARCH_QUERIES = 3
+
+_NON_WORD_RE = re.compile(r"\W+")
+
+# Model used to turn RD/ED artifacts into auto-search queries
+QUERY_EXTRACTION_MODEL = "gemini-2.0-flash"
+
+# Extracted queries kept for repeated auto-searches over unchanged artifacts
+QUERY_CACHE_SIZE = 256
+_query_cache: OrderedDict[str, list[str]] = OrderedDict()
+
+
+def _dedup_keys(paper: UnifiedPaper) -> list[str]:
+    """Keys identifying a search result across queries and sources.
+
+    A result is a duplicate if any key was seen before: its DOI, or its full
+    title with case, spacing and punctuation removed.
+    """
+    keys = []
+    if paper.doi:
+        keys.append(f"doi:{paper.doi.lower()}")
+    title = _NON_WORD_RE.sub("", paper.title.lower())
+    if title:
+        keys.append(f"title:{title}")
+    return keys
+
+
 # Reference to _projects from main research router (will be set on app startup)
 _projects: dict = {}
 
@@ -61,12 +94,48 @@ def save_project_v3(project) -> None:
     save_project(project_dict)
 
 
+def save_project_v3_soon(project) -> None:
+    """Save v3 project, deferring the file write.
+
+    Used by background tasks so that bursts of saves are written once.
+    """
+    project_dict = project_to_dict(project)
+    _projects[project.id] = project_dict
+    schedule_project_save(project_dict)
+
+
+def _to_searched_paper(paper: UnifiedPaper, paper_id: str) -> PaperEntry:
+    """Convert a search result to a pending searched-paper entry."""
+    # Determine source (case-insensitive comparison)
+    source = PaperSource.SEMANTIC_SCHOLAR
+    paper_source_lower = paper.source.lower() if paper.source else ""
+    if paper_source_lower == "arxiv":
+        source = PaperSource.ARXIV
+    elif paper_source_lower == "google_scholar" or paper_source_lower == "google scholar":
+        source = PaperSource.GOOGLE_SCHOLAR
+
+    return PaperEntry(
+        id=paper_id,
+        type=PaperType.SEARCH,
+        title=paper.title,
+        authors=paper.authors[:10],  # Limit authors
+        year=paper.year,
+        source=source,
+        pdf_url=paper.pdf_url,
+        doi=getattr(paper, 'doi', None),
+        url=getattr(paper, 'url', None),
+        venue=getattr(paper, 'venue', None),
+        citations=getattr(paper, 'citations', 0) or 0,
+        categories=getattr(paper, 'categories', []) or [],
+        abstract=paper.abstract or "",
+        md_file=f"{paper_id}.md",
+        status=PaperStatus.PENDING,
+    )
+
+
 def _find_paper_in_organization(project, paper_id: str) -> Optional[PaperEntry]:
     """Find a paper in Literature Organization by ID."""
-    for paper in project.processes.literature_organization.state.papers:
-        if paper.id == paper_id:
-            return paper
-    return None
+    return project.processes.literature_organization.state.find_paper(paper_id)
 
 
 async def download_and_extract_full_text(
@@ -110,7 +179,7 @@ async def download_and_extract_full_text(
             return
 
         paper.status = PaperStatus.DOWNLOADING
-        save_project_v3(project)
+        save_project_v3_soon(project)
 
         # 논문 폴더 생성
         ensure_paper_folder(project_id, paper_id)
@@ -126,7 +195,7 @@ async def download_and_extract_full_text(
             paper = _find_paper_in_organization(project, paper_id)
             if paper:
                 paper.status = PaperStatus.PENDING
-                save_project_v3(project)
+                save_project_v3_soon(project)
             return
 
         # PDF를 논문 폴더에 저장
@@ -138,8 +207,8 @@ async def download_and_extract_full_text(
 
         # 텍스트 추출
         try:
-            parsed = pdf_processor.parse_pdf(pdf_path)
-            full_text = parsed.full_text if parsed else ""
+            parsed = await pdf_processor.parse_pdf_async(pdf_path)
+            full_text = parsed.full_text if parsed and parsed.error is None else ""
         except Exception as parse_error:
             logger.warning("PDF parsing failed", paper_id=paper_id, error=str(parse_error))
             full_text = ""
@@ -149,14 +218,12 @@ async def download_and_extract_full_text(
         paper = _find_paper_in_organization(project, paper_id)
         if paper:
             if full_text:
-                # 100KB 제한 (약 50페이지 분량)
-                paper.full_text = full_text[:100000]
+                # 전체 텍스트는 논문 폴더에만 저장 (프로젝트 파일에는 길이만 기록)
+                if save_paper_full_text(project_id, paper_id, full_text):
+                    paper.full_text_length = len(full_text)
                 logger.info("Full text extracted",
                            paper_id=paper_id,
-                           text_length=len(paper.full_text))
-
-                # 전체 텍스트를 파일로도 저장
-                save_paper_full_text(project_id, paper_id, full_text)
+                           text_length=len(full_text))
 
                 # 추가 메타데이터 업데이트 (PDF에서 추출된 정보)
                 if parsed:
@@ -166,7 +233,7 @@ async def download_and_extract_full_text(
                         paper.authors = parsed.authors
 
             paper.status = PaperStatus.PENDING
-            save_project_v3(project)
+            save_project_v3_soon(project)
 
         # 임시 다운로드 PDF 삭제 (이미 논문 폴더에 복사됨)
         try:
@@ -184,7 +251,7 @@ async def download_and_extract_full_text(
             paper = _find_paper_in_organization(project, paper_id)
             if paper:
                 paper.status = PaperStatus.PENDING
-                save_project_v3(project)
+                save_project_v3_soon(project)
         except Exception:
             pass
 
@@ -198,7 +265,14 @@ class LiteratureSearchStateResponse(BaseModel):
 
     status: str
     is_locked: bool
-    searched_papers: list[dict]
+    searched_papers: list[PaperEntry]
+
+
+class SearchedPaperListResponse(BaseModel):
+    """Response for the searched paper listing."""
+
+    total: int
+    papers: list[PaperEntry]
 
 
 class SearchPapersRequest(BaseModel):
@@ -283,10 +357,11 @@ async def get_literature_search_process(project_id: str) -> LiteratureSearchStat
                project_id=project_id,
                searched_papers_count=len(process.state.searched_papers))
 
-    return LiteratureSearchStateResponse(
+    # Built from the validated project state; skip re-validation
+    return LiteratureSearchStateResponse.model_construct(
         status=process.status.value if hasattr(process.status, 'value') else process.status,
         is_locked=is_locked,
-        searched_papers=[p.model_dump() for p in process.state.searched_papers],
+        searched_papers=process.state.searched_papers,
     )
 
 
@@ -332,42 +407,13 @@ async def search_papers(
         min_citations=0,
     )
 
-    # Clear existing search results and replace with new ones
-    project.processes.literature_search.state.searched_papers = []
-
-    # Convert papers to our format and add to searched_papers
-    papers_added = []
-    for paper in result.papers:
-        # Generate unique paper ID
-        paper_id = f"search_{len(project.processes.literature_search.state.searched_papers) + 1:03d}"
-
-        # Determine source (case-insensitive comparison)
-        source = PaperSource.SEMANTIC_SCHOLAR
-        paper_source_lower = paper.source.lower() if paper.source else ""
-        if paper_source_lower == "arxiv":
-            source = PaperSource.ARXIV
-        elif paper_source_lower == "google_scholar" or paper_source_lower == "google scholar":
-            source = PaperSource.GOOGLE_SCHOLAR
-
-        paper_entry = PaperEntry(
-            id=paper_id,
-            type=PaperType.SEARCH,
-            title=paper.title,
-            authors=paper.authors[:10],  # Limit authors
-            year=paper.year,
-            source=source,
-            pdf_url=paper.pdf_url,
-            doi=getattr(paper, 'doi', None),
-            url=getattr(paper, 'url', None),
-            venue=getattr(paper, 'venue', None),
-            citations=getattr(paper, 'citations', 0) or 0,
-            categories=getattr(paper, 'categories', []) or [],
-            abstract=paper.abstract or "",
-            md_file=f"{paper_id}.md",
-            status=PaperStatus.PENDING,
-        )
-        project.processes.literature_search.state.searched_papers.append(paper_entry)
-        papers_added.append(paper_entry.model_dump())
+    # Replace existing search results with the new ones
+    searched_papers = [
+        _to_searched_paper(paper, f"search_{i:03d}")
+        for i, paper in enumerate(result.papers, start=1)
+    ]
+    project.processes.literature_search.state.searched_papers = searched_papers
+    papers_added = [paper_entry.model_dump() for paper_entry in searched_papers]
 
     logger.info("Papers converted",
                project_id=project_id,
@@ -377,13 +423,6 @@ async def search_papers(
     # Save project
     save_project_v3(project)
 
-    # Verify save
-    verify_project = get_project_v3(project_id)
-    if verify_project:
-        logger.info("Papers after save",
-                   project_id=project_id,
-                   searched_papers_count=len(verify_project.processes.literature_search.state.searched_papers))
-
     logger.info("Papers searched",
                project_id=project_id,
                query=request.query,
@@ -397,8 +436,8 @@ async def search_papers(
     )
 
 
-@router.get("/{project_id}/process/literature-search/papers")
-async def list_searched_papers(project_id: str) -> dict:
+@router.get("/{project_id}/process/literature-search/papers", response_model=SearchedPaperListResponse)
+async def list_searched_papers(project_id: str) -> SearchedPaperListResponse:
     """Get all papers found via search."""
     project = get_project_v3(project_id)
     if not project:
@@ -413,10 +452,7 @@ async def list_searched_papers(project_id: str) -> dict:
 
     papers = project.processes.literature_search.state.searched_papers
 
-    return {
-        "total": len(papers),
-        "papers": [p.model_dump() for p in papers],
-    }
+    return SearchedPaperListResponse.model_construct(total=len(papers), papers=papers)
 
 
 @router.post("/{project_id}/process/literature-search/auto-search", response_model=AutoSearchResponse)
@@ -453,9 +489,6 @@ async def auto_search_papers(
             detail="No Research Definition or Experiment Design artifacts found. Please complete at least one.",
         )
 
-    # Use LLM to extract search queries from artifacts
-    llm = GeminiLLM(model="gemini-2.0-flash")
-
     artifact_text = ""
     has_rd = bool(rd_artifact)
     has_ed = bool(ed_artifact)
@@ -465,6 +498,16 @@ async def auto_search_papers(
     if ed_artifact:
         artifact_text += f"## Experiment Design\n{ed_artifact}\n\n"
 
+    # Reuse queries extracted from the same artifacts by the same model
+    cache_key = blake2b(
+        f"{QUERY_EXTRACTION_MODEL}|{artifact_text}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    queries = _query_cache.get(cache_key)
+    if queries is not None:
+        _query_cache.move_to_end(cache_key)
+        logger.info("Reusing cached auto-search queries", project_id=project_id, queries=queries)
+
     extraction_prompt = f"""Based on the following research artifacts, extract 3-5 specific search queries for finding related academic papers.
 
 {artifact_text}
@@ -482,30 +525,41 @@ Example output:
 ["deep learning anomaly detection industrial IoT", "federated learning privacy preserving", "LSTM time series classification"]
 """
 
-    try:
-        response = await llm.generate(extraction_prompt, max_tokens=500)
-
-        # Parse queries from response
-        import json
-        import re
-
-        # Try to extract JSON array
-        json_match = re.search(r'\[.*?\]', response, re.DOTALL)
-        if json_match:
-            queries = json.loads(json_match.group())
-        else:
-            # Fallback: split by newlines and clean up
-            queries = [q.strip().strip('"\'') for q in response.strip().split('\n') if q.strip()]
-            queries = queries[:5]  # Limit to 5
-
-        logger.info("Auto-search queries extracted",
-                   project_id=project_id,
-                   queries=queries)
+    if queries is None:
+        # Use LLM to extract search queries from artifacts
+        llm = GeminiLLM(model=QUERY_EXTRACTION_MODEL)
+        try:
+            response = await llm.generate(extraction_prompt, max_tokens=500)
+
+            # Parse queries from response
+            import json
+
+            # Try to decode the JSON array starting at the first bracket
+            queries = None
+            start = response.find('[')
+            if start >= 0:
+                try:
+                    queries, _ = json.JSONDecoder().raw_decode(response, start)
+                except json.JSONDecodeError:
+                    pass
+            if queries is None:
+                # Fallback: split by newlines and clean up
+                queries = [q.strip().strip('"\'') for q in response.strip().split('\n') if q.strip()]
+                queries = queries[:5]  # Limit to 5
+
+            logger.info("Auto-search queries extracted",
+                       project_id=project_id,
+                       queries=queries)
+
+            if queries:
+                _query_cache[cache_key] = queries
+                if len(_query_cache) > QUERY_CACHE_SIZE:
+                    _query_cache.popitem(last=False)
 
-    except Exception as e:
-        logger.error("Failed to extract search queries", error=str(e))
-        # Fallback to basic extraction from topic
-        queries = [project.topic] if project.topic else []
+        except Exception as e:
+            logger.error("Failed to extract search queries", error=str(e))
+            # Fallback to basic extraction from topic
+            queries = [project.topic] if project.topic else []
 
     if not queries:
         raise HTTPException(
@@ -524,73 +578,52 @@ Example output:
         use_google_scholar=use_gs,
     )
 
-    # Search for each query
+    # Search all queries concurrently, a few at a time to stay under source rate limits
+    query_slots = asyncio.Semaphore(MAX_CONCURRENT_SEARCH_QUERIES)
+
+    async def search_query(query: str):
+        async with query_slots:
+            try:
+                return await searcher.search(
+                    query=query,
+                    keywords=[],
+                    year_start=request.year_start,
+                    year_end=request.year_end,
+                    limit_per_source=request.limit_per_query,
+                    min_citations=0,
+                )
+            except Exception as e:
+                logger.warning("Search failed for query", query=query, error=str(e))
+                return None
+
+    results = await asyncio.gather(*(search_query(query) for query in queries))
+
+    # Merge results in query order (avoiding duplicates)
     all_papers = []
     all_sources = set()
     total_found = 0
+    seen_keys: set[str] = set()
 
-    for query in queries:
-        try:
-            result = await searcher.search(
-                query=query,
-                keywords=[],
-                year_start=request.year_start,
-                year_end=request.year_end,
-                limit_per_source=request.limit_per_query,
-                min_citations=0,
-            )
-
-            total_found += result.total_found
-            all_sources.update(result.sources_searched)
-
-            # Add papers (avoiding duplicates)
-            existing_titles = {p.title.lower()[:50] for p in all_papers}
-            for paper in result.papers:
-                title_key = paper.title.lower()[:50]
-                if title_key not in existing_titles:
-                    existing_titles.add(title_key)
-                    all_papers.append(paper)
-
-        except Exception as e:
-            logger.warning("Search failed for query", query=query, error=str(e))
+    for result in results:
+        if result is None:
             continue
 
-    # Clear existing search results and replace with new ones
-    project.processes.literature_search.state.searched_papers = []
-
-    # Convert papers to our format and add to searched_papers
-    papers_added = []
-    for paper in all_papers:
-        # Generate unique paper ID
-        paper_id = f"auto_{len(project.processes.literature_search.state.searched_papers) + 1:03d}"
-
-        # Determine source (case-insensitive comparison)
-        source = PaperSource.SEMANTIC_SCHOLAR
-        paper_source_lower = paper.source.lower() if paper.source else ""
-        if paper_source_lower == "arxiv":
-            source = PaperSource.ARXIV
-        elif paper_source_lower == "google_scholar" or paper_source_lower == "google scholar":
-            source = PaperSource.GOOGLE_SCHOLAR
-
-        paper_entry = PaperEntry(
-            id=paper_id,
-            type=PaperType.SEARCH,
-            title=paper.title,
-            authors=paper.authors[:10],  # Limit authors
-            year=paper.year,
-            source=source,
-            pdf_url=paper.pdf_url,
-            doi=getattr(paper, 'doi', None),
-            url=getattr(paper, 'url', None),
-            venue=getattr(paper, 'venue', None),
-            citations=getattr(paper, 'citations', 0) or 0,
-            categories=getattr(paper, 'categories', []) or [],
-            abstract=paper.abstract or "",
-            md_file=f"{paper_id}.md",
-            status=PaperStatus.PENDING,
-        )
-        project.processes.literature_search.state.searched_papers.append(paper_entry)
-        papers_added.append(paper_entry.model_dump())
+        total_found += result.total_found
+        all_sources.update(result.sources_searched)
+
+        for paper in result.papers:
+            keys = _dedup_keys(paper)
+            if seen_keys.isdisjoint(keys):
+                seen_keys.update(keys)
+                all_papers.append(paper)
+
+    # Replace existing search results with the new ones
+    searched_papers = [
+        _to_searched_paper(paper, f"auto_{i:03d}")
+        for i, paper in enumerate(all_papers, start=1)
+    ]
+    project.processes.literature_search.state.searched_papers = searched_papers
+    papers_added = [paper_entry.model_dump() for paper_entry in searched_papers]
 
     logger.info("Auto-search papers converted",
                project_id=project_id,
@@ -600,13 +633,6 @@ Example output:
     # Save project
     save_project_v3(project)
 
-    # Verify save
-    verify_project = get_project_v3(project_id)
-    if verify_project:
-        logger.info("Auto-search papers after save",
-                   project_id=project_id,
-                   searched_papers_count=len(verify_project.processes.literature_search.state.searched_papers))
-
     logger.info("Auto-search completed",
                project_id=project_id,
                queries=queries,
@@ -648,17 +674,13 @@ async def add_paper_to_organization(
         )
 
     # Find paper in search results
-    source_paper = None
-    for p in project.processes.literature_search.state.searched_papers:
-        if p.id == paper_id:
-            source_paper = p
-            break
+    source_paper = project.processes.literature_search.state.find_paper(paper_id)
 
     if not source_paper:
         raise HTTPException(status_code=404, detail="Paper not found in search results")
 
     # Generate new ID for organization
-    org_paper_id = f"paper_{len(project.processes.literature_organization.state.papers) + 1:03d}"
+    org_paper_id = project.processes.literature_organization.state.new_paper_id("paper")
 
     # Determine initial status based on pdf_url availability
     # If pdf_url exists, we'll download in background
@@ -680,7 +702,6 @@ async def add_paper_to_organization(
         citations=source_paper.citations,  # Citation count
         categories=source_paper.categories,  # Paper categories/fields
         abstract=source_paper.abstract,
-        full_text=source_paper.full_text,  # Copy full_text if available
         md_file=f"{org_paper_id}.md",
         status=initial_status,
     )
@@ -734,17 +755,13 @@ async def delete_searched_paper(project_id: str, paper_id: str) -> dict:
         )
 
     # Find and remove paper
-    papers = project.processes.literature_search.state.searched_papers
-    paper_index = None
-    for i, p in enumerate(papers):
-        if p.id == paper_id:
-            paper_index = i
-            break
+    state = project.processes.literature_search.state
+    removed_paper = state.find_paper(paper_id)
 
-    if paper_index is None:
+    if removed_paper is None:
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    removed_paper = papers.pop(paper_index)
+    state.searched_papers.remove(removed_paper)
 
     # Save project
     save_project_v3(project)
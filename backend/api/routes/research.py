@@ -5,6 +5,7 @@ Literature Review, and Paper Writing as independent processes.
 """
 import asyncio
 import json
+from dataclasses import asdict
 from datetime import datetime
 from typing import Any, AsyncGenerator, List
 from uuid import uuid4
@@ -15,7 +16,7 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse, Response
 from pydantic import BaseModel, Field
 
-from backend.agents.research_discussion import ResearchDiscussionAgent
+from backend.agents.research_discussion import ResearchDiscussionAgent, default_experiment_artifact
 from backend.agents.paper_writing import PaperWritingAgent
 from backend.agents.literature_searcher import LiteratureSearcherAgent
 from backend.utils.prompt_loader import (
@@ -80,6 +81,8 @@ router = APIRouter(prefix="/api/research", tags=["research"])
 # In-memory storage for projects - 서버 시작 시 파일에서 로드 (v3 format)
 _projects: dict[str, dict] = load_all_projects()
 logger.info("Projects loaded from storage", count=len(_projects))
+# Parsed v3 models, keyed by id with the stored dict they were built from
+_project_models: dict[str, tuple[dict, ProjectState]] = {}
 _running_workflows: dict[str, asyncio.Task] = {}
 
 # Message queues for SSE streaming (project_id -> process -> asyncio.Queue)
@@ -89,6 +92,8 @@ _process_queues: dict[str, dict[str, asyncio.Queue]] = {}  # v3: process-level
 
 # Research Discussion Agents per project
 _discussion_agents: dict[str, ResearchDiscussionAgent] = {}
+# Per-model prototypes that session agents are cloned from
+_discussion_prototypes: dict[str | None, ResearchDiscussionAgent] = {}
 
 # Paper Writing Agents per project
 _paper_writing_agents: dict[str, PaperWritingAgent] = {}
@@ -191,21 +196,31 @@ def get_process_queue(project_id: str, process: str) -> asyncio.Queue:
 
 
 def get_project_v3(project_id: str) -> ProjectState | None:
-    """Get project as v3 ProjectState model."""
+    """Get project as v3 ProjectState model.
+
+    The model is parsed once per stored dict and reused until the project is
+    saved again (here or by the literature routes, which replace the dict).
+    """
     if project_id not in _projects:
         return None
     project_data = _projects[project_id]
     # If already a ProjectState, return it directly
     if isinstance(project_data, ProjectState):
         return project_data
+    cached = _project_models.get(project_id)
+    if cached is not None and cached[0] is project_data:
+        return cached[1]
     # Otherwise convert from dict
-    return dict_to_project(project_data)
+    project = dict_to_project(project_data)
+    _project_models[project_id] = (project_data, project)
+    return project
 
 
 def save_project_v3(project: ProjectState) -> None:
     """Save v3 project to storage."""
     project_dict = project_to_dict(project)
     _projects[project.id] = project_dict
+    _project_models[project.id] = (project_dict, project)
     save_project(project_dict)
 
 
@@ -236,8 +251,6 @@ async def emit_process_message(
         elif process == "paper_writing":
             project.processes.paper_writing.messages.append(message)
         save_project_v3(project)
-        # Update in-memory cache
-        _projects[project_id] = project_to_dict(project)
 
     # Put in queue for SSE
     await queue.put(message)
@@ -280,6 +293,22 @@ async def emit_message(project_id: str, agent: str, content: str, msg_type: str
                queue_size_before=queue_size_before)
 
 
+def _new_discussion_agent(model: str | None = None) -> ResearchDiscussionAgent:
+    """Create a session agent from the shared prototype for a model.
+
+    Prompts are loaded and the LLM client is built once per model; each
+    session only gets fresh conversation state.
+
+    Args:
+        model: Optional model override.
+    """
+    prototype = _discussion_prototypes.get(model)
+    if prototype is None:
+        prototype = ResearchDiscussionAgent(model=model) if model else ResearchDiscussionAgent()
+        _discussion_prototypes[model] = prototype
+    return ResearchDiscussionAgent.clone_for_session(prototype)
+
+
 def get_discussion_agent(project_id: str, model: str | None = None) -> ResearchDiscussionAgent:
     """Get or create discussion agent for a project.
 
@@ -301,7 +330,7 @@ def get_discussion_agent(project_id: str, model: str | None = None) -> ResearchD
             old_artifact = existing_agent.get_artifact()
             old_topic = existing_agent.topic
             # Create new agent with specified model
-            new_agent = ResearchDiscussionAgent(model=model)
+            new_agent = _new_discussion_agent(model)
             if old_artifact:
                 new_agent.set_artifact(old_artifact)
             if old_topic:
@@ -311,7 +340,7 @@ def get_discussion_agent(project_id: str, model: str | None = None) -> ResearchD
 
     if project_id not in _discussion_agents:
         # Create new agent with optional model
-        agent = ResearchDiscussionAgent(model=model) if model else ResearchDiscussionAgent()
+        agent = _new_discussion_agent(model)
         _discussion_agents[project_id] = agent
 
         # Restore artifact and phase from project state based on current phase
@@ -334,7 +363,7 @@ def get_discussion_agent(project_id: str, model: str | None = None) -> ResearchD
                            phase=current_phase.value)
             elif current_phase == ProcessPhase.EXPERIMENT_DESIGN:
                 # Use experiment design initial artifact if no saved artifact exists
-                agent.set_artifact(agent.INITIAL_EXPERIMENT_ARTIFACT)
+                agent.set_artifact(default_experiment_artifact())
                 logger.info("Using initial experiment artifact",
                            project_id=project_id[:8])
 
@@ -881,6 +910,125 @@ async def chat_research_experiment(
     return {"status": "sent", "message": user_message}
 
 
+@router.post("/v3/{project_id}/process/research-experiment/chat/stream")
+async def stream_chat_research_experiment(
+    project_id: str,
+    chat_request: ChatMessageRequest,
+) -> StreamingResponse:
+    """Send a chat message and stream the advisor's reply as plain text.
+
+    The artifact and the completed reply are persisted once the stream ends.
+    The first message of a discussion (no topic yet) is taken as the research
+    topic, as in the regular chat endpoint.
+    """
+    project = get_project_v3(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    token_manager = TokenManager()
+    if not await token_manager.get_valid_access_token():
+        raise HTTPException(status_code=401, detail="Authentication required. Please login first.")
+
+    agent = get_discussion_agent(project_id, model=chat_request.model)
+    is_first_message = not agent.topic
+
+    user_message = {
+        "type": "message",
+        "agent": "user",
+        "content": chat_request.content,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    project.processes.research_experiment.messages.append(user_message)
+    save_project_v3(project)
+
+    # Emit to SSE stream
+    queue = get_process_queue(project_id, "research_experiment")
+    await queue.put(user_message)
+
+    async def reply_generator() -> AsyncGenerator[str, None]:
+        parts: list[str] = []
+        try:
+            if is_first_message:
+                stream = agent.astart_discussion(chat_request.content)
+            else:
+                stream = agent.achat(chat_request.content)
+            async for chunk in stream:
+                parts.append(chunk)
+                yield chunk
+
+            await _finish_research_experiment_turn(
+                project_id,
+                agent,
+                "".join(parts).strip(),
+                topic=chat_request.content if is_first_message else None,
+            )
+        except Exception as e:
+            logger.error("v3 Research Experiment chat stream failed",
+                        project_id=project_id,
+                        error=str(e))
+            await emit_process_message(
+                project_id,
+                "research_experiment",
+                "system",
+                f"Error processing message: {str(e)}",
+                "error",
+            )
+            yield f"\n\nError processing message: {str(e)}"
+
+    return StreamingResponse(reply_generator(), media_type="text/plain; charset=utf-8")
+
+
+async def _finish_research_experiment_turn(
+    project_id: str,
+    agent: ResearchDiscussionAgent,
+    response: str,
+    topic: str | None = None,
+) -> None:
+    """Save a completed Research & Experiment turn and publish the reply.
+
+    Stores the agent's artifact (in the project and its file), records the
+    reply, and for regular turns marks the research definition as ready and
+    emits "phase_ready" once the agent says so.
+
+    Args:
+        project_id: Project ID.
+        agent: Discussion agent that produced the reply.
+        response: Reply text (without artifact block).
+        topic: Research topic when this turn started the discussion.
+    """
+    is_ready = topic is None and agent.is_ready_for_next_phase
+
+    # Save artifact to project state (for current phase)
+    project = get_project_v3(project_id)
+    if project:
+        artifact_content = agent.get_artifact()
+        project.processes.research_experiment.set_current_artifact(artifact_content)
+        if topic is not None:
+            project.processes.research_experiment.state.research_topic = topic
+        if is_ready:
+            # Update state to indicate research definition is done (not complete flag yet)
+            project.processes.research_experiment.state.refined_topic = agent.topic
+        save_project_v3(project)
+        # Save to file
+        current_phase = project.processes.research_experiment.current_phase.value
+        save_artifact_to_file(project_id, current_phase, artifact_content)
+
+    await emit_process_message(
+        project_id,
+        "research_experiment",
+        "research_advisor",
+        response,
+    )
+    if is_ready:
+        await emit_process_message(
+            project_id,
+            "research_experiment",
+            "system",
+            "Research Definition 준비 완료! '완료' 버튼을 클릭하여 Literature Review를 해금하거나, 계속 수정할 수 있습니다.",
+            "phase_ready",
+        )
+
+
 async def _process_research_experiment_chat(project_id: str, content: str, model: str | None = None) -> None:
     """Process chat message in Research & Experiment process.
 
@@ -919,67 +1067,12 @@ async def _process_research_experiment_chat(project_id: str, content: str, model
         if not agent.topic:
             logger.info("v3 First message - treating as research topic")
             response = await agent.start_discussion(content)
-
-            # Save artifact to project state (for current phase)
-            project = get_project_v3(project_id)
-            if project:
-                artifact_content = agent.get_artifact()
-                project.processes.research_experiment.set_current_artifact(artifact_content)
-                project.processes.research_experiment.state.research_topic = content
-                save_project_v3(project)
-                # Save to file
-                current_phase = project.processes.research_experiment.current_phase.value
-                save_artifact_to_file(project_id, current_phase, artifact_content)
-
-            await emit_process_message(
-                project_id,
-                "research_experiment",
-                "research_advisor",
-                response,
-            )
+            await _finish_research_experiment_turn(project_id, agent, response, topic=content)
             return
 
         # Get response from agent
         response = await agent.chat(content)
-
-        # Save artifact to project state (for current phase)
-        project = get_project_v3(project_id)
-        if project:
-            artifact_content = agent.get_artifact()
-            project.processes.research_experiment.set_current_artifact(artifact_content)
-            save_project_v3(project)
-            # Save to file
-            current_phase = project.processes.research_experiment.current_phase.value
-            save_artifact_to_file(project_id, current_phase, artifact_content)
-
-        # Check if ready for next phase
-        if agent.is_ready_for_next_phase:
-            project = get_project_v3(project_id)
-            if project:
-                # Update state to indicate research definition is done (not complete flag yet)
-                project.processes.research_experiment.state.refined_topic = agent.topic
-                save_project_v3(project)
-
-            await emit_process_message(
-                project_id,
-                "research_experiment",
-                "research_advisor",
-                response,
-            )
-            await emit_process_message(
-                project_id,
-                "research_experiment",
-                "system",
-                "Research Definition 준비 완료! '완료' 버튼을 클릭하여 Literature Review를 해금하거나, 계속 수정할 수 있습니다.",
-                "phase_ready",
-            )
-        else:
-            await emit_process_message(
-                project_id,
-                "research_experiment",
-                "research_advisor",
-                response,
-            )
+        await _finish_research_experiment_turn(project_id, agent, response)
 
         logger.info("v3 Research Experiment chat processed",
                    project_id=project_id,
@@ -1079,7 +1172,7 @@ async def switch_research_experiment_phase(
                 agent.set_artifact(agent._initial_artifact)
             else:
                 # Use experiment design initial artifact
-                agent.set_artifact(agent.INITIAL_EXPERIMENT_ARTIFACT)
+                agent.set_artifact(default_experiment_artifact())
             logger.info("Initialized default artifact for new phase",
                        project_id=project_id[:8],
                        phase=new_phase.value)
@@ -1226,7 +1319,7 @@ async def reset_research_experiment(
             if current_phase == ProcessPhase.RESEARCH_DEFINITION:
                 agent.set_artifact(agent._initial_artifact)
             else:
-                agent.set_artifact(agent.INITIAL_EXPERIMENT_ARTIFACT)
+                agent.set_artifact(default_experiment_artifact())
             # Also reset topic if resetting research definition
             if current_phase == ProcessPhase.RESEARCH_DEFINITION:
                 agent.topic = ""
@@ -1607,7 +1700,7 @@ async def reset_paper_writing(
 
         # Reset agent's conversation history
         if project_id in _paper_writing_agents:
-            _paper_writing_agents[project_id].conversation_history = []
+            _paper_writing_agents[project_id].conversation_history.clear()
 
     if request.reset_artifact:
         # Clear artifact
@@ -2363,7 +2456,7 @@ async def proceed_to_next_phase(
         research_def = await agent.extract_research_definition()
 
         if research_def:
-            project["state"]["research_definition"] = research_def.model_dump()
+            project["state"]["research_definition"] = asdict(research_def)
 
         # Move to Phase 2
         project["current_phase"] = "phase_2"
@@ -2589,7 +2682,11 @@ async def delete_project(project_id: str) -> dict:
     if project_id in _message_queues:
         del _message_queues[project_id]
 
+    from backend.api.routes.literature import forget_master_md
+
     del _projects[project_id]
+    _project_models.pop(project_id, None)
+    forget_master_md(project_id)
 
     # 파일도 삭제
     delete_project_file(project_id)
@@ -2614,7 +2711,7 @@ async def get_research_definition(project_id: str) -> dict:
             agent = _discussion_agents[project_id]
             extracted = await agent.extract_research_definition()
             if extracted:
-                research_def = extracted.model_dump()
+                research_def = asdict(extracted)
                 project["state"]["research_definition"] = research_def
 
     if not research_def:
@@ -4,8 +4,11 @@ This uses Google's Gemini Code Assist API (cloudcode-pa.googleapis.com)
 with OAuth 2.0 + PKCE authentication.
 """
 
+import asyncio
+import json
 import uuid
-from typing import Any, Iterator, List, Optional
+import weakref
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Union
 
 import httpx
 import structlog
@@ -17,8 +20,11 @@ from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
     SystemMessage,
+    ToolMessage,
 )
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from pydantic import Field
 
 from backend.auth.token_manager import TokenManager
@@ -26,6 +32,86 @@ from backend.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# One pooled HTTP client per event loop, so generate/stream calls reuse open
+# connections instead of repeating the TCP and TLS handshake every time
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by Gemini requests on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20))
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _parse_response_parts(parts: List[dict]) -> tuple[str, List[dict]]:
+    """Split Gemini response parts into text and tool calls.
+
+    Args:
+        parts: Candidate content parts.
+
+    Returns:
+        Tuple of (concatenated text, LangChain tool call dicts).
+    """
+    text = "".join(part.get("text", "") for part in parts)
+    tool_calls = [
+        {
+            "name": part["functionCall"]["name"],
+            "args": part["functionCall"].get("args", {}),
+            "id": part["functionCall"].get("id") or str(uuid.uuid4()),
+        }
+        for part in parts
+        if "functionCall" in part
+    ]
+    return text, tool_calls
+
+def _to_gemini_schema(schema: Any) -> Any:
+    """Reduce a JSON schema to the OpenAPI subset Gemini accepts.
+
+    Optional fields (anyOf [T, null]) become T with nullable=True, and
+    keys Gemini rejects such as defaults and titles are dropped.
+
+    Args:
+        schema: JSON schema (or a nested part of one).
+
+    Returns:
+        Gemini-compatible schema.
+    """
+    if isinstance(schema, list):
+        return [_to_gemini_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    any_of = schema.get("anyOf")
+    if any_of:
+        non_null = [option for option in any_of if option.get("type") != "null"]
+        if len(non_null) == 1:
+            merged = {**non_null[0], **{k: v for k, v in schema.items() if k != "anyOf"}}
+            if len(non_null) < len(any_of):
+                merged["nullable"] = True
+            return _to_gemini_schema(merged)
+
+    return {
+        key: _to_gemini_schema(value) if key != "properties" else {
+            name: _to_gemini_schema(prop) for name, prop in value.items()
+        }
+        for key, value in schema.items()
+        if key not in ("default", "title", "additionalProperties")
+    }
+
+
 # Gemini Code Assist API headers
 CODE_ASSIST_HEADERS = {
     "User-Agent": "google-api-nodejs-client/9.15.1",
@@ -67,7 +153,6 @@ class GeminiLLM(BaseChatModel):
     token_manager: Optional[TokenManager] = Field(default=None, exclude=True)
     project_id: Optional[str] = Field(default=None)
 
-    _http_client: Optional[httpx.AsyncClient] = None
     _discovered_project_id: Optional[str] = None
 
     class Config:
@@ -258,49 +343,67 @@ class GeminiLLM(BaseChatModel):
 
     def _convert_messages_to_gemini_format(
         self, messages: List[BaseMessage]
-    ) -> tuple[Optional[str], List[dict]]:
+    ) -> tuple[List[str], List[dict]]:
         """Convert LangChain messages to Gemini API format.
 
+        Multiple system messages are kept in order as separate parts of the
+        system instruction, so a static prefix followed by per-turn context
+        leaves the prefix unchanged for Gemini's prompt cache.
+
         Args:
             messages: List of LangChain messages.
 
         Returns:
-            Tuple of (system_instruction, contents list).
+            Tuple of (system instruction parts, contents list).
         """
-        system_instruction = None
+        system_parts = []
         contents = []
 
         for message in messages:
             if isinstance(message, SystemMessage):
-                system_instruction = message.content
+                system_parts.append(message.content)
             elif isinstance(message, HumanMessage):
                 contents.append({
                     "role": "user",
                     "parts": [{"text": message.content}],
                 })
             elif isinstance(message, AIMessage):
+                parts = [{"text": message.content}] if message.content else []
+                parts.extend(
+                    {"functionCall": {"name": call["name"], "args": call["args"]}}
+                    for call in message.tool_calls
+                )
+                contents.append({"role": "model", "parts": parts})
+            elif isinstance(message, ToolMessage):
                 contents.append({
-                    "role": "model",
-                    "parts": [{"text": message.content}],
+                    "role": "user",
+                    "parts": [{
+                        "functionResponse": {
+                            "name": message.name,
+                            "response": {"content": message.content},
+                        }
+                    }],
                 })
 
-        return system_instruction, contents
+        return system_parts, contents
 
     def _build_request_body(
         self,
         messages: List[BaseMessage],
         project_id: str,
+        tools: Optional[List[dict]] = None,
     ) -> dict:
         """Build Gemini CLI API request body.
 
         Args:
             messages: List of messages.
             project_id: GCP project ID.
+            tools: Gemini tool declarations (see bind_tools).
 
         Returns:
             Request body dictionary in Gemini CLI format.
         """
-        system_instruction, contents = self._convert_messages_to_gemini_format(messages)
+        system_parts, contents = self._convert_messages_to_gemini_format(messages)
 
         # Build generation config
         generation_config: dict[str, Any] = {
@@ -323,11 +426,14 @@ class GeminiLLM(BaseChatModel):
             "generationConfig": generation_config,
         }
 
-        if system_instruction:
+        if system_parts:
             request_payload["systemInstruction"] = {
-                "parts": [{"text": system_instruction}]
+                "parts": [{"text": part} for part in system_parts]
             }
 
+        if tools:
+            request_payload["tools"] = tools
+
         # Wrap in Gemini CLI format
         return {
             "project": project_id,
@@ -405,7 +511,7 @@ class GeminiLLM(BaseChatModel):
 
         project_id = await self._discover_project_id(access_token)
         headers = await self._get_headers(access_token)
-        body = self._build_request_body(messages, project_id)
+        body = self._build_request_body(messages, project_id, kwargs.get("tools"))
 
         logger.debug(
             "Sending request to Gemini CLI",
@@ -414,60 +520,60 @@ class GeminiLLM(BaseChatModel):
             project=project_id,
         )
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(self._endpoint, headers=headers, json=body)
+        client = _get_http_client()
+        response = await client.post(self._endpoint, headers=headers, json=body, timeout=120.0)
 
-            if response.status_code == 429:
-                logger.warning("Rate limit exceeded")
-                raise Exception("Rate limit exceeded. Please wait and try again.")
+        if response.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise Exception("Rate limit exceeded. Please wait and try again.")
 
-            if response.status_code != 200:
-                error_text = response.text[:500]
-                logger.error(
-                    "API request failed",
-                    status=response.status_code,
-                    response=error_text,
-                )
-                raise Exception(f"API error {response.status_code}: {error_text}")
-
-            data = response.json()
-
-            # Gemini CLI wraps the response in a "response" field
-            if "response" in data:
-                data = data["response"]
-
-            # Parse response - standard Gemini format
-            candidates = data.get("candidates", [])
-            if not candidates:
-                raise ValueError(f"No response candidates returned from API: {data}")
-
-            content = candidates[0].get("content", {})
-            parts = content.get("parts", [])
-            text = "".join(part.get("text", "") for part in parts)
-
-            # Get usage metadata
-            usage_metadata = data.get("usageMetadata", {})
-
-            message = AIMessage(
-                content=text,
-                additional_kwargs={
-                    "finish_reason": candidates[0].get("finishReason"),
-                    "usage": {
-                        "prompt_tokens": usage_metadata.get("promptTokenCount", 0),
-                        "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
-                        "total_tokens": usage_metadata.get("totalTokenCount", 0),
-                    },
-                },
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            logger.error(
+                "API request failed",
+                status=response.status_code,
+                response=error_text,
             )
-
-            return ChatResult(
-                generations=[ChatGeneration(message=message)],
-                llm_output={
-                    "model": self.model,
-                    "usage": usage_metadata,
-                    "project_id": project_id,
+            raise Exception(f"API error {response.status_code}: {error_text}")
+
+        data = response.json()
+
+        # Gemini CLI wraps the response in a "response" field
+        if "response" in data:
+            data = data["response"]
+
+        # Parse response - standard Gemini format
+        candidates = data.get("candidates", [])
+        if not candidates:
+            raise ValueError(f"No response candidates returned from API: {data}")
+
+        content = candidates[0].get("content", {})
+        text, tool_calls = _parse_response_parts(content.get("parts", []))
+
+        # Get usage metadata
+        usage_metadata = data.get("usageMetadata", {})
+
+        message = AIMessage(
+            content=text,
+            tool_calls=tool_calls,
+            additional_kwargs={
+                "finish_reason": candidates[0].get("finishReason"),
+                "usage": {
+                    "prompt_tokens": usage_metadata.get("promptTokenCount", 0),
+                    "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
+                    "total_tokens": usage_metadata.get("totalTokenCount", 0),
                 },
-            )
+            },
+        )
+
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={
+                "model": self.model,
+                "usage": usage_metadata,
+                "project_id": project_id,
+            },
+        )
 
     def _stream(
         self,
@@ -522,48 +628,90 @@ class GeminiLLM(BaseChatModel):
 
         project_id = await self._discover_project_id(access_token)
         headers = await self._get_headers(access_token, streaming=True)
-        body = self._build_request_body(messages, project_id)
-
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            async with client.stream("POST", self._stream_endpoint, headers=headers, json=body) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-
-                    # SSE format: data: {...}
-                    if line.startswith("data: "):
-                        line = line[6:]  # Remove "data: " prefix
-
-                    if line == "[DONE]":
-                        break
-
-                    # Parse streaming response (JSON)
-                    import json
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Gemini CLI may wrap response
-                    if "response" in data:
-                        data = data["response"]
-
-                    # Standard Gemini response format
-                    candidates = data.get("candidates", [])
-                    if not candidates:
-                        continue
-
-                    content = candidates[0].get("content", {})
-                    parts = content.get("parts", [])
-                    text = "".join(part.get("text", "") for part in parts)
-
-                    if text:
-                        chunk = ChatGenerationChunk(
-                            message=AIMessageChunk(content=text)
+        body = self._build_request_body(messages, project_id, kwargs.get("tools"))
+
+        client = _get_http_client()
+        async with client.stream(
+            "POST", self._stream_endpoint, headers=headers, json=body, timeout=300.0
+        ) as response:
+            response.raise_for_status()
+
+            # Chunks with the same index are merged, so number calls across the whole stream
+            tool_call_count = 0
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+
+                # SSE format: data: {...}
+                if line.startswith("data: "):
+                    line = line[6:]  # Remove "data: " prefix
+
+                if line == "[DONE]":
+                    break
+
+                # Parse streaming response (JSON)
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                # Gemini CLI may wrap response
+                if "response" in data:
+                    data = data["response"]
+
+                # Standard Gemini response format
+                candidates = data.get("candidates", [])
+                if not candidates:
+                    continue
+
+                content = candidates[0].get("content", {})
+                text, tool_calls = _parse_response_parts(content.get("parts", []))
+
+                if text or tool_calls:
+                    # Gemini sends each function call whole, never split across events
+                    chunk = ChatGenerationChunk(
+                        message=AIMessageChunk(
+                            content=text,
+                            tool_call_chunks=[
+                                {
+                                    "name": call["name"],
+                                    "args": json.dumps(call["args"]),
+                                    "id": call["id"],
+                                    "index": index,
+                                }
+                                for index, call in enumerate(tool_calls, tool_call_count)
+                            ],
                         )
-                        yield chunk
+                    )
+                    tool_call_count += len(tool_calls)
+                    yield chunk
+
+    def bind_tools(
+        self,
+        tools: Sequence[Union[dict[str, Any], type, Callable]],
+        **kwargs: Any,
+    ) -> Runnable:
+        """Bind tools (function declarations) to the model.
+
+        Args:
+            tools: Pydantic models, functions, LangChain tools or OpenAI-style
+                tool dicts.
+            **kwargs: Additional arguments bound alongside the tools.
+
+        Returns:
+            Runnable that sends the tools with every request.
+        """
+        declarations = []
+        for tool in tools:
+            function = convert_to_openai_tool(tool)["function"]
+            declarations.append({
+                "name": function["name"],
+                "description": function.get("description", ""),
+                "parameters": _to_gemini_schema(
+                    function.get("parameters", {"type": "object", "properties": {}})
+                ),
+            })
+        return self.bind(tools=[{"functionDeclarations": declarations}], **kwargs)
 
     @property
     def _identifying_params(self) -> dict[str, Any]:
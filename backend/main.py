@@ -6,6 +6,7 @@ import traceback
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from backend.config import get_settings
@@ -42,6 +43,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         project_id=settings.gcp_project_id,
     )
     yield
+    from backend.storage.project_store import flush_pending_project_saves
+    from backend.tools.pdf_processor import shutdown_parse_pool, close_download_client
+    from backend.llm.gemini import close_http_client
+
+    # Write any project saves still waiting in the write-behind buffer
+    flush_pending_project_saves()
+    shutdown_parse_pool()
+    await close_download_client()
+    await close_http_client()
     logger.info("Shutting down DeepResearcher")
 
 
@@ -61,6 +71,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (paper lists, master MD); event streams are left as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # Global exception handler to log all errors
 @app.exception_handler(Exception)
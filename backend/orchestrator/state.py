@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # === Enums ===
@@ -174,7 +174,10 @@ class PaperEntry(BaseModel):
     citations: int = Field(default=0, description="Citation count")
     categories: list[str] = Field(default_factory=list, description="Paper categories/fields")
     abstract: str = Field(default="", description="Paper abstract")
-    full_text: Optional[str] = Field(default=None, description="Full paper text for summarization")
+    full_text_length: int = Field(
+        default=0,
+        description="Length of the full paper text saved in the paper folder (0 if none)"
+    )
     md_file: str = Field(default="", description="Generated MD filename")
     md_content: str = Field(default="", description="Generated MD content (full summary)")
     status: PaperStatus = Field(default=PaperStatus.PENDING, description="Processing status")
@@ -184,6 +187,32 @@ class PaperEntry(BaseModel):
     )
 
 
+class _PaperIndex:
+    """id -> position index over a paper list, checked against the list on every lookup.
+
+    A hit is only trusted if the list still holds a paper with that id at
+    the indexed position; a stale hit or a miss rebuilds the index, so any
+    change to the list (append, remove, replace, reassign) is picked up.
+    """
+
+    __slots__ = ("_positions",)
+
+    def __init__(self) -> None:
+        self._positions: dict[str, int] = {}
+
+    def find(self, papers: list[PaperEntry], paper_id: str) -> Optional[PaperEntry]:
+        pos = self._positions.get(paper_id)
+        if pos is None or pos >= len(papers) or papers[pos].id != paper_id:
+            positions: dict[str, int] = {}
+            for i, paper in enumerate(papers):
+                positions.setdefault(paper.id, i)
+            self._positions = positions
+            pos = positions.get(paper_id)
+            if pos is None:
+                return None
+        return papers[pos]
+
+
 class LiteratureOrganizationState(BaseModel):
     """State for Literature Organization process (PDF → MD conversion).
 
@@ -197,6 +226,35 @@ class LiteratureOrganizationState(BaseModel):
         default="master.md",
         description="Master reference list filename"
     )
+    next_paper_seq: int = Field(
+        default=0,
+        description="Sequence number of the last generated paper ID"
+    )
+
+    _paper_index: _PaperIndex = PrivateAttr(default_factory=_PaperIndex)
+
+    def find_paper(self, paper_id: str) -> Optional[PaperEntry]:
+        """Look up a paper by id."""
+        return self._paper_index.find(self.papers, paper_id)
+
+    def new_paper_id(self, prefix: str) -> str:
+        """Generate a new paper ID that is not reused after deletions.
+
+        Args:
+            prefix: ID prefix (e.g. "paper", "upload").
+
+        Returns:
+            A new ID of the form "{prefix}_{seq:03d}".
+        """
+        # Projects saved before the counter existed start from the list length
+        seq = max(self.next_paper_seq, len(self.papers))
+        while True:
+            seq += 1
+            paper_id = f"{prefix}_{seq:03d}"
+            if self.find_paper(paper_id) is None:
+                break
+        self.next_paper_seq = seq
+        return paper_id
 
 
 class LiteratureOrganizationProcess(BaseModel):
@@ -249,6 +307,12 @@ class LiteratureSearchState(BaseModel):
         description="List of papers found via search"
     )
 
+    _paper_index: _PaperIndex = PrivateAttr(default_factory=_PaperIndex)
+
+    def find_paper(self, paper_id: str) -> Optional[PaperEntry]:
+        """Look up a searched paper by id."""
+        return self._paper_index.find(self.searched_papers, paper_id)
+
 
 class LiteratureSearchProcess(BaseModel):
     """Literature Search process container (non-conversational).
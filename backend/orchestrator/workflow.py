@@ -1,5 +1,6 @@
 """LangGraph workflow for research orchestration."""
 
+from dataclasses import asdict
 from typing import Literal
 
 import structlog
@@ -131,7 +132,7 @@ class ResearchWorkflow:
         return {
             "refined_topic": result.refined_topic,
             "research_questions": result.research_questions,
-            "novelty_assessment": result.novelty_assessment.model_dump(),
+            "novelty_assessment": asdict(result.novelty_assessment),
             "research_scope": result.research_scope,
             "potential_contributions": result.potential_contributions,
             "search_keywords": result.suggested_keywords,
@@ -19,6 +19,9 @@ logger = structlog.get_logger(__name__)
 # Base directory for paper files (absolute path for consistency)
 PAPERS_BASE_DIR = Path(__file__).parent.parent.parent / "data" / "papers"
 
+# Extracted texts shorter than this are not worth keeping as full text
+MIN_FULL_TEXT_LENGTH = 100
+
 
 def get_project_papers_dir(project_id: str) -> Path:
     """Get the papers directory for a project.
@@ -177,6 +180,21 @@ def save_literature_paper(project_id: str, paper_id: str, title: str, content: s
     return file_path
 
 
+def get_literature_paper_path(project_id: str, paper_id: str, title: str) -> Optional[Path]:
+    """Get the path to a paper's saved summary markdown file.
+
+    Args:
+        project_id: Project ID.
+        paper_id: Paper ID.
+        title: Paper title the file was saved under.
+
+    Returns:
+        Path to the markdown file or None if not found.
+    """
+    md_path = get_paper_folder(project_id, paper_id) / f"{paper_id}_{sanitize_filename(title)}.md"
+    return md_path if md_path.exists() else None
+
+
 def save_paper_pdf(project_id: str, paper_id: str, pdf_path: Path) -> Optional[Path]:
     """Save/move a PDF file to the paper's folder.
 
@@ -216,7 +234,7 @@ def save_paper_full_text(project_id: str, paper_id: str, full_text: str) -> Opti
     Returns:
         Path to the saved text file or None if failed.
     """
-    if not full_text or len(full_text) < 100:
+    if not full_text or len(full_text) < MIN_FULL_TEXT_LENGTH:
         return None
 
     paper_folder = ensure_paper_folder(project_id, paper_id)
@@ -234,6 +252,22 @@ def save_paper_full_text(project_id: str, paper_id: str, full_text: str) -> Opti
         return None
 
 
+def read_paper_full_text(project_id: str, paper_id: str) -> Optional[str]:
+    """Read the full text saved in the paper's folder.
+
+    Args:
+        project_id: Project ID.
+        paper_id: Paper ID.
+
+    Returns:
+        Full text or None if not saved.
+    """
+    text_path = get_paper_folder(project_id, paper_id) / f"{paper_id}_full_text.txt"
+    if not text_path.exists():
+        return None
+    return text_path.read_text(encoding="utf-8")
+
+
 def get_paper_pdf_path(project_id: str, paper_id: str) -> Optional[Path]:
     """Get the path to a paper's PDF file.
 
@@ -1,11 +1,12 @@
 """File-based project persistence with v3 process architecture support."""
 
-import json
+import asyncio
 import os
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+import orjson
 import structlog
 
 from backend.orchestrator.state import (
@@ -31,6 +32,11 @@ logger = structlog.get_logger(__name__)
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "projects"
 PAPERS_DIR = Path(__file__).parent.parent.parent / "data" / "papers"
 
+# 지연 저장: 이 시간(초) 안에 반복된 저장은 마지막 데이터로 한 번만 기록
+PROJECT_SAVE_DELAY = 0.25
+_pending_saves: dict[str, dict] = {}
+_pending_save_tasks: dict[str, asyncio.Task] = {}
+
 
 def ensure_data_dir() -> None:
     """데이터 디렉토리가 없으면 생성."""
@@ -191,7 +197,8 @@ def project_to_dict(project: ProjectState) -> dict:
                         paper.model_dump() if hasattr(paper, 'model_dump') else paper
                         for paper in project.processes.literature_organization.state.papers
                     ],
-                    "master_md": project.processes.literature_organization.state.master_md
+                    "master_md": project.processes.literature_organization.state.master_md,
+                    "next_paper_seq": project.processes.literature_organization.state.next_paper_seq,
                 }
             },
             "literature_search": {
@@ -221,6 +228,44 @@ def project_to_dict(project: ProjectState) -> dict:
     }
 
 
+def _move_full_text_to_files(project_id: str, data: dict) -> bool:
+    """예전 프로젝트 파일의 논문 전문(full_text)을 논문 폴더의 텍스트 파일로 이동.
+
+    텍스트 파일 저장에 성공한 논문만 full_text 키를 제거하고 full_text_length를
+    기록한다. 저장에 실패하면 키를 남겨 다음 로드 때 다시 시도한다.
+    (MIN_FULL_TEXT_LENGTH보다 짧은 텍스트는 원래 저장하지 않으므로 그냥 제거)
+
+    Args:
+        project_id: 프로젝트 ID
+        data: 프로젝트 딕셔너리 (논문 딕셔너리를 직접 수정)
+
+    Returns:
+        변경된 논문이 있는지 여부
+    """
+    from backend.storage.paper_files import MIN_FULL_TEXT_LENGTH, save_paper_full_text
+
+    processes = data.get("processes", {})
+    paper_lists = [
+        processes.get(name, {}).get("state", {}).get("papers", [])
+        for name in ("literature_organization", "literature_review")
+    ]
+
+    changed = False
+    for papers in paper_lists:
+        for paper in papers:
+            if not isinstance(paper, dict) or "full_text" not in paper:
+                continue
+            full_text = paper["full_text"] or ""
+            if len(full_text) >= MIN_FULL_TEXT_LENGTH:
+                if not save_paper_full_text(project_id, paper["id"], full_text):
+                    logger.warning("Failed to move paper full text", project_id=project_id[:8], paper_id=paper["id"])
+                    continue
+                paper["full_text_length"] = len(full_text)
+            del paper["full_text"]
+            changed = True
+    return changed
+
+
 def dict_to_project(data: dict) -> ProjectState:
     """딕셔너리를 ProjectState로 변환."""
     # 마이그레이션 필요 여부 확인
@@ -325,6 +370,18 @@ def dict_to_project(data: dict) -> ProjectState:
     )
 
 
+def _write_project_file(file_path: Path, data: dict) -> None:
+    """프로젝트 딕셔너리를 들여쓰기된 UTF-8 JSON 파일로 저장 (orjson 사용).
+
+    Args:
+        file_path: 저장할 파일 경로
+        data: 프로젝트 딕셔너리
+    """
+    file_path.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
+
+
 def save_project(project: dict | ProjectState) -> bool:
     """프로젝트를 파일에 저장.
 
@@ -348,6 +405,9 @@ def save_project(project: dict | ProjectState) -> bool:
             logger.error("Cannot save project without id")
             return False
 
+        # 대기 중인 지연 저장은 이 저장보다 오래된 데이터이므로 버림
+        _pending_saves.pop(project_id, None)
+
         # papers_folder 설정 확인
         if "processes" in save_data:
             lo = save_data["processes"].get("literature_organization", {})
@@ -360,8 +420,7 @@ def save_project(project: dict | ProjectState) -> bool:
         save_data["updated_at"] = datetime.utcnow().isoformat()
 
         # JSON 파일로 저장
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        _write_project_file(file_path, save_data)
 
         logger.debug("Project saved", project_id=project_id[:8])
         return True
@@ -372,6 +431,46 @@ def save_project(project: dict | ProjectState) -> bool:
         return False
 
 
+def schedule_project_save(project: dict, delay: float = PROJECT_SAVE_DELAY) -> None:
+    """프로젝트를 잠시 후 파일에 저장 (반복 저장 병합).
+
+    같은 프로젝트에 대해 delay 안에 여러 번 호출되면 마지막 데이터만 한 번 저장한다.
+    실행 중인 이벤트 루프 안에서 호출해야 한다.
+
+    Args:
+        project: 저장할 프로젝트 딕셔너리
+        delay: 저장 전 대기 시간 (초)
+    """
+    project_id = project["id"]
+    _pending_saves[project_id] = project
+    if project_id not in _pending_save_tasks:
+        _pending_save_tasks[project_id] = asyncio.create_task(
+            _flush_project_save(project_id, delay)
+        )
+
+
+async def _flush_project_save(project_id: str, delay: float) -> None:
+    """delay 후 대기 중인 프로젝트 데이터를 저장."""
+    try:
+        await asyncio.sleep(delay)
+    finally:
+        if _pending_save_tasks.get(project_id) is asyncio.current_task():
+            del _pending_save_tasks[project_id]
+    project = _pending_saves.pop(project_id, None)
+    if project is not None:
+        save_project(project)
+
+
+def flush_pending_project_saves() -> None:
+    """대기 중인 모든 지연 저장을 즉시 기록 (종료 시 호출)."""
+    for task in _pending_save_tasks.values():
+        task.cancel()
+    _pending_save_tasks.clear()
+    while _pending_saves:
+        _, project = _pending_saves.popitem()
+        save_project(project)
+
+
 def load_project(project_id: str) -> Optional[ProjectState]:
     """파일에서 프로젝트 로드.
 
@@ -387,16 +486,20 @@ def load_project(project_id: str) -> Optional[ProjectState]:
         if not file_path.exists():
             return None
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
 
         # 마이그레이션이 필요한 경우 자동 마이그레이션 후 저장
+        migrated = False
         if is_legacy_project(data):
             logger.info("Auto-migrating legacy project", project_id=project_id[:8])
             data = migrate_legacy_project(data)
+            migrated = True
+        # 논문 전문은 프로젝트 파일 대신 논문 폴더에 보관
+        if _move_full_text_to_files(project_id, data):
+            migrated = True
+        if migrated:
             # 마이그레이션된 데이터 저장
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_project_file(file_path, data)
 
         project = dict_to_project(data)
         logger.debug("Project loaded", project_id=project_id[:8])
@@ -482,6 +585,9 @@ def delete_project_file(project_id: str) -> bool:
 
     success = True
 
+    # 삭제 후 지연 저장이 파일을 다시 만들지 않도록 버림
+    _pending_saves.pop(project_id, None)
+
     try:
         # 1. 프로젝트 JSON 파일 삭제
         file_path = get_project_path(project_id)
@@ -8,6 +8,41 @@ from pathlib import Path
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path.parent))
 
+REPO_DATA_DIRS = [
+    backend_path.parent / "data" / "projects",
+    backend_path.parent / "data" / "papers",
+]
+
+
+def _list_data_files():
+    """List everything under the repo's project/paper data folders."""
+    return {
+        path
+        for data_dir in REPO_DATA_DIRS
+        if data_dir.exists()
+        for path in data_dir.rglob("*")
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repo_data_untouched():
+    """Fail the run if any test wrote into the repo's data folders."""
+    before = _list_data_files()
+    yield
+    leaked = sorted(str(path) for path in _list_data_files() - before)
+    assert not leaked, f"Tests wrote into the repo data folders: {leaked[:5]}"
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Point project and paper storage at a per-test temp folder."""
+    from backend.storage import paper_files, project_store
+
+    monkeypatch.setattr(project_store, "DATA_DIR", tmp_path / "projects")
+    monkeypatch.setattr(project_store, "PAPERS_DIR", tmp_path / "papers")
+    monkeypatch.setattr(paper_files, "PAPERS_BASE_DIR", tmp_path / "papers")
+    return tmp_path
+
 
 @pytest.fixture(autouse=True)
 def mock_settings(monkeypatch):
@@ -314,6 +314,22 @@ class TestMasterMD:
         assert data["total_papers"] == 2
         assert "Paper 1" in data["content"] or "Paper" in data["content"]
 
+    def test_master_md_cache_evicted_on_delete(self, client):
+        """Test that deleting a project drops its cached master MD."""
+        response = client.post("/api/research/v3/create", json={"topic": "Master Cache Test"})
+        project_id = response.json()["project_id"]
+
+        first = client.get(f"/api/research/v3/{project_id}/process/literature-organization/master")
+        second = client.get(f"/api/research/v3/{project_id}/process/literature-organization/master")
+
+        assert first.status_code == second.status_code == 200
+        assert "Generated At" in second.json()["content"]
+        assert project_id in literature._master_md_cache
+
+        client.delete(f"/api/research/{project_id}")
+
+        assert project_id not in literature._master_md_cache
+
 
 class TestSearchPapers:
     """Tests for paper search endpoint."""
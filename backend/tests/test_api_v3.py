@@ -293,6 +293,89 @@ class TestResearchExperimentChat:
 
         assert response.status_code == 404
 
+    def test_chat_stream_emits_phase_ready(self, client, mock_token_manager):
+        """Test that the streaming chat records the reply and the phase readiness."""
+        project_id = client.post(
+            "/api/research/v3/create", json={"topic": "Stream Test"}
+        ).json()["project_id"]
+
+        async def achat(content):
+            agent.is_ready_for_next_phase = True
+            yield "Ready to "
+            yield "proceed."
+
+        agent = MagicMock(topic="Stream Test", is_ready_for_next_phase=False)
+        agent.achat = achat
+        agent.get_artifact.return_value = "# Artifact"
+        research._discussion_agents[project_id] = agent
+
+        response = client.post(
+            f"/api/research/v3/{project_id}/process/research-experiment/chat/stream",
+            json={"content": "다음 단계로"},
+        )
+
+        assert response.text == "Ready to proceed."
+        queued = research.get_process_queue(project_id, "research_experiment")
+        assert queued.get_nowait()["content"] == "다음 단계로"
+        project = research.get_project_v3(project_id)
+        messages = project.processes.research_experiment.messages
+        assert [m["type"] for m in messages[-2:]] == ["message", "phase_ready"]
+        assert messages[-2]["content"] == "Ready to proceed."
+        assert project.processes.research_experiment.state.refined_topic == "Stream Test"
+
+    def test_chat_stream_records_error(self, client, mock_token_manager):
+        """Test that an LLM failure mid-stream is recorded as an error message."""
+        project_id = client.post(
+            "/api/research/v3/create", json={"topic": "Stream Error Test"}
+        ).json()["project_id"]
+
+        async def achat(content):
+            yield "Partial"
+            raise RuntimeError("LLM unavailable")
+
+        agent = MagicMock(topic="Stream Error Test", is_ready_for_next_phase=False)
+        agent.achat = achat
+        research._discussion_agents[project_id] = agent
+
+        response = client.post(
+            f"/api/research/v3/{project_id}/process/research-experiment/chat/stream",
+            json={"content": "Hello"},
+        )
+
+        assert response.status_code == 200
+        assert "LLM unavailable" in response.text
+        messages = research.get_project_v3(project_id).processes.research_experiment.messages
+        assert messages[-1]["type"] == "error"
+
+
+class TestResearchDefinition:
+    """Tests for the research definition endpoint."""
+
+    def test_get_research_definition_extracts_from_agent(self, client):
+        """Test that a missing definition is extracted from the discussion agent."""
+        from backend.agents.research_discussion import NoveltyAssessment, ResearchDefinition
+
+        definition = ResearchDefinition(
+            refined_topic="Refined Topic",
+            research_questions=["RQ1"],
+            novelty_assessment=NoveltyAssessment(score=0.7, justification="New angle"),
+            research_scope={"inclusions": ["A"], "exclusions": []},
+            potential_contributions=["C1"],
+            suggested_keywords=["k1", "k2"],
+        )
+        agent = MagicMock()
+        agent.extract_research_definition = AsyncMock(return_value=definition)
+        research._projects["def-test"] = {"state": {}}
+        research._discussion_agents["def-test"] = agent
+
+        response = client.get("/api/research/def-test/research-definition")
+
+        assert response.status_code == 200
+        research_def = response.json()["research_definition"]
+        assert research_def["refined_topic"] == "Refined Topic"
+        assert research_def["novelty_assessment"]["score"] == 0.7
+        assert research._projects["def-test"]["state"]["research_definition"] == research_def
+
 
 class TestProcessAccessibility:
     """Tests for process accessibility based on unlock status."""
@@ -0,0 +1,67 @@
+"""Unit tests for the research discussion agent."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from langchain_core.messages import AIMessage
+
+from backend.agents.research_discussion import (
+    HISTORY_SUMMARY_MAX_CHARS,
+    ResearchDiscussionAgent,
+)
+
+
+@pytest.fixture
+def llm():
+    """Mock LLM that answers every request with a fixed reply."""
+    mock = MagicMock()
+    mock.ainvoke = AsyncMock(return_value=AIMessage(content="Summary of the research"))
+    return mock
+
+
+@pytest.fixture
+def agent(llm):
+    """Create an agent backed by the mock LLM."""
+    agent = ResearchDiscussionAgent(llm=llm)
+    agent.topic = "Test Topic"
+    return agent
+
+
+class TestResponseCache:
+    """Tests for reusing summary/evaluation/extraction replies."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_summary_is_cached(self, agent, llm):
+        """Test that asking for the same summary twice calls the LLM once."""
+        first = await agent._generate_summary()
+        second = await agent._generate_summary()
+
+        assert first == second == "Summary of the research"
+        assert llm.ainvoke.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_summary_after_discussion_turn_is_not_cached(self, agent, llm):
+        """Test that a discussion turn between summary requests invalidates the cache."""
+        await agent._generate_summary()
+        agent._record_turn("New idea", AIMessage(content="Interesting"))
+        await agent._generate_summary()
+
+        assert llm.ainvoke.await_count == 2
+
+
+class TestRollingSummary:
+    """Tests for folding old turns into the rolling summary."""
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_folds_turns_as_truncated_text(self, agent):
+        """Test that a failing summary model can't make evicted turns pile up."""
+        agent._summary_llm = MagicMock()
+        agent._summary_llm.generate = AsyncMock(side_effect=RuntimeError("quota exceeded"))
+
+        for i in range(agent.HISTORY_WINDOW * 4):
+            agent._append_turn(f"Question {i} " + "x" * 500, f"Answer {i}")
+            await agent._await_rolling_summary()
+
+        assert agent._summary_llm.generate.await_count > 1
+        assert agent._evicted == []
+        assert len(agent._rolling_summary) <= HISTORY_SUMMARY_MAX_CHARS
+        assert "Answer 14" in agent._rolling_summary
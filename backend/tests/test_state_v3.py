@@ -1,5 +1,6 @@
 """Unit tests for v3 state schema and project store."""
 
+import orjson
 import pytest
 from datetime import datetime
 
@@ -10,6 +11,8 @@ from backend.orchestrator.state import (
     ResearchExperimentState,
     LiteratureReviewProcess,
     LiteratureReviewState,
+    LiteratureOrganizationState,
+    LiteratureSearchState,
     PaperWritingProcess,
     PaperWritingState,
     ProcessStatus,
@@ -177,6 +180,33 @@ class TestPaperEntry:
         assert paper.source == PaperSource.UPLOAD
 
 
+class TestLiteratureOrganizationState:
+    """Tests for LiteratureOrganizationState paper IDs."""
+
+    def test_new_paper_id_not_reused_after_delete(self):
+        """Test that deleting a paper does not free its ID."""
+        state = LiteratureOrganizationState()
+        first = state.new_paper_id("paper")
+        state.papers.append(PaperEntry(id=first, type=PaperType.SEARCH))
+        second = state.new_paper_id("paper")
+        state.papers.append(PaperEntry(id=second, type=PaperType.SEARCH))
+
+        state.papers.pop()
+
+        assert (first, second) == ("paper_001", "paper_002")
+        assert state.new_paper_id("paper") == "paper_003"
+
+    def test_new_paper_id_skips_existing_ids(self):
+        """Test IDs for projects saved before the counter existed."""
+        state = LiteratureOrganizationState(papers=[
+            PaperEntry(id="paper_002", type=PaperType.SEARCH),
+            PaperEntry(id="paper_003", type=PaperType.SEARCH),
+        ])
+
+        assert state.new_paper_id("paper") == "paper_004"
+        assert state.next_paper_seq == 4
+
+
 class TestMigration:
     """Tests for legacy project migration."""
 
@@ -356,6 +386,82 @@ class TestSerialization:
         assert len(restored.processes.research_experiment.messages) == 1
 
 
+class TestLiteratureSearchState:
+    """Tests for LiteratureSearchState paper lookup."""
+
+    def test_find_paper_follows_list_changes(self):
+        """Test that lookups see papers added and removed after the first lookup."""
+        state = LiteratureSearchState(searched_papers=[
+            PaperEntry(id="search_001", type=PaperType.SEARCH),
+        ])
+        assert state.find_paper("search_001") is state.searched_papers[0]
+
+        state.searched_papers.append(PaperEntry(id="search_002", type=PaperType.SEARCH))
+        assert state.find_paper("search_002") is state.searched_papers[1]
+
+        state.searched_papers = []
+        assert state.find_paper("search_001") is None
+
+    def test_find_paper_after_remove_append_and_replace(self):
+        """Test that lookups aren't fooled by changes that keep the list length."""
+        state = LiteratureSearchState(searched_papers=[
+            PaperEntry(id="search_001", type=PaperType.SEARCH),
+            PaperEntry(id="search_002", type=PaperType.SEARCH),
+        ])
+        assert state.find_paper("search_002") is state.searched_papers[1]
+
+        state.searched_papers.remove(state.searched_papers[0])
+        state.searched_papers.append(PaperEntry(id="search_003", type=PaperType.SEARCH))
+        assert state.find_paper("search_001") is None
+        assert state.find_paper("search_002") is state.searched_papers[0]
+        assert state.find_paper("search_003") is state.searched_papers[1]
+
+        state.searched_papers[0] = PaperEntry(id="search_004", type=PaperType.SEARCH)
+        assert state.find_paper("search_002") is None
+        assert state.find_paper("search_004") is state.searched_papers[0]
+
+
+class TestFullTextStorage:
+    """Tests for keeping paper full text out of the project file."""
+
+    def test_full_text_moved_to_paper_folder(self, tmp_path, monkeypatch):
+        """Test that full_text in an older project file is moved to a text file on load."""
+        from backend.storage import paper_files, project_store
+        monkeypatch.setattr(paper_files, "PAPERS_BASE_DIR", tmp_path / "papers")
+        monkeypatch.setattr(project_store, "DATA_DIR", tmp_path / "projects")
+
+        data = project_to_dict(ProjectState(id="test-123", topic="Test Topic"))
+        data["processes"]["literature_organization"]["state"]["papers"] = [
+            {"id": "paper_001", "type": "search", "full_text": "x" * 500},
+        ]
+        project_store.save_project(data)
+
+        project = project_store.load_project("test-123")
+
+        paper = project.processes.literature_organization.state.papers[0]
+        assert paper.full_text_length == 500
+        assert paper_files.read_paper_full_text("test-123", "paper_001") == "x" * 500
+        saved = orjson.loads((tmp_path / "projects" / "test-123.json").read_bytes())
+        assert "full_text" not in saved["processes"]["literature_organization"]["state"]["papers"][0]
+
+    def test_full_text_kept_when_move_fails(self, tmp_path, monkeypatch):
+        """Test that full_text stays in the project file if the text file can't be written."""
+        from backend.storage import paper_files, project_store
+        monkeypatch.setattr(project_store, "DATA_DIR", tmp_path / "projects")
+        monkeypatch.setattr(paper_files, "save_paper_full_text", lambda *args: None)
+
+        data = project_to_dict(ProjectState(id="test-123", topic="Test Topic"))
+        data["processes"]["literature_organization"]["state"]["papers"] = [
+            {"id": "paper_001", "type": "search", "full_text": "x" * 500},
+        ]
+        project_store.save_project(data)
+
+        project_store.load_project("test-123")
+
+        saved = orjson.loads((tmp_path / "projects" / "test-123.json").read_bytes())
+        assert saved["processes"]["literature_organization"]["state"]["papers"][0]["full_text"] == "x" * 500
+
+
 class TestCreateProject:
     """Tests for project creation."""
 
@@ -1,15 +1,117 @@
 """PDF processing tool for downloading and parsing academic papers."""
 
+import asyncio
+import mmap
+import os
 import re
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import aiofiles
 import httpx
 import structlog
 from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
 
+# Chunk size used when streaming PDFs to disk
+PDF_STREAM_CHUNK_SIZE = 1 << 20
+
+# PDF downloads in flight at once (e.g. after adding many search results)
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# HTTP client and download limit shared by PDF downloads on each event loop,
+# so downloads from the same host (usually arxiv.org) reuse connections
+_download_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_download_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_download_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by PDF downloads on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _download_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=60.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        _download_clients[loop] = client
+    return client
+
+
+def _get_download_slots() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent PDF downloads on the running event loop."""
+    loop = asyncio.get_running_loop()
+    slots = _download_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        _download_slots[loop] = slots
+    return slots
+
+
+async def close_download_client() -> None:
+    """Close the shared PDF download client of the running event loop, if any."""
+    client = _download_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+# Cleanup passes applied to extracted PDF text, compiled once at import time
+_CLEAN_PATTERNS = [
+    (re.compile(r"\n{3,}"), "\n\n"),  # Excessive blank lines
+    (re.compile(r" {2,}"), " "),  # Repeated spaces
+    (re.compile(r"\n\d+\n"), "\n"),  # Standalone page numbers
+    (re.compile(r"Page \d+ of \d+"), ""),  # Page headers/footers
+    (re.compile(r"hps?://"), "https://"),  # Broken https
+    (re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]"), ""),  # Control characters
+]
+
+
+def clean_pdf_text(text: str) -> str:
+    """Clean and normalize extracted PDF text.
+
+    Args:
+        text: Raw text from PDF.
+
+    Returns:
+        Cleaned text.
+    """
+    for pattern, replacement in _CLEAN_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+@contextmanager
+def _open_mapped_pdf(fitz, filepath: Path) -> Iterator:
+    """Open a PDF from a read-only memory map instead of by path.
+
+    The mapped pages come straight from the kernel page cache, so repeated
+    opens of the same file (e.g. folder re-scans) avoid copying it into
+    Python memory.
+
+    Args:
+        fitz: Imported PyMuPDF module.
+        filepath: Path to PDF file.
+
+    Yields:
+        Open PyMuPDF document, closed (and the mapping released) on exit.
+    """
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            doc = fitz.open(stream=view, filetype="pdf")
+            try:
+                yield doc
+            finally:
+                doc.close()
+
 
 class PDFSection(BaseModel):
     """Represents a section of a PDF document."""
@@ -30,6 +132,7 @@ class ParsedPDF(BaseModel):
     sections: list[PDFSection] = Field(default_factory=list, description="Parsed sections")
     page_count: int = Field(default=0, description="Total page count")
     metadata: dict = Field(default_factory=dict, description="PDF metadata")
+    error: Optional[str] = Field(default=None, description="Parse error message, if any")
 
 
 class PDFProcessor:
@@ -55,14 +158,21 @@ class PDFProcessor:
         r"(?i)^(?:\d+\.?\s*)?appendix\s*$",
     ]
 
-    def __init__(self, storage_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_dir: Optional[Path] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize PDF processor.
 
         Args:
             storage_dir: Directory to store downloaded PDFs.
+            http_client: Client for PDF downloads. Defaults to the shared
+                client of the running event loop.
         """
         self.storage_dir = storage_dir or Path("./papers")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.http_client = http_client
 
     async def download_pdf(
         self,
@@ -88,31 +198,39 @@ class PDFProcessor:
 
         logger.info("Downloading PDF", url=url, path=str(filepath))
 
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
+        client = self.http_client or get_download_client()
+        async with _get_download_slots():
             try:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Check content type
-                content_type = response.headers.get("content-type", "")
-                if "pdf" not in content_type.lower() and not url.endswith(".pdf"):
-                    logger.warning("Response may not be a PDF", content_type=content_type)
-
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
-
-                logger.info("PDF downloaded", path=str(filepath), size=len(response.content))
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+
+                    # Check content type
+                    content_type = response.headers.get("content-type", "")
+                    if "pdf" not in content_type.lower() and not url.endswith(".pdf"):
+                        logger.warning("Response may not be a PDF", content_type=content_type)
+
+                    # Stream to disk so only one chunk is held in memory
+                    size = 0
+                    async with aiofiles.open(filepath, "wb") as f:
+                        async for chunk in response.aiter_bytes(PDF_STREAM_CHUNK_SIZE):
+                            await f.write(chunk)
+                            size += len(chunk)
+
+                logger.info("PDF downloaded", path=str(filepath), size=size)
                 return filepath
 
             except httpx.HTTPError as e:
                 logger.error("Failed to download PDF", url=url, error=str(e))
+                filepath.unlink(missing_ok=True)
                 return None
 
-    def parse_pdf(self, filepath: Path) -> ParsedPDF:
+    def parse_pdf(self, filepath: Path, clean: bool = False) -> ParsedPDF:
         """Parse PDF file and extract text and structure.
 
         Args:
             filepath: Path to PDF file.
+            clean: Normalize each page's text with `clean_pdf_text` while
+                extracting, so callers don't need a second full-text pass.
 
         Returns:
             ParsedPDF with extracted content.
@@ -121,27 +239,32 @@ class PDFProcessor:
             import fitz  # PyMuPDF
         except ImportError:
             logger.error("PyMuPDF not installed. Run: pip install pymupdf")
-            return ParsedPDF(full_text="Error: PyMuPDF not installed")
+            error = "Error: PyMuPDF not installed"
+            return ParsedPDF(full_text=error, error=error)
 
         logger.info("Parsing PDF", path=str(filepath))
 
-        try:
-            doc = fitz.open(filepath)
-        except Exception as e:
-            logger.error("Failed to open PDF", path=str(filepath), error=str(e))
-            return ParsedPDF(full_text=f"Error opening PDF: {str(e)}")
-
-        # Extract metadata
-        metadata = doc.metadata or {}
-
-        # Extract text from all pages
-        full_text = ""
-        page_texts = []
-
-        for page_num, page in enumerate(doc):
-            text = page.get_text()
-            page_texts.append(text)
-            full_text += text + "\n\n"
+        with ExitStack() as stack:
+            try:
+                doc = stack.enter_context(_open_mapped_pdf(fitz, filepath))
+            except Exception as e:
+                logger.error("Failed to open PDF", path=str(filepath), error=str(e))
+                error = f"Error opening PDF: {str(e)}"
+                return ParsedPDF(full_text=error, error=error)
+
+            # Extract metadata
+            metadata = doc.metadata or {}
+
+            # Extract text from all pages
+            full_text = ""
+            page_texts = []
+
+            for page_num, page in enumerate(doc):
+                text = page.get_text()
+                if clean:
+                    text = clean_pdf_text(text)
+                page_texts.append(text)
+                full_text += text + "\n\n"
 
         # Try to extract title (usually first large text on first page)
         title = metadata.get("title", "")
@@ -168,8 +291,6 @@ class PDFProcessor:
         # Parse sections
         sections = self._parse_sections(full_text, page_texts)
 
-        doc.close()
-
         logger.info(
             "PDF parsed",
             title=title[:50] if title else "Unknown",
@@ -187,6 +308,28 @@ class PDFProcessor:
             metadata=metadata,
         )
 
+    async def parse_pdf_async(self, filepath: Path, clean: bool = False) -> ParsedPDF:
+        """Parse a PDF in a worker process, keeping the event loop free.
+
+        Args:
+            filepath: Path to PDF file.
+            clean: Normalize text while extracting (see `parse_pdf`).
+
+        Returns:
+            ParsedPDF with extracted content.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                _get_parse_pool(), _parse_pdf_in_worker, self.storage_dir, filepath, clean
+            )
+        except BrokenProcessPool as e:
+            # A crashed parser takes the pool down; start a fresh one next time
+            shutdown_parse_pool()
+            logger.error("PDF parser process crashed", path=str(filepath), error=str(e))
+            error = f"Error parsing PDF: {str(e)}"
+            return ParsedPDF(full_text=error, error=error)
+
     def _extract_abstract(self, text: str) -> str:
         """Extract abstract from text.
 
@@ -303,6 +446,33 @@ class PDFProcessor:
         return references
 
 
+# Worker processes for PDF parsing (created on first use). PyMuPDF holds the
+# GIL while extracting text, so a thread would still stall the event loop.
+PDF_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get or create the PDF parsing process pool."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=PDF_PARSE_WORKERS)
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the PDF parsing process pool, if it was started."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def _parse_pdf_in_worker(storage_dir: Path, filepath: Path, clean: bool) -> ParsedPDF:
+    """Parse a PDF inside a pool worker process."""
+    return PDFProcessor(storage_dir).parse_pdf(filepath, clean=clean)
+
+
 class MarkdownFormatter:
     """Format parsed PDF content as Markdown."""
 
@@ -16,6 +16,8 @@ Directory Structure:
 - data/prompts/PW/  (Paper Writing - future)
 """
 
+import mmap
+import os
 from pathlib import Path
 from typing import Optional
 import structlog
@@ -27,9 +29,13 @@ PROMPTS_BASE_DIR = Path(__file__).parent.parent.parent / "data" / "prompts"
 
 
 class PromptLoader:
-    """Loads and caches prompts from markdown files."""
+    """Loads and caches prompts from markdown files.
 
-    _cache: dict[str, str] = {}
+    Cache entries are tagged with the file's mtime, so a cached prompt is
+    reused until the file on disk changes.
+    """
+
+    _cache: dict[str, tuple[int, str]] = {}
 
     @classmethod
     def _get_prompt_path(cls, category: str, prompt_name: str) -> Path:
@@ -57,28 +63,30 @@ class PromptLoader:
             Prompt content or None if file not found.
         """
         cache_key = f"{category}/{prompt_name}"
+        prompt_path = cls._get_prompt_path(category, prompt_name)
 
-        # Check cache
-        if use_cache and cache_key in cls._cache:
-            return cls._cache[cache_key]
+        try:
+            mtime_ns = os.stat(prompt_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(
+                "Prompt file not found",
+                category=category,
+                prompt=prompt_name,
+                path=str(prompt_path),
+            )
+            return None
 
-        # Load from file
-        prompt_path = cls._get_prompt_path(category, prompt_name)
+        # Check cache (only valid while the file is unchanged)
+        cached = cls._cache.get(cache_key) if use_cache else None
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
+        # Load from file
         try:
-            if prompt_path.exists():
-                content = prompt_path.read_text(encoding="utf-8")
-                cls._cache[cache_key] = content
-                logger.debug("Loaded prompt", category=category, prompt=prompt_name)
-                return content
-            else:
-                logger.warning(
-                    "Prompt file not found",
-                    category=category,
-                    prompt=prompt_name,
-                    path=str(prompt_path),
-                )
-                return None
+            content = cls._read_file(prompt_path)
+            cls._cache[cache_key] = (mtime_ns, content)
+            logger.debug("Loaded prompt", category=category, prompt=prompt_name)
+            return content
         except Exception as e:
             logger.error(
                 "Failed to load prompt",
@@ -88,6 +96,23 @@ class PromptLoader:
             )
             return None
 
+    @staticmethod
+    def _read_file(path: Path) -> str:
+        """Read a prompt file through a read-only memory map.
+
+        Args:
+            path: Path to the prompt file.
+
+        Returns:
+            Decoded file content.
+        """
+        with open(path, "rb") as f:
+            # mmap cannot map empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:].decode("utf-8")
+
     @classmethod
     def load_or_default(cls, category: str, prompt_name: str, default: str) -> str:
         """Load a prompt from file, or return default if not found.
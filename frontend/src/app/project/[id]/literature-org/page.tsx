@@ -44,7 +44,7 @@ function PaperCard({
   };
 
   const statusConfig = getStatusConfig(paper.status);
-  const hasFullText = paper.full_text && paper.full_text.length > 100;
+  const hasFullText = paper.full_text_length > 100;
 
   return (
     <div
@@ -613,7 +613,7 @@ export default function LiteratureOrganizationPage() {
                 ) : selectedPaper.status === 'pending' && (
                   <>
                     {/* Full text indicator */}
-                    {selectedPaper.full_text && selectedPaper.full_text.length > 100 && (
+                    {selectedPaper.full_text_length > 100 && (
                       <div className="mb-4 p-3 bg-emerald-50 dark:bg-emerald-900/20 border border-emerald-200 dark:border-emerald-700 rounded-lg flex items-center gap-2">
                         <svg className="w-5 h-5 text-emerald-600 dark:text-emerald-400" fill="none" viewBox="0 0 24 24" stroke="currentColor">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z" />
@@ -623,7 +623,7 @@ export default function LiteratureOrganizationPage() {
                             논문 전문이 포함되어 있습니다
                           </p>
                           <p className="text-xs text-emerald-600 dark:text-emerald-400">
-                            {(selectedPaper.full_text.length / 1000).toFixed(1)}KB의 텍스트가 요약에 사용됩니다
+                            {(selectedPaper.full_text_length / 1000).toFixed(1)}KB의 텍스트가 요약에 사용됩니다
                           </p>
                         </div>
                       </div>